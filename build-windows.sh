@@ -27,6 +27,14 @@ fi
 echo "📦 Instalando dependências..."
 wine pip install pygame pyinstaller
 
+# Gera pacote de assets pré-processado
+echo "📦 Gerando pacote de assets..."
+wine python -m game.asset_pack
+
+# Compila os níveis JSON para o formato binário
+echo "🗺️ Compilando níveis..."
+wine python -m game.level_compiler
+
 # Compila o executável
 echo "🔨 Compilando executável Windows..."
 wine pyinstaller super_hero.spec
@@ -21,6 +21,14 @@ echo "🧹 Limpando builds anteriores..."
 rm -rf build/
 rm -rf dist/
 
+# Gerar pacote de assets pré-processado
+echo "📦 Gerando pacote de assets..."
+python -m game.asset_pack
+
+# Compilar níveis JSON para o formato binário
+echo "🗺️ Compilando níveis..."
+python -m game.level_compiler
+
 # Compilar o jogo
 echo "🔨 Compilando o jogo..."
 pyinstaller super_hero.spec
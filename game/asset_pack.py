@@ -0,0 +1,164 @@
+# Pacote de assets pré-processados (cook offline + carregamento via mmap)
+#
+# Uso offline:  python -m game.asset_pack
+# Gera ASSET_PACK com todas as imagens já redimensionadas, em pixels crus,
+# para que o jogo não precise decodificar PNG/JPEG nem redimensionar ao iniciar.
+import mmap
+import os
+import struct
+import sys
+import pygame
+from game.settings import *
+
+PACK_MAGIC = b'SHPK'
+PACK_VERSION = 2
+
+# Cabeçalho: magic, versão, número de entradas
+HEADER = struct.Struct('<4sHI')
+# Entrada do índice: tamanho da chave, largura, altura, formato, offset, tamanho dos dados,
+# tamanho do caminho do arquivo de origem, mtime (ns) e tamanho da origem no cook
+ENTRY = struct.Struct('<HHHBQIHqQ')
+
+FORMATS = {0: 'RGB', 1: 'RGBA'}
+FORMAT_CODES = {name: code for code, name in FORMATS.items()}
+
+_tobytes = getattr(pygame.image, 'tobytes', None) or pygame.image.tostring
+
+def pack_key(key):
+    """Converte uma chave do AssetCache na chave textual usada no pacote"""
+    return repr(key)
+
+def asset_source(key):
+    """Arquivo de origem de uma chave do AssetCache (None para texturas procedurais)"""
+    if isinstance(key, tuple) and len(key) > 1 and isinstance(key[1], str) and os.path.isfile(key[1]):
+        return key[1]
+    return None
+
+def source_stamp(source):
+    """(mtime em ns, tamanho) do arquivo de origem; (0, 0) se não houver"""
+    if source is None or not os.path.exists(source):
+        return 0, 0
+    stat = os.stat(source)
+    return stat.st_mtime_ns, stat.st_size
+
+def write_pack(path, surfaces):
+    """Grava um pacote com as superfícies dadas ({chave: Surface})"""
+    index = []
+    blobs = []
+    for key, surface in surfaces.items():
+        fmt = 'RGBA' if surface.get_flags() & pygame.SRCALPHA else 'RGB'
+        data = _tobytes(surface, fmt)
+        source = asset_source(key)
+        index.append((pack_key(key).encode('utf-8'), surface.get_size(), FORMAT_CODES[fmt], data,
+                      (source or '').encode('utf-8'), source_stamp(source)))
+        blobs.append(data)
+
+    # Calcula onde os dados começam (logo após o índice)
+    offset = HEADER.size + sum(ENTRY.size + len(name) + len(source) for name, _, _, _, source, _ in index)
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(PACK_MAGIC, PACK_VERSION, len(index)))
+        for name, (width, height), fmt_code, data, source, (mtime, size) in index:
+            f.write(ENTRY.pack(len(name), width, height, fmt_code, offset, len(data),
+                               len(source), mtime, size))
+            f.write(name)
+            f.write(source)
+            offset += len(data)
+        for data in blobs:
+            f.write(data)
+
+class AssetPack:
+    """Leitor de pacote de assets mapeado em memória.
+
+    Entradas cujo arquivo de origem mudou desde o cook (mais novo ou de
+    outro tamanho) são descartadas ao abrir o pacote e ficam em stale:
+    essas imagens voltam a ser carregadas do arquivo.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        self.entries = {}
+        self.stale = []
+        # Executável empacotado: pacote e imagens vêm do mesmo build, e a
+        # extração não preserva as datas dos arquivos
+        self.check_sources = not getattr(sys, 'frozen', False)
+        self._read_index()
+
+    def _read_index(self):
+        magic, version, count = HEADER.unpack_from(self._map, 0)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise ValueError(f"Pacote de assets inválido ou de versão diferente: {self.path}")
+
+        stamps = {}
+        pos = HEADER.size
+        for _ in range(count):
+            (name_len, width, height, fmt_code, offset, size,
+             source_len, mtime, source_size) = ENTRY.unpack_from(self._map, pos)
+            pos += ENTRY.size
+            name = bytes(self._map[pos:pos + name_len]).decode('utf-8')
+            pos += name_len
+            source = bytes(self._map[pos:pos + source_len]).decode('utf-8')
+            pos += source_len
+
+            # Origem alterada depois do cook: a imagem do pacote está velha
+            if source and self.check_sources:
+                if source not in stamps:
+                    stamps[source] = source_stamp(source)
+                current_mtime, current_size = stamps[source]
+                if current_size and (current_mtime > mtime or current_size != source_size):
+                    self.stale.append(name)
+                    continue
+            self.entries[name] = ((width, height), FORMATS[fmt_code], offset, size)
+
+    def __contains__(self, key):
+        return pack_key(key) in self.entries
+
+    def surface(self, key):
+        """Cria a superfície direto do buffer mapeado, já no formato de tela se houver display"""
+        size, fmt, offset, length = self.entries[pack_key(key)]
+        surface = pygame.image.frombuffer(self._view[offset:offset + length], size, fmt)
+
+        # Converte para o formato da tela (cópia simples, sem decodificação)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha() if fmt == 'RGBA' else surface.convert()
+        return surface
+
+    def close(self):
+        """Libera o mapeamento (superfícies não convertidas deixam de ser válidas)"""
+        self._view.release()
+        self._map.close()
+        self._file.close()
+
+def cook(path=ASSET_PACK):
+    """Carrega todos os assets do jogo pelo caminho normal e grava o pacote"""
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+    # Importações tardias: o runtime importa este módulo a partir de game.utils
+    from game.utils import asset_cache
+    from game.coin import Coin, PowerUpCoin, BonusCoin
+    from game.enemy import Enemy
+    from game.player import Player
+    from game.background import load_parallax_background
+    from game.spatial import SpatialGroup
+
+    # Instancia uma entidade de cada tipo para popular o cache com todas as variantes
+    platforms = SpatialGroup()
+    Coin(0, 0)
+    PowerUpCoin(0, 0)
+    BonusCoin(0, 0)
+    Enemy(0, 0, platforms)
+    Player(0, 0, platforms)
+    load_parallax_background()
+
+    surfaces = {key: asset for key, asset in asset_cache.items() if isinstance(asset, pygame.Surface)}
+    write_pack(path, surfaces)
+    print(f"📦 Pacote de assets gerado: {path} ({len(surfaces)} imagens, {os.path.getsize(path) // 1024} KB)")
+
+if __name__ == '__main__':
+    cook()
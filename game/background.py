@@ -0,0 +1,139 @@
+# Fundo com parallax dividido em pedaços (chunks) carregados conforme a câmera
+import pygame
+from game.settings import *
+from game.utils import load_image, draw_gradient_rect, asset_cache
+
+def background_tile_key(path):
+    """Chave do ladrilho de fundo no cache/pacote de assets"""
+    return ('background', path, (WORLD_WIDTH, WORLD_HEIGHT), None, 'tile')
+
+def create_background_tile(path):
+    """Redimensiona a imagem para caber no mundo sem esticar.
+
+    O fundo do mundo é esse ladrilho repetido; guardar só ele evita manter
+    uma superfície do tamanho do mundo inteiro em memória.
+    """
+    try:
+        # Carrega a imagem original
+        original_bg = load_image(path)
+        original_width = original_bg.get_width()
+        original_height = original_bg.get_height()
+
+        print(f"📸 Imagem de fundo original: {original_width}x{original_height}px")
+
+        # Calcula escala mantendo proporção
+        scale_x = WORLD_WIDTH / original_width
+        scale_y = WORLD_HEIGHT / original_height
+        scale = min(scale_x, scale_y)  # Usa menor escala para não esticar
+
+        # Redimensiona mantendo proporção
+        new_width = int(original_width * scale)
+        new_height = int(original_height * scale)
+        tile = pygame.transform.scale(original_bg, (new_width, new_height))
+
+        print(f"📸 Imagem redimensionada: {new_width}x{new_height}px (escala: {scale:.2f})")
+        print("✅ Fundo carregado com sucesso!")
+        return tile
+
+    except Exception as e:
+        print(f"⚠️ Erro ao carregar fundo: {e}")
+        # Gradiente vertical: uma faixa estreita repetida equivale ao mundo inteiro
+        tile = pygame.Surface((64, WORLD_HEIGHT))
+        draw_gradient_rect(tile, tile.get_rect(), SKY_BLUE, (135, 206, 250))
+        print("🎨 Usando fundo gradiente como fallback")
+        return tile
+
+class ParallaxLayer:
+    """Camada de fundo com parallax, fatiada em chunks de largura fixa.
+
+    O conteúdo da camada é o ladrilho repetido numa faixa de largura width,
+    que se repete com o deslocamento da câmera. Só os chunks visíveis no
+    último frame ficam em memória; os demais são descartados e recriados
+    a partir do ladrilho quando voltam à tela.
+    """
+
+    def __init__(self, tile, factor, width=WORLD_WIDTH, height=WORLD_HEIGHT,
+                 chunk_width=BACKGROUND_CHUNK_WIDTH, fill_color=SKY_BLUE, y=0):
+        self.tile = tile
+        self.factor = factor
+        self.width = width
+        self.height = height
+        self.chunk_width = chunk_width
+        self.fill_color = fill_color
+        self.y = y
+        self.chunk_count = (width + chunk_width - 1) // chunk_width
+
+        # Chunks residentes e estatísticas
+        self.chunks = {}
+        self.chunks_built = 0
+
+    def build_chunk(self, index):
+        """Monta o chunk a partir do ladrilho (céu + repetições da imagem)"""
+        x0 = index * self.chunk_width
+        width = min(self.chunk_width, self.width - x0)
+
+        if self.fill_color is None:
+            chunk = pygame.Surface((width, self.height), pygame.SRCALPHA)
+        else:
+            chunk = pygame.Surface((width, self.height))
+            chunk.fill(self.fill_color)
+
+        # Repete a imagem horizontalmente e verticalmente dentro da faixa do chunk
+        tile_width, tile_height = self.tile.get_size()
+        for tile_x in range((x0 // tile_width) * tile_width, x0 + width, tile_width):
+            # Não ultrapassa a largura da camada (a última repetição é cortada)
+            visible = min(tile_width, self.width - tile_x)
+            for tile_y in range(0, self.height, tile_height):
+                chunk.blit(self.tile, (tile_x - x0, tile_y), pygame.Rect(0, 0, visible, tile_height))
+
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert_alpha() if self.fill_color is None else chunk.convert()
+
+        self.chunks_built += 1
+        return chunk
+
+    def draw(self, surface, camera_x):
+        """Desenha só os chunks que caem na janela da tela"""
+        offset = -(camera_x * self.factor) % self.width
+        screen_width = surface.get_width()
+
+        used = set()
+        # Posições truncadas como o blit do pygame faz com coordenadas float
+        for start in (int(offset - self.width), int(offset), int(offset + self.width)):
+            first = max(0, -start // self.chunk_width)
+            last = min(self.chunk_count - 1, (screen_width - 1 - start) // self.chunk_width)
+            for index in range(first, last + 1):
+                chunk = self.chunks.get(index)
+                if chunk is None:
+                    chunk = self.chunks[index] = self.build_chunk(index)
+                surface.blit(chunk, (start + index * self.chunk_width, self.y))
+                used.add(index)
+
+        # Libera chunks que saíram da tela
+        if len(self.chunks) > len(used):
+            for index in [index for index in self.chunks if index not in used]:
+                del self.chunks[index]
+
+class ParallaxBackground:
+    """Conjunto de camadas de parallax desenhadas de trás para frente"""
+
+    def __init__(self, layers):
+        self.layers = layers
+
+    def draw(self, surface, camera_x):
+        for layer in self.layers:
+            layer.draw(surface, camera_x)
+
+    def stats(self):
+        """Chunks em memória e chunks já montados por camada"""
+        return [{'factor': layer.factor, 'resident': len(layer.chunks), 'built': layer.chunks_built}
+                for layer in self.layers]
+
+def load_parallax_background(layers=BACKGROUND_LAYERS):
+    """Cria o fundo a partir de [(caminho, fator de parallax), ...]; a primeira camada é opaca"""
+    parallax_layers = []
+    for i, (path, factor) in enumerate(layers):
+        tile = asset_cache.get(background_tile_key(path), lambda: create_background_tile(path))
+        fill_color = SKY_BLUE if i == 0 else None
+        parallax_layers.append(ParallaxLayer(tile, factor, fill_color=fill_color))
+    return ParallaxBackground(parallax_layers)
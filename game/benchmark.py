@@ -0,0 +1,356 @@
+# Benchmarks: níveis sintéticos em várias escalas e tempo de cada caminho quente
+#
+# Uso:  python -m game.benchmark                                (escalas de BENCHMARK_SCALES)
+#       python -m game.benchmark --scales 100 1000 --frames 300
+#       python -m game.benchmark --save-baseline                (grava a referência)
+#       python -m game.benchmark --replay partida.rec           (entrada de uma gravação)
+# Para cada escala gera um nível compilado com N plataformas, N moedas e N
+# inimigos e mede, no modo headless: carregamento de assets, create_level,
+# update_game, check_collisions, draw_game, draw_hud e a troca de nível.
+# Os resultados (FPS, tempos p50/p95/p99, alocações) vão para um JSON e são
+# comparados com a referência; regressões acima de BENCHMARK_TOLERANCE
+# terminam com código 1 (útil em CI).
+import argparse
+import json
+import math
+import os
+import platform as python_platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import pygame
+from game.settings import *
+from game.utils import asset_cache, mask_cache
+from game.spatial import SpatialGroup
+from game.player import Player
+from game.world_streaming import platform_spec, coin_spec, enemy_spec, create_entity
+from game.level_format import LevelData, PLATFORM_TYPES, COIN_TYPES, write_level
+from game.level_compiler import compile_level
+from game.game_manager import GameManager
+from game.replay import InputReplay, read_recording
+from game.headless import PatternControls, run_input
+
+BENCHMARK_FORMAT = 'super-hero-benchmark'
+BENCHMARK_VERSION = 1
+
+# Métodos do GameManager cronometrados a cada chamada (draw_hud é chamado por draw_game)
+PHASES = ('update_game', 'check_collisions', 'draw_game', 'draw_hud')
+
+# Frames iniciais descartados (caches e primeiro streaming) e frames com tracemalloc
+WARMUP_FRAMES = 30
+ALLOCATION_FRAMES = 120
+
+# Diferenças absolutas abaixo disso (ms ou KB) são ruído, não regressão
+NOISE_FLOOR = 0.1
+
+# Carregamento de assets: mediana de várias cargas a frio (uma só varia
+# mais que BENCHMARK_TOLERANCE com o cache de disco do sistema) e piso de
+# ruído próprio, em ms
+ASSET_LOAD_REPEATS = 5
+ASSET_NOISE_FLOOR = 20.0
+
+# FPS: mediana do FPS de FPS_BLOCKS blocos de frames seguidos (picos isolados,
+# como uma coleta de lixo, não puxam a média da execução inteira) e piso de
+# ruído próprio, em FPS
+FPS_BLOCKS = 5
+FPS_NOISE_FLOOR = 5.0
+
+def synthetic_level(count, seed=0):
+    """Nível com count plataformas, count moedas e count inimigos (compilado).
+
+    As plataformas formam uma grade que cresce em largura e em altura com
+    a escala, então a densidade na tela também aumenta: a 10k há centenas
+    de entidades carregadas em volta da câmera, não só um mundo mais longo.
+    """
+    generator = random.Random(seed)
+    columns = max(10, math.ceil(math.sqrt(count) * 4))
+    rows = math.ceil(count / columns)
+    spacing = 120
+    row_height = 350 / rows
+    width = 200 + columns * spacing + 400
+
+    entities = []
+    # Chão contínuo para o jogador andar pelo nível inteiro
+    for x in range(0, width, 400):
+        entities.append(platform_spec(x, 650, 400, 70, 'grass'))
+
+    for i in range(count):
+        column, row = i % columns, i // columns
+        x = 200 + column * spacing + generator.randint(0, 20)
+        y = int(250 + row * row_height) + generator.randint(0, 10)
+        platform_type = PLATFORM_TYPES[i % len(PLATFORM_TYPES)]
+        if i % 10 == 9:
+            spec = platform_spec(x, y, 100, 20, platform_type, end=(x + 80, y), speed=2)
+        elif i % 17 == 16:
+            spec = platform_spec(x, y, 100, 20, platform_type, disappearing=True)
+        else:
+            spec = platform_spec(x, y, 100, 20, platform_type)
+        entities.append(spec)
+        coin_type = 'special' if i % 20 == 19 else 'bonus' if i % 10 == 9 else 'normal'
+        entities.append(coin_spec(x + 30, y - 40, coin_type))
+        entities.append(enemy_spec(x + 10, y - ENEMY_HEIGHT))
+
+    level = LevelData(f'Sintético {count}', (100, 520), width - 200, entities)
+    return compile_level(level)
+
+def write_synthetic_levels(directory, count):
+    """Grava level_1.lvl e level_2.lvl sintéticos (o segundo mede a troca de nível)"""
+    for number in (1, 2):
+        write_level(os.path.join(directory, f'level_{number}.lvl'), synthetic_level(count, seed=number))
+
+def summarize(samples):
+    """Estatísticas de uma lista de durações em segundos (ms no resultado)"""
+    if not samples:
+        return {'count': 0}
+    ordered = sorted(samples)
+
+    def percentile(p):
+        # Nearest-rank
+        return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)] * 1000
+
+    return {
+        'count': len(ordered),
+        'mean_ms': sum(ordered) / len(ordered) * 1000,
+        'p50_ms': percentile(50),
+        'p95_ms': percentile(95),
+        'p99_ms': percentile(99),
+        'max_ms': ordered[-1] * 1000,
+    }
+
+def instrument(game, name, samples):
+    """Substitui game.name por uma versão que acrescenta a duração de cada chamada a samples"""
+    method = getattr(game, name)
+
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            samples.append(time.perf_counter() - start)
+
+    setattr(game, name, timed)
+
+def block_fps(samples, blocks=FPS_BLOCKS):
+    """Mediana do FPS de blocos de frames seguidos (durações em segundos)"""
+    size = max(1, len(samples) // blocks)
+    rates = [len(block) / sum(block) for block in
+             (samples[start:start + size] for start in range(0, len(samples), size)) if sum(block)]
+    return statistics.median(rates) if rates else 0.0
+
+def load_assets(game):
+    """Carrega do zero (caches vazios) o fundo, os sons e as texturas de cada tipo de entidade"""
+    asset_cache.clear()
+    mask_cache.clear()
+    start = time.perf_counter()
+    game.load_background()
+    game.load_sounds()
+    group = SpatialGroup()
+    specs = ([platform_spec(0, 0, 100, 20, platform_type) for platform_type in PLATFORM_TYPES] +
+             [coin_spec(0, 0, coin_type) for coin_type in COIN_TYPES] + [enemy_spec(0, 0)])
+    for spec in specs:
+        create_entity(spec, group)
+    Player(0, 0, group)
+    return (time.perf_counter() - start) * 1000
+
+def frame(game):
+    """Um frame do jogo, como em run(), mas desenhando mesmo no modo headless"""
+    if game.game_state != GAME_PLAYING:
+        game.start_game(1)
+        return False
+    game.update()
+    game.draw_frame()
+    return True
+
+def run_scale(count, frames, controls, seed=0):
+    """Mede um nível sintético de count entidades por tipo; retorna o resultado da escala"""
+    with tempfile.TemporaryDirectory(prefix='super-hero-bench-') as directory:
+        write_synthetic_levels(directory, count)
+        game = GameManager(headless=True, controls=controls, seed=seed, levels_path=directory)
+        result = {'assets_ms': statistics.median(load_assets(game) for _ in range(ASSET_LOAD_REPEATS))}
+
+        start = time.perf_counter()
+        game.start_game(1)
+        result['create_level_ms'] = (time.perf_counter() - start) * 1000
+        result['entities'] = len(game.world.entities)
+        result['chunks'] = game.world.stats()['chunks']
+
+        for _ in range(WARMUP_FRAMES):
+            frame(game)
+
+        # Tempos: o frame inteiro e cada fase instrumentada
+        samples = {name: [] for name in PHASES}
+        for name in PHASES:
+            instrument(game, name, samples[name])
+        frame_samples = []
+        restarts = 0
+        for _ in range(frames):
+            start = time.perf_counter()
+            if frame(game):
+                frame_samples.append(time.perf_counter() - start)
+            else:
+                restarts += 1
+        result['restarts'] = restarts
+        result['fps'] = block_fps(frame_samples)
+        result['frame'] = summarize(frame_samples)
+        for name in PHASES:
+            result[name] = summarize(samples[name])
+
+        # Alocações: pico por frame (memória temporária) e crescimento líquido
+        peaks = []
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        for _ in range(min(frames, ALLOCATION_FRAMES)):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            if frame(game):
+                peaks.append(tracemalloc.get_traced_memory()[1] - before)
+        net = tracemalloc.get_traced_memory()[0] - base
+        tracemalloc.stop()
+        peaks.sort()
+        result['alloc'] = {
+            'frame_peak_kb_p50': peaks[len(peaks) // 2] / 1024 if peaks else 0.0,
+            'frame_peak_kb_max': peaks[-1] / 1024 if peaks else 0.0,
+            'net_kb': net / 1024,
+        }
+
+        # Troca de nível (o próximo foi pré-carregado durante os frames acima)
+        result['transition_ms'] = None
+        if game.game_state == GAME_PLAYING and game.level < game.max_level:
+            game.next_level()
+            result['transition_ms'] = game.transition_ms
+        pygame.quit()
+    return result
+
+def run_benchmarks(scales=BENCHMARK_SCALES, frames=BENCHMARK_FRAMES, recording=None, seed=0):
+    """Executa todas as escalas; retorna o dicionário de resultados (formato do JSON)"""
+    results = {
+        'format': BENCHMARK_FORMAT,
+        'version': BENCHMARK_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': python_platform.python_version(),
+        'pygame': pygame.version.ver,
+        'machine': python_platform.machine(),
+        'enemy_backend': ENEMY_BACKEND,
+        'frames': frames,
+        'scales': {},
+    }
+    for count in scales:
+        print(f"⏱️ Escala {count}: {count} plataformas, {count} moedas, {count} inimigos")
+        if recording:
+            controls = InputReplay(recording.ticks)
+            seed = recording.seed
+        else:
+            controls = PatternControls(run_input)
+        results['scales'][str(count)] = run_scale(count, frames, controls, seed)
+    return results
+
+# Métricas comparadas com a referência:
+# (caminho no resultado da escala, maior é melhor, piso de ruído)
+TRACKED_METRICS = (
+    (('fps',), True, FPS_NOISE_FLOOR),
+    (('assets_ms',), False, ASSET_NOISE_FLOOR),
+    (('create_level_ms',), False, NOISE_FLOOR),
+    (('transition_ms',), False, NOISE_FLOOR),
+    (('alloc', 'frame_peak_kb_p50'), False, NOISE_FLOOR),
+) + tuple(((phase, percentile), False, NOISE_FLOOR) for phase in ('frame',) + PHASES
+          for percentile in ('p50_ms', 'p95_ms'))
+
+def metric(result, path):
+    for key in path:
+        if not isinstance(result, dict):
+            return None
+        result = result.get(key)
+    return result
+
+def compare(results, baseline, tolerance=BENCHMARK_TOLERANCE):
+    """Comparações com a referência: lista de (escala, métrica, referência, atual, variação, regressão)"""
+    rows = []
+    for scale, result in results['scales'].items():
+        reference = baseline.get('scales', {}).get(scale)
+        if reference is None:
+            continue
+        for path, higher_is_better, noise_floor in TRACKED_METRICS:
+            old, new = metric(reference, path), metric(result, path)
+            if old is None or new is None or old == 0:
+                continue
+            change = (new - old) / old
+            if higher_is_better:
+                regression = change < -tolerance and old - new > noise_floor
+            else:
+                regression = change > tolerance and new - old > noise_floor
+            rows.append((scale, '.'.join(path), old, new, change, regression))
+    return rows
+
+def print_results(results):
+    for scale, result in results['scales'].items():
+        frame_stats = result['frame']
+        print(f"📊 Escala {scale} ({result['entities']} entidades, {result['chunks']} chunks): "
+              f"{result['fps']:.0f} FPS, frame p50 {frame_stats.get('p50_ms', 0):.2f} ms, "
+              f"p95 {frame_stats.get('p95_ms', 0):.2f} ms, p99 {frame_stats.get('p99_ms', 0):.2f} ms")
+        transition = result['transition_ms']
+        print(f"   assets {result['assets_ms']:.1f} ms, create_level {result['create_level_ms']:.1f} ms, "
+              f"troca de nível {'-' if transition is None else f'{transition:.1f} ms'}, "
+              f"{result['restarts']} reinícios")
+        for name in PHASES:
+            stats = result[name]
+            if stats['count']:
+                print(f"   {name:<17} p50 {stats['p50_ms']:.3f} ms  p95 {stats['p95_ms']:.3f} ms  "
+                      f"p99 {stats['p99_ms']:.3f} ms")
+        alloc = result['alloc']
+        print(f"   alocações por frame: p50 {alloc['frame_peak_kb_p50']:.1f} KB, "
+              f"máx {alloc['frame_peak_kb_max']:.1f} KB, líquido {alloc['net_kb']:+.1f} KB")
+
+def write_results(path, results):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmarks do Super Hero')
+    parser.add_argument('--scales', type=int, nargs='+', default=list(BENCHMARK_SCALES),
+                        help='entidades de cada tipo por nível sintético')
+    parser.add_argument('--frames', type=int, default=BENCHMARK_FRAMES, help='frames medidos por escala')
+    parser.add_argument('--seed', type=int, default=0, help='semente dos fluxos aleatórios')
+    parser.add_argument('--replay', metavar='ARQUIVO', help='entrada de uma partida gravada')
+    parser.add_argument('--output', default='benchmarks/results.json', help='arquivo JSON dos resultados')
+    parser.add_argument('--baseline', default=BENCHMARK_BASELINE, help='resultados de referência')
+    parser.add_argument('--save-baseline', action='store_true', help='grava os resultados como referência')
+    parser.add_argument('--tolerance', type=float, default=BENCHMARK_TOLERANCE,
+                        help='piora relativa tolerada (0.15 = 15%%)')
+    args = parser.parse_args(argv)
+
+    recording = read_recording(args.replay) if args.replay else None
+    results = run_benchmarks(args.scales, args.frames, recording, args.seed)
+    print_results(results)
+    write_results(args.output, results)
+    print(f"💾 Resultados em {args.output}")
+
+    if args.save_baseline:
+        write_results(args.baseline, results)
+        print(f"📌 Referência gravada em {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"ℹ️ Sem referência em {args.baseline} (use --save-baseline)")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline, args.tolerance)
+    regressions = [row for row in rows if row[5]]
+    for scale, name, old, new, change, regression in rows:
+        if regression or abs(change) > args.tolerance:
+            print(f"{'🔴' if regression else '🟢'} escala {scale} {name}: {old:.3f} -> {new:.3f} ({change:+.0%})")
+    if regressions:
+        print(f"❌ {len(regressions)} regressões acima de {args.tolerance:.0%}")
+        return 1
+    print(f"✅ Sem regressões ({len(rows)} métricas comparadas)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
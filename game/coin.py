@@ -1,36 +1,56 @@
 import pygame
 import math
 from game.settings import *
-from game.utils import load_image
+from game.utils import asset_cache, mask_cache
 
 class Coin(pygame.sprite.Sprite):
     """Classe das moedas coletáveis"""
     
+    # Ciclo de animação: rotação de 2° por frame exibida a cada 10°, com a
+    # pulsação de escala nos primeiros frames do ciclo (3 segundos a 60 FPS)
+    FRAME_CYCLE = 180
+    ROTATION_STEP = 2
+    ROTATION_SNAP = 10
+    SCALE_FRAMES = 5
+    SCALE_FACTOR = 1.2
+    # Brilho com período que fecha o ciclo (6 meias-ondas de |sin|)
+    PULSE_FREQUENCY = 6 * math.pi / FRAME_CYCLE
+    COLLECT_FRAMES = 25
+    
+    # Variante da imagem base no cache (None = imagem original)
+    variant = None
+    
+    # Frames da tabela são trocados, nunca alterados (ver DirtyRectTracker)
+    dirty_tracking = True
+    
+    # Flutua a cada frame: reposicionada no índice espacial (ver SpatialGroup)
+    moves = True
+    
+    # Saiu do jogo de vez (coletada ou expirada), ver WorldStreamer.collect_consumed
+    consumed = False
+    
     def __init__(self, x, y, value=COIN_VALUE):
         super().__init__()
         
         # Carregamento das imagens com tamanho correto
         self.load_images()
         
+        # Tabela de frames pré-calculada (compartilhada por todas as moedas da variante)
+        self.frames = self.frame_table('pulse')
+        self.frame_index = 0
+        
         # Configurações iniciais
         self.image = self.images[0]
         self.rect = self.image.get_rect(topleft=(x, y))
-        self.mask = pygame.mask.from_surface(self.image)
         
         # Valor da moeda
         self.value = value
         
-        # Animação
-        self.animation_frame = 0
-        self.animation_timer = 0
-        self.animation_speed = COIN_ANIMATION_SPEED
-        
         # Efeitos visuais melhorados
         self.float_offset = 0
         self.float_speed = 0.05
         self.original_y = y
         self.pulse_timer = 0
-        self.rotation_angle = 0
         self.glow_intensity = 0
         
         # Estados
@@ -38,76 +58,99 @@ class Coin(pygame.sprite.Sprite):
         self.collection_timer = 0
         
     def load_images(self):
-        """Carrega as imagens da moeda com tamanho correto"""
-        base_image = load_image(COIN_IMAGE, scale=(COIN_SIZE, COIN_SIZE))
+        """Carrega as imagens da moeda com tamanho correto (compartilhadas via cache)"""
+        base_image = asset_cache.image(COIN_IMAGE, scale=(COIN_SIZE, COIN_SIZE))
         self.images = [base_image]
         
         # Pode adicionar mais frames de animação aqui se tiver
         # self.images.append(load_image('assets/images/coin2.png'))
+    
+    def frame_table(self, kind, alpha=None):
+        """Tabela de frames da variante, criada uma única vez via cache"""
+        key = ('coin_frames', COIN_IMAGE, (COIN_SIZE, COIN_SIZE), None, (self.variant, kind))
+        if kind == 'collect':
+            return asset_cache.get(key, lambda: self.build_collect_frames(self.images[0]))
+        return asset_cache.get(key, lambda: self.build_frame_table(self.images[0], alpha))
+    
+    @classmethod
+    def build_frame_table(cls, image, alpha=None):
+        """Pré-calcula um ciclo de rotação, pulsação de escala e transparência.
         
-    def update(self):
-        """Atualização principal da moeda"""
+        Frames com a mesma fonte e transparência compartilham a superfície
+        (e portanto a máscara no mask_cache). alpha fixa a transparência
+        (usado pelo pisca-pisca da moeda bônus) em vez da pulsação.
+        """
+        scaled_size = int(COIN_SIZE * cls.SCALE_FACTOR)
+        sources = {}
+        surfaces = {}
+        frames = []
+        for step in range(cls.FRAME_CYCLE):
+            angle = (step * cls.ROTATION_STEP) % 360
+            source_key = 'scaled' if step < cls.SCALE_FRAMES else angle - angle % cls.ROTATION_SNAP
+            if source_key not in sources:
+                if source_key == 'scaled':
+                    source = pygame.transform.scale(image, (scaled_size, scaled_size))
+                else:
+                    source = pygame.transform.rotate(image, source_key)
+                sources[source_key] = source
+            source = sources[source_key]
+            
+            frame_alpha = alpha
+            if frame_alpha is None:
+                frame_alpha = int(180 + 75 * abs(math.sin(step * cls.PULSE_FREQUENCY)))
+            if (source_key, frame_alpha) not in surfaces:
+                surface = source.copy()
+                surface.set_alpha(frame_alpha)
+                surfaces[(source_key, frame_alpha)] = surface
+            frames.append(surfaces[(source_key, frame_alpha)])
+        return frames
+    
+    @classmethod
+    def build_collect_frames(cls, image):
+        """Pré-calcula o efeito de coleta: escala crescente e desaparecimento gradual"""
+        frames = []
+        for timer in range(1, cls.COLLECT_FRAMES + 1):
+            scale_factor = 1 + (timer * 0.05)
+            surface = pygame.transform.scale(
+                image, (int(COIN_SIZE * scale_factor), int(COIN_SIZE * scale_factor))
+            )
+            surface.set_alpha(max(0, 255 - (timer * 12)))
+            frames.append(surface)
+        return frames
+        
+    def update(self, frames=1):
+        """Atualização principal da moeda (frames: frames passados, ver SimulationLOD)"""
         if self.collected:
-            self.update_collection_effect()
+            for _ in range(frames):
+                self.update_collection_effect()
             return
             
-        self.update_animation()
-        self.update_floating()
-        self.update_rotation()
-        self.update_pulse()
+        self.update_floating(frames)
+        self.update_frame(frames)
         self.update_glow()
-        self.update_mask()
     
-    def update_animation(self):
-        """Atualiza a animação da moeda"""
-        self.animation_timer += 1
-        
-        if self.animation_timer >= self.animation_speed:
-            self.animation_timer = 0
-            self.animation_frame = (self.animation_frame + 1) % len(self.images)
-            self.image = self.images[self.animation_frame]
-    
-    def update_floating(self):
+    def update_floating(self, frames=1):
         """Atualiza o efeito de flutuação suave"""
-        self.float_offset += self.float_speed
+        self.float_offset += self.float_speed * frames
         float_y = self.original_y + math.sin(self.float_offset) * 5
         self.rect.y = int(float_y)
     
-    def update_rotation(self):
-        """Atualiza rotação sutil da moeda"""
-        self.rotation_angle += 2
-        if self.rotation_angle >= 360:
-            self.rotation_angle = 0
-        
-        # Aplica rotação sutil
-        if self.rotation_angle % 10 == 0:  # Rotaciona a cada 10 graus para performance
-            rotated_image = pygame.transform.rotate(self.images[self.animation_frame], self.rotation_angle)
-            old_center = self.rect.center
-            self.image = rotated_image
-            self.rect = self.image.get_rect(center=old_center)
+    def update_frame(self, frames=1):
+        """Avança na tabela de frames (rotação, pulsação e brilho já prontos)"""
+        self.pulse_timer += frames
+        self.frame_index = (self.frame_index + frames) % len(self.frames)
+        self.show_frame(self.frames[self.frame_index])
     
-    def update_pulse(self):
-        """Atualiza o efeito de pulsação/brilho"""
-        self.pulse_timer += 1
-        
-        # Efeito de brilho suave
-        pulse_value = abs(math.sin(self.pulse_timer * 0.1))
-        alpha = int(180 + 75 * pulse_value)
-        self.image.set_alpha(alpha)
-        
-        # Efeito de escala sutil
-        if self.pulse_timer % 180 == 0:  # A cada 3 segundos
-            scale_factor = 1.2
-            original_center = self.rect.center
-            scaled_image = pygame.transform.scale(
-                self.images[self.animation_frame], 
-                (int(COIN_SIZE * scale_factor), int(COIN_SIZE * scale_factor))
-            )
-            self.image = scaled_image
-            self.rect = self.image.get_rect(center=original_center)
-            
-            # Volta ao tamanho normal após alguns frames
-            pygame.time.set_timer(pygame.USEREVENT + 1, 150)
+    def show_frame(self, image):
+        """Exibe um frame da tabela mantendo o centro da moeda"""
+        if image.get_size() != self.image.get_size():
+            self.rect = image.get_rect(center=self.rect.center)
+        self.image = image
+    
+    @property
+    def mask(self):
+        """Máscara de colisão do frame atual (compartilhada, calculada sob demanda)"""
+        return mask_cache.mask(self.image)
     
     def update_glow(self):
         """Atualiza intensidade do brilho"""
@@ -117,34 +160,22 @@ class Coin(pygame.sprite.Sprite):
         """Atualiza o efeito de coleta da moeda"""
         self.collection_timer += 1
         
-        # Efeito de subida e rotação rápida
+        # Efeito de subida
         self.rect.y -= 4
-        self.rotation_angle += 15
-        
-        # Efeito de escala crescente
-        scale_factor = 1 + (self.collection_timer * 0.05)
-        scaled_image = pygame.transform.scale(
-            self.images[0],
-            (int(COIN_SIZE * scale_factor), int(COIN_SIZE * scale_factor))
-        )
-        self.image = scaled_image
         
-        # Desaparecimento gradual
-        alpha = max(0, 255 - (self.collection_timer * 12))
-        self.image.set_alpha(alpha)
+        # Escala crescente e desaparecimento gradual (frames pré-calculados)
+        if self.collection_timer <= self.COLLECT_FRAMES:
+            self.image = self.frame_table('collect')[self.collection_timer - 1]
         
         # Remove a moeda após o efeito
-        if self.collection_timer >= 25:
+        if self.collection_timer >= self.COLLECT_FRAMES:
             self.kill()
     
-    def update_mask(self):
-        """Atualiza a máscara de colisão"""
-        self.mask = pygame.mask.from_surface(self.image)
-    
     def collect(self):
         """Marca a moeda como coletada"""
         if not self.collected:
             self.collected = True
+            self.consumed = True
             self.collection_timer = 0
             return self.value
         return 0
@@ -212,20 +243,27 @@ class Coin(pygame.sprite.Sprite):
 class PowerUpCoin(Coin):
     """Moeda especial com valor maior e efeitos visuais intensos"""
     
+    variant = 'gold'
+    
     def __init__(self, x, y):
         super().__init__(x, y, value=COIN_VALUE * 5)
         
         # Efeitos visuais mais intensos
         self.float_speed = 0.08
-        self.animation_speed = COIN_ANIMATION_SPEED // 2
-        
-        # Aplica cor dourada mais intensa
+    
+    def load_images(self):
+        """Aplica cor dourada mais intensa (variante criada uma única vez)"""
+        self.images = [asset_cache.image(COIN_IMAGE, scale=(COIN_SIZE, COIN_SIZE),
+                                         variant=self.variant, builder=self.create_gold_image)]
+    
+    @staticmethod
+    def create_gold_image(image):
+        """Cria a variante dourada da imagem base"""
         gold_overlay = pygame.Surface((COIN_SIZE, COIN_SIZE), pygame.SRCALPHA)
         gold_overlay.fill((*GOLD[:3], 100))
-        for i, image in enumerate(self.images):
-            enhanced_image = image.copy()
-            enhanced_image.blit(gold_overlay, (0, 0), special_flags=pygame.BLEND_ADD)
-            self.images[i] = enhanced_image
+        enhanced_image = image.copy()
+        enhanced_image.blit(gold_overlay, (0, 0), special_flags=pygame.BLEND_ADD)
+        return enhanced_image
     
     def draw_glow_effect(self, surface, camera_offset=(0, 0)):
         """Efeito de brilho mais intenso para moeda especial"""
@@ -255,38 +293,51 @@ class PowerUpCoin(Coin):
 class BonusCoin(Coin):
     """Moeda bônus temporária com efeitos especiais"""
     
+    variant = 'silver'
+    
+    # O tempo de vida corre mesmo longe da câmera (ver SimulationLOD)
+    timed = True
+    
     def __init__(self, x, y, lifetime=600):  # 10 segundos a 60 FPS
         super().__init__(x, y, value=COIN_VALUE * 2)
         self.lifetime = lifetime
         self.spawn_timer = 0
         self.max_lifetime = lifetime
-        
-        # Aplica cor prateada
+    
+    def load_images(self):
+        """Aplica cor prateada (variante criada uma única vez)"""
+        self.images = [asset_cache.image(COIN_IMAGE, scale=(COIN_SIZE, COIN_SIZE),
+                                         variant=self.variant, builder=self.create_silver_image)]
+    
+    @staticmethod
+    def create_silver_image(image):
+        """Cria a variante prateada da imagem base"""
         silver_overlay = pygame.Surface((COIN_SIZE, COIN_SIZE), pygame.SRCALPHA)
         silver_overlay.fill((200, 200, 255, 80))
-        for i, image in enumerate(self.images):
-            enhanced_image = image.copy()
-            enhanced_image.blit(silver_overlay, (0, 0), special_flags=pygame.BLEND_ADD)
-            self.images[i] = enhanced_image
+        enhanced_image = image.copy()
+        enhanced_image.blit(silver_overlay, (0, 0), special_flags=pygame.BLEND_ADD)
+        return enhanced_image
         
-    def update(self):
+    def update(self, frames=1):
         """Atualização com tempo de vida limitado"""
-        super().update()
+        super().update(frames)
         
         if not self.collected:
-            self.spawn_timer += 1
+            self.spawn_timer += frames
             
             # Efeito de urgência - pisca mais rápido conforme o tempo passa
             urgency_threshold = self.lifetime - 180  # Últimos 3 segundos
             if self.spawn_timer > urgency_threshold:
                 flash_speed = max(5, 20 - (self.spawn_timer - urgency_threshold) // 10)
                 if (self.spawn_timer // flash_speed) % 2:
-                    self.image.set_alpha(100)
+                    flash = self.frame_table('dim', alpha=100)
                 else:
-                    self.image.set_alpha(255)
+                    flash = self.frame_table('full', alpha=255)
+                self.show_frame(flash[self.frame_index])
             
             # Remove após o tempo limite
             if self.spawn_timer >= self.lifetime:
+                self.consumed = True
                 self.kill()
     
     def draw_glow_effect(self, surface, camera_offset=(0, 0)):
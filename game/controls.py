@@ -0,0 +1,37 @@
+# Fontes de entrada do jogador: teclado real ou teclas definidas por código
+import pygame
+
+class KeyboardControls:
+    """Estado do teclado lido do pygame (jogo normal)"""
+
+    def pressed(self):
+        return pygame.key.get_pressed()
+
+class ScriptedControls:
+    """Teclas pressionadas controladas por código (modo headless, testes).
+
+    pressed() responde no mesmo formato de pygame.key.get_pressed():
+    keys[pygame.K_x] é True enquanto a tecla estiver pressionada.
+    """
+
+    def __init__(self, keys=()):
+        self.keys = KeyState(keys)
+
+    def press(self, *keys):
+        self.keys.update(keys)
+
+    def release(self, *keys):
+        self.keys.difference_update(keys)
+
+    def set(self, keys):
+        """Substitui todas as teclas pressionadas"""
+        self.keys = KeyState(keys)
+
+    def pressed(self):
+        return self.keys
+
+class KeyState(set):
+    """Conjunto de teclas consultável como pygame.key.get_pressed()"""
+
+    def __getitem__(self, key):
+        return key in self
@@ -0,0 +1,117 @@
+# Renderização por retângulos sujos (atualização parcial da tela)
+import pygame
+
+class DirtyRectTracker:
+    """Rastreia o que mudou na tela entre frames para redesenhar só essas regiões.
+
+    Sprites com o atributo dirty_tracking = True só mudam de aparência trocando
+    de imagem ou de posição; os demais (gelo, plataformas que somem) alteram a
+    própria superfície e por isso são considerados sujos em todo frame.
+    """
+
+    def __init__(self, screen_rect, max_dirty_ratio=0.5):
+        self.screen_rect = screen_rect
+        self.max_dirty_area = screen_rect.width * screen_rect.height * max_dirty_ratio
+
+        # Estado do último frame desenhado
+        self.previous = {}
+        self.last_mode = None
+        self.last_camera = None
+        self.last_hud_state = None
+        self.needs_full = True
+
+        # Estatísticas
+        self.stats = {'full': 0, 'partial': 0, 'skipped': 0, 'dirty_rects': 0}
+
+    def invalidate(self):
+        """Força um redesenho completo no próximo frame"""
+        self.needs_full = True
+
+    def static_frame(self, key):
+        """Telas estáticas (menu, pausa, game over): True se precisam ser redesenhadas.
+
+        key descreve o conteúdo da tela; None significa que ela muda todo frame.
+        """
+        if key is not None and key == self.last_mode and not self.needs_full:
+            self.stats['skipped'] += 1
+            return False
+
+        self.last_mode = key
+        self.needs_full = key is None
+        self.previous = {}
+        self.stats['full'] += 1
+        return True
+
+    def plan(self, sprites, camera_pos, hud_state, hud_rect):
+        """Calcula o redesenho do frame de jogo.
+
+        Retorna (None, None) para redesenho completo ou (retângulos sujos,
+        sprites a redesenhar) para atualização parcial.
+        """
+        ox, oy = camera_pos
+        current = {}
+        for sprite in sprites:
+            rect = pygame.Rect(sprite.rect.x + ox, sprite.rect.y + oy, *sprite.image.get_size())
+            current[sprite] = (sprite.image, rect)
+
+        # Câmera rolou ou troca de tela: tudo muda de lugar
+        full = (self.needs_full or self.last_mode != 'playing' or camera_pos != self.last_camera)
+
+        dirty = []
+        redraw = []
+        if not full:
+            for sprite, (image, rect) in current.items():
+                old = self.previous.get(sprite)
+                if old is None:
+                    dirty.append(rect)
+                elif (not getattr(sprite, 'dirty_tracking', False)
+                      or old[0] is not image or old[1] != rect):
+                    dirty.append(old[1])
+                    dirty.append(rect)
+            for sprite, (image, rect) in self.previous.items():
+                if sprite not in current:
+                    dirty.append(rect)
+            if hud_state != self.last_hud_state:
+                dirty.append(hud_rect)
+
+            dirty, redraw = self.expand(dirty, current, hud_rect)
+            dirty = [rect.clip(self.screen_rect) for rect in dirty if rect.colliderect(self.screen_rect)]
+            if sum(rect.width * rect.height for rect in dirty) > self.max_dirty_area:
+                full = True
+
+        self.previous = current
+        self.last_mode = 'playing'
+        self.last_camera = camera_pos
+        self.last_hud_state = hud_state
+        self.needs_full = False
+
+        if full:
+            self.stats['full'] += 1
+            return None, None
+
+        self.stats['partial'] += 1
+        self.stats['dirty_rects'] += len(dirty)
+        return dirty, redraw
+
+    def expand(self, dirty, current, hud_rect):
+        """Inclui por inteiro tudo que encosta numa região suja.
+
+        Um sprite redesenhado precisa ter toda a sua área restaurada antes,
+        senão pixels semitransparentes fora da região seriam mesclados duas
+        vezes. O HUD, desenhado por cima de tudo, entra como mais um candidato.
+        """
+        candidates = [(sprite, rect) for sprite, (image, rect) in current.items()]
+        candidates.append((None, hud_rect))
+        marked = [False] * len(candidates)
+
+        changed = bool(dirty)
+        while changed:
+            changed = False
+            for i, (sprite, rect) in enumerate(candidates):
+                if not marked[i] and rect.collidelist(dirty) != -1:
+                    marked[i] = True
+                    dirty.append(rect)
+                    changed = True
+
+        redraw = [sprite for i, (sprite, rect) in enumerate(candidates) if marked[i] and sprite is not None]
+        return dirty, redraw
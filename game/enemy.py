@@ -1,14 +1,33 @@
 import pygame
-import random
 import math
 import os
 from game.settings import *
-from game.utils import load_image, clamp, load_sprite
+from game.utils import clamp, asset_cache, random_streams
+from game.profiling import profiler
+
+# Buscas de plataforma em tempo de jogo (zero em níveis compilados, ver level_compiler)
+PLATFORM_SEARCHES = profiler.counter('enemy.platform_search')
 
 class Enemy(pygame.sprite.Sprite):
     """Classe dos inimigos com movimento fixo nas plataformas"""
     
-    def __init__(self, x, y, platform_group):
+    # A aparência só muda trocando self.image (ver DirtyRectTracker)
+    dirty_tracking = True
+    
+    # Reposicionado no índice espacial a cada frame (ver SpatialGroup)
+    moves = True
+    
+    # Derrotado: não volta quando o chunk é recarregado (ver WorldStreamer)
+    consumed = False
+    
+    # Alcance de percepção padrão (detection_range e attack_range padrão);
+    # níveis podem aumentá-lo por inimigo (ver awareness_range)
+    AWARENESS_RANGE = 120
+    
+    # Distância mínima das bordas da plataforma durante a patrulha
+    PATROL_MARGIN = 20
+    
+    def __init__(self, x, y, platform_group, placement=None, random=None):
         super().__init__()
         
         # Carregamento de sprites primeiro
@@ -24,6 +43,10 @@ class Enemy(pygame.sprite.Sprite):
         # Referência às plataformas
         self.platform_group = platform_group
         
+        # Lote vetorizado que simula este inimigo (ver EnemyBatch), se houver
+        self.batch = None
+        self.batch_index = None
+        
         # ===== FÍSICA SIMPLIFICADA =====
         
         # Velocidade
@@ -36,7 +59,8 @@ class Enemy(pygame.sprite.Sprite):
         
         # ===== MOVIMENTO CONTROLADO =====
         
-        # Direção e patrulhamento
+        # Direção e patrulhamento (sorteada no fluxo aleatório do nível, ver LevelScene)
+        random = random or random_streams.stream('enemies')
         self.direction = random.choice([-1, 1])
         self.speed = ENEMY_SPEED
         self.facing_right = self.direction > 0
@@ -68,15 +92,16 @@ class Enemy(pygame.sprite.Sprite):
         self.state_timer = 0
         self.animation_timer = 0
         
-        # Encontra plataforma inicial
-        self.find_initial_platform()
+        # Plataforma inicial: (plataforma, patrulha esquerda, patrulha direita)
+        # pré-calculada pelo compilador de níveis, ou procurada aqui
+        if placement:
+            self.place_on_platform(*placement)
+        else:
+            self.find_initial_platform()
     
     def load_sprites(self):
-        """Carrega sprites do inimigo de forma simplificada"""
+        """Carrega sprites do inimigo (compartilhados entre inimigos via cache)"""
         try:
-            # Carrega sprites usando load_image
-            self.sprites = {}
-            
             # Caminhos dos sprites (caminho completo)
             sprite_files = {
                 'IDLE': os.path.join('assets', 'images', 'vparado.png'),
@@ -85,18 +110,9 @@ class Enemy(pygame.sprite.Sprite):
                 'DAMAGE': os.path.join('assets', 'images', 'vsofrendo.png')
             }
             
-            # Carrega cada sprite
-            for state, filepath in sprite_files.items():
-                try:
-                    sprite = load_image(filepath, (ENEMY_WIDTH, ENEMY_HEIGHT))
-                    self.sprites[state] = sprite
-                    print(f"✅ Sprite {state} carregado com sucesso!")
-                except Exception as e:
-                    print(f"❌ Erro ao carregar sprite {filepath}: {e}")
-                    # Cria um sprite de fallback
-                    fallback_sprite = pygame.Surface((ENEMY_WIDTH, ENEMY_HEIGHT))
-                    fallback_sprite.fill((150, 0, 0))  # Vermelho escuro
-                    self.sprites[state] = fallback_sprite
+            # Tabela de variantes pré-espelhadas, criada uma vez para todos os inimigos
+            self.sprite_table = asset_cache.sprite_table(sprite_files, (ENEMY_WIDTH, ENEMY_HEIGHT), kind='image')
+            self.sprites = {state: self.sprite_table[(state, True, False)] for state in sprite_files}
             
             # Define sprite inicial
             self.image = self.sprites['IDLE']
@@ -108,52 +124,69 @@ class Enemy(pygame.sprite.Sprite):
             self.image = pygame.Surface((ENEMY_WIDTH, ENEMY_HEIGHT))
             self.image.fill((200, 0, 0))  # Vermelho
             self.sprites = {'IDLE': self.image}
+            self.sprite_table = {('IDLE', True, False): self.image,
+                                 ('IDLE', False, False): self.image}
             self.current_sprite_state = 'IDLE'
     
     def find_initial_platform(self):
         """Encontra a plataforma inicial e define limites"""
+        PLATFORM_SEARCHES.add()
+        
         # Posiciona o inimigo na plataforma mais próxima
         closest_platform = None
         min_distance = float('inf')
         
-        for platform in self.platform_group:
-            # Verifica se está sobre a plataforma
-            if (self.rect.centerx >= platform.rect.left and 
-                self.rect.centerx <= platform.rect.right):
-                
-                distance = abs(self.rect.bottom - platform.rect.top)
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_platform = platform
+        # Só as plataformas na coluna do inimigo (consulta ao índice espacial)
+        for platform in self.platform_group.in_column(self.rect.centerx):
+            distance = abs(self.rect.bottom - platform.rect.top)
+            if distance < min_distance:
+                min_distance = distance
+                closest_platform = platform
         
         if closest_platform:
-            # Posiciona na plataforma
-            self.rect.bottom = closest_platform.rect.top
-            self.ground_platform = closest_platform
-            self.on_ground = True
-            
-            # Define limites de patrulhamento baseados na plataforma
-            self.patrol_left = closest_platform.rect.left + 20
-            self.patrol_right = closest_platform.rect.right - 20
-            self.patrol_center = closest_platform.rect.centerx
-            
-            # Ajusta posição se necessário
-            if self.rect.left < self.patrol_left:
-                self.rect.left = self.patrol_left
-            elif self.rect.right > self.patrol_right:
-                self.rect.right = self.patrol_right
+            self.place_on_platform(closest_platform, *self.patrol_bounds(closest_platform))
+    
+    def place_on_platform(self, platform, patrol_left, patrol_right):
+        """Posiciona o inimigo sobre a plataforma com os limites de patrulha dados"""
+        self.rect.bottom = platform.rect.top
+        self.ground_platform = platform
+        self.on_ground = True
+        
+        # Limites de patrulhamento
+        self.patrol_left = patrol_left
+        self.patrol_right = patrol_right
+        self.patrol_center = platform.rect.centerx
+        
+        # Ajusta posição se necessário
+        if self.rect.left < self.patrol_left:
+            self.rect.left = self.patrol_left
+        elif self.rect.right > self.patrol_right:
+            self.rect.right = self.patrol_right
+    
+    @classmethod
+    def patrol_bounds(cls, platform):
+        """Limites de patrulha (esquerda, direita) sobre a plataforma"""
+        return platform.rect.left + cls.PATROL_MARGIN, platform.rect.right - cls.PATROL_MARGIN
     
-    def update(self, player):
-        """Atualização principal do inimigo"""
-        self.update_ai(player)
-        self.update_physics()
-        self.apply_sprite()
-        self.update_timers()
-        self.check_if_stuck()
+    def update(self, player, distance_sq=None, frames=1):
+        """Atualização principal do inimigo (frames: passos a simular, ver SimulationLOD)"""
+        for _ in range(frames):
+            self.update_ai(player, distance_sq)
+            self.update_physics()
+            self.apply_sprite()
+            self.update_timers()
+            self.check_if_stuck()
+            # Nos passos seguintes a distância é recalculada (o inimigo andou)
+            distance_sq = None
     
-    def update_ai(self, player):
-        """IA simplificada com movimento controlado"""
-        distance_to_player = self.distance_to(player.rect.center)
+    def update_ai(self, player, distance_sq=None):
+        """IA simplificada com movimento controlado.
+        
+        distance_sq é a distância² até o jogador já obtida do índice espacial
+        (math.inf se estiver além de awareness_range); sem ela é calculada aqui.
+        """
+        if distance_sq is None:
+            distance_sq = self.distance_sq_to(player.rect.center)
         
         # Máquina de estados
         if self.state == 'PATROL':
@@ -164,20 +197,20 @@ class Enemy(pygame.sprite.Sprite):
                 self.patrol_movement()
             
             # Detecta jogador
-            if distance_to_player < self.detection_range:
+            if distance_sq < self.detection_range ** 2:
                 self.state = 'ALERT'
                 self.state_timer = 60
         
         elif self.state == 'ALERT':
             self.velocity.x = 0
-            if distance_to_player < self.attack_range:
+            if distance_sq < self.attack_range ** 2:
                 self.state = 'ATTACK'
                 self.state_timer = 30
             elif self.state_timer <= 0:
                 self.state = 'PATROL'
         
         elif self.state == 'ATTACK':
-            if distance_to_player > self.attack_range * 1.5:
+            if distance_sq > (self.attack_range * 1.5) ** 2:
                 self.state = 'ALERT'
                 self.state_timer = 30
             elif self.state_timer <= 0:
@@ -248,9 +281,8 @@ class Enemy(pygame.sprite.Sprite):
     def check_platform_collision(self):
         """Verifica colisão com plataformas"""
         if self.velocity.y > 0:  # Caindo
-            for platform in self.platform_group:
-                if (self.rect.colliderect(platform.rect) and
-                    self.rect.bottom <= platform.rect.top + 10):
+            for platform in self.platform_group.collide_rect(self.rect):
+                if self.rect.bottom <= platform.rect.top + 10:
                     
                     self.rect.bottom = platform.rect.top
                     self.velocity.y = 0
@@ -258,8 +290,7 @@ class Enemy(pygame.sprite.Sprite):
                     self.ground_platform = platform
                     
                     # Atualiza limites de patrulhamento
-                    self.patrol_left = platform.rect.left + 20
-                    self.patrol_right = platform.rect.right - 20
+                    self.patrol_left, self.patrol_right = self.patrol_bounds(platform)
                     break
     
     def ensure_on_platform(self):
@@ -307,24 +338,19 @@ class Enemy(pygame.sprite.Sprite):
         else:
             target_state = 'IDLE'
         
-        # Aplica sprite (sempre atualiza para garantir espelhamento correto)
-        if target_state in self.sprites:
-            self.image = self.sprites[target_state].copy()
-            self.current_sprite_state = target_state
-            
-            # Espelha se necessário
-            if not self.facing_right:
-                self.image = pygame.transform.flip(self.image, True, False)
-        else:
-            # Fallback para IDLE se sprite não existir
-            self.image = self.sprites['IDLE'].copy()
-            self.current_sprite_state = 'IDLE'
-            
-            if not self.facing_right:
-                self.image = pygame.transform.flip(self.image, True, False)
+        # Fallback para IDLE se sprite não existir
+        if target_state not in self.sprites:
+            target_state = 'IDLE'
+        
+        # Consulta a variante já espelhada (sem copy/flip por frame)
+        self.image = self.sprite_table[(target_state, self.facing_right, False)]
+        self.current_sprite_state = target_state
     
     def take_damage(self, damage=1):
         """Recebe dano"""
+        if self.batch is not None:
+            return self.batch.take_damage(self, damage)
+        
         self.health -= damage
         self.damage_timer = 30
         self.state = 'DAMAGED'
@@ -354,11 +380,21 @@ class Enemy(pygame.sprite.Sprite):
         
         return pygame.Rect(attack_x, attack_y, attack_width, attack_height)
     
+    @property
+    def awareness_range(self):
+        """Distância em que o jogador ainda influencia a IA: maior entre
+        detection_range e attack_range * 1.5 (perda do alvo no ataque)"""
+        return max(self.detection_range, self.attack_range * 1.5)
+    
     def distance_to(self, point):
         """Calcula distância até um ponto"""
+        return math.sqrt(self.distance_sq_to(point))
+    
+    def distance_sq_to(self, point):
+        """Distância ao quadrado até um ponto (comparada com alcances ao quadrado)"""
         dx = self.rect.centerx - point[0]
         dy = self.rect.centery - point[1]
-        return math.sqrt(dx * dx + dy * dy)
+        return dx * dx + dy * dy
     
     def update_timers(self):
         """Atualiza timers"""
@@ -0,0 +1,366 @@
+# Backend vetorizado de inimigos (struct-of-arrays com NumPy)
+#
+# Opcional: ativado com ENEMY_BACKEND = 'numpy' e só se o NumPy estiver
+# instalado (pip install numpy). Sem ele o jogo usa Enemy por objeto.
+import pygame
+from game.settings import *
+from game.enemy import Enemy
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+# Códigos dos estados da IA e dos sprites (índices nestas tuplas)
+STATES = ('PATROL', 'ALERT', 'ATTACK', 'DAMAGED')
+PATROL, ALERT, ATTACK, DAMAGED = range(len(STATES))
+SPRITE_STATES = ('IDLE', 'WALKING', 'ATTACKING', 'DAMAGE')
+IDLE, WALKING, ATTACKING, DAMAGE = range(len(SPRITE_STATES))
+
+INT_FIELDS = ('x', 'y', 'w', 'h', 'direction', 'pause_timer', 'stuck_timer', 'last_x',
+              'state', 'state_timer', 'damage_timer', 'animation_timer', 'health',
+              'patrol_left', 'patrol_right', 'platform', 'sprite_state')
+FLOAT_FIELDS = ('vx', 'vy', 'speed', 'detection_range', 'attack_range')
+BOOL_FIELDS = ('facing_right', 'sprite_facing', 'on_ground', 'alive')
+
+class EnemyBatch(pygame.sprite.Group):
+    """Grupo de inimigos simulados em lote.
+
+    O estado de todos os inimigos (posição, velocidade, estado da IA, timers,
+    limites de patrulha) fica em arrays NumPy e step() executa, com operações
+    vetorizadas, a mesma sequência de Enemy.update: IA, física de patrulha,
+    escolha do sprite, timers e verificação de travamento. Os objetos Enemy
+    continuam existindo só como interface: sync() copia o estado do lote para
+    eles quando são desenhados ou atingidos (visible() e collide_rect()).
+    Inimigos removidos (derrotados ou descarregados pelo streaming) saem dos
+    arrays no próximo flush(), junto com as plataformas que ninguém usa mais:
+    o lote tem sempre uma linha por inimigo do grupo.
+    """
+
+    def __init__(self, platform_group):
+        if not NUMPY_AVAILABLE:
+            raise ImportError("EnemyBatch requer NumPy (pip install numpy)")
+        super().__init__()
+        self.platform_group = platform_group
+
+        # Índice do lote -> Enemy; inimigos adicionados aguardam o próximo flush()
+        self.enemies = []
+        self.pending = []
+
+        # Plataformas de apoio (índice no lote) e seus limites
+        self.platforms = []
+        self.platform_slots = {}
+        self.moving_platforms = []
+        self.removed = False  # Há linhas de inimigos removidos a compactar
+        self.reset()
+
+    def reset(self):
+        """Esvazia os arrays"""
+        for name in INT_FIELDS:
+            setattr(self, name, np.zeros(0, dtype=np.int64))
+        for name in FLOAT_FIELDS:
+            setattr(self, name, np.zeros(0, dtype=np.float64))
+        for name in BOOL_FIELDS:
+            setattr(self, name, np.zeros(0, dtype=bool))
+        self.enemies.clear()
+        self.platforms.clear()
+        self.platform_slots.clear()
+        self.moving_platforms.clear()
+        self.platform_bounds = np.zeros((4, 0), dtype=np.int64)
+        self.removed = False
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.pending.append(sprite)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        if sprite in self.pending:
+            self.pending.remove(sprite)
+        elif getattr(sprite, 'batch', None) is self:
+            # Objeto sai do lote com o estado final
+            self.sync(sprite.batch_index)
+            self.alive[sprite.batch_index] = False
+            sprite.batch = None
+            self.removed = True
+        if not self.spritedict:
+            self.reset()
+
+    def platform_slot(self, platform):
+        """Índice da plataforma no lote (-1 para nenhuma)"""
+        if platform is None:
+            return -1
+        slot = self.platform_slots.get(platform)
+        if slot is None:
+            slot = self.platform_slots[platform] = len(self.platforms)
+            self.platforms.append(platform)
+            if getattr(platform, 'moves', False):
+                self.moving_platforms.append(slot)
+            bounds = np.array([[platform.rect.left], [platform.rect.right],
+                               [platform.rect.top], [platform.rect.centerx]], dtype=np.int64)
+            self.platform_bounds = np.concatenate((self.platform_bounds, bounds), axis=1)
+        return slot
+
+    def compact(self):
+        """Descarta as linhas dos inimigos removidos e as plataformas sem inimigo"""
+        keep = np.flatnonzero(self.alive)
+        for name in INT_FIELDS + FLOAT_FIELDS + BOOL_FIELDS:
+            setattr(self, name, getattr(self, name)[keep])
+        self.enemies = [self.enemies[index] for index in keep]
+        for index, enemy in enumerate(self.enemies):
+            enemy.batch_index = index
+
+        # Plataformas: só as de apoio de algum inimigo restante, renumeradas
+        used = np.unique(self.platform[self.platform >= 0])
+        slots = np.full(len(self.platforms) + 1, -1, dtype=np.int64)
+        slots[used] = np.arange(len(used))
+        self.platform = slots[self.platform]  # -1 (sem plataforma) cai na última posição
+        self.platforms = [self.platforms[slot] for slot in used]
+        self.platform_slots = {platform: slot for slot, platform in enumerate(self.platforms)}
+        self.moving_platforms = [slot for slot, platform in enumerate(self.platforms)
+                                 if getattr(platform, 'moves', False)]
+        self.platform_bounds = self.platform_bounds[:, used]
+        self.removed = False
+
+    def flush(self):
+        """Compacta os removidos e copia para os arrays os inimigos adicionados desde o último flush"""
+        if self.removed:
+            self.compact()
+        if self.pending:
+            self.append_pending()
+        assert len(self.enemies) == len(self.spritedict), "lote e grupo de inimigos divergiram"
+
+    def append_pending(self):
+        """Acrescenta uma linha por inimigo adicionado"""
+
+        rows = []
+        for enemy in self.pending:
+            enemy.batch = self
+            enemy.batch_index = len(self.enemies)
+            self.enemies.append(enemy)
+            rows.append({
+                'x': enemy.rect.x, 'y': enemy.rect.y, 'w': enemy.rect.width, 'h': enemy.rect.height,
+                'direction': enemy.direction, 'pause_timer': enemy.pause_timer,
+                'stuck_timer': enemy.stuck_timer, 'last_x': enemy.last_x,
+                'state': STATES.index(enemy.state), 'state_timer': enemy.state_timer,
+                'damage_timer': enemy.damage_timer, 'animation_timer': enemy.animation_timer,
+                'health': enemy.health, 'patrol_left': enemy.patrol_left,
+                'patrol_right': enemy.patrol_right, 'platform': self.platform_slot(enemy.ground_platform),
+                'sprite_state': SPRITE_STATES.index(enemy.current_sprite_state),
+                'vx': enemy.velocity.x, 'vy': enemy.velocity.y, 'speed': enemy.speed,
+                'detection_range': enemy.detection_range, 'attack_range': enemy.attack_range,
+                'facing_right': enemy.facing_right, 'sprite_facing': enemy.facing_right,
+                'on_ground': enemy.on_ground, 'alive': True,
+            })
+        self.pending.clear()
+
+        for names, dtype in ((INT_FIELDS, np.int64), (FLOAT_FIELDS, np.float64), (BOOL_FIELDS, bool)):
+            for name in names:
+                column = np.array([row[name] for row in rows], dtype=dtype)
+                setattr(self, name, np.concatenate((getattr(self, name), column)))
+
+    def step(self, player):
+        """Equivale a enemy.update(player) para todos os inimigos do lote"""
+        self.flush()
+        if not self.enemies:
+            return
+
+        # Plataformas móveis: limites atuais
+        for slot in self.moving_platforms:
+            rect = self.platforms[slot].rect
+            self.platform_bounds[:, slot] = (rect.left, rect.right, rect.top, rect.centerx)
+
+        px, py = player.rect.center
+        dx = self.x + self.w // 2 - px
+        dy = self.y + self.h // 2 - py
+        self.update_ai(dx * dx + dy * dy)
+        self.update_physics()
+        self.apply_sprite()
+        self.update_timers()
+        self.check_if_stuck()
+
+    def update_ai(self, distance_sq):
+        """Máquina de estados PATROL/ALERT/ATTACK/DAMAGED (ver Enemy.update_ai)"""
+        state = self.state.copy()
+        patrol = state == PATROL
+        alert = state == ALERT
+        attack = state == ATTACK
+        damaged = state == DAMAGED
+
+        # PATROL: pausa ou patrulha; detecta o jogador
+        paused = patrol & (self.pause_timer > 0)
+        self.pause_timer[paused] -= 1
+        self.vx[paused] = 0
+        self.patrol_movement(patrol & ~paused)
+        detected = patrol & (distance_sq < self.detection_range ** 2)
+        self.set_state(detected, ALERT, 60)
+
+        # ALERT: parado; ataca se perto, desiste quando o timer acaba
+        self.vx[alert] = 0
+        to_attack = alert & (distance_sq < self.attack_range ** 2)
+        self.set_state(to_attack, ATTACK, 30)
+        self.state[alert & ~to_attack & (self.state_timer <= 0)] = PATROL
+
+        # ATTACK: volta a ALERT se o jogador se afastar
+        lost = attack & (distance_sq > (self.attack_range * 1.5) ** 2)
+        self.set_state(lost, ALERT, 30)
+        self.state[attack & ~lost & (self.state_timer <= 0)] = PATROL
+
+        # DAMAGED: desacelera o knockback até o fim do dano
+        self.vx[damaged] *= 0.5
+        self.state[damaged & (self.damage_timer <= 0)] = PATROL
+
+    def set_state(self, mask, state, timer):
+        self.state[mask] = state
+        self.state_timer[mask] = timer
+
+    def patrol_movement(self, mask):
+        """Movimento de patrulhamento (ver Enemy.patrol_movement)"""
+        grounded = mask & self.on_ground & (self.platform >= 0)
+        self.vx[mask & ~grounded] = 0
+
+        forward = self.direction > 0
+        at_edge = grounded & np.where(forward, self.x + self.w >= self.patrol_right,
+                                      self.x <= self.patrol_left)
+        self.turn_around(at_edge)
+
+        walking = grounded & ~at_edge
+        self.vx[walking] = self.direction[walking] * self.speed[walking]
+        self.facing_right[walking] = forward[walking]
+
+    def turn_around(self, mask):
+        """Vira os inimigos da máscara (ver Enemy.turn_around)"""
+        self.direction[mask] *= -1
+        self.facing_right[mask] = self.direction[mask] > 0
+        self.vx[mask] = 0
+        self.pause_timer[mask] = 30
+
+    def update_physics(self):
+        """Física de patrulha (ver Enemy.update_physics)"""
+        airborne = ~self.on_ground
+        self.vy[airborne] = np.minimum(self.vy[airborne] + GRAVITY, MAX_FALL_SPEED)
+        self.vy[~airborne] = 0
+
+        # Movimento horizontal limitado à patrulha
+        moving = self.vx != 0
+        self.x[moving] += np.trunc(self.vx[moving]).astype(np.int64)
+        before = moving & (self.x < self.patrol_left)
+        self.x[before] = self.patrol_left[before]
+        self.turn_around(before)
+        past = moving & ~before & (self.x + self.w > self.patrol_right)
+        self.x[past] = self.patrol_right[past] - self.w[past]
+        self.turn_around(past)
+
+        # Queda: raro (só sem plataforma), resolvido por objeto com o índice espacial
+        for index in np.flatnonzero((self.vy != 0) & self.alive):
+            self.y[index] += int(self.vy[index])
+            self.check_platform_collision(index)
+
+        self.ensure_on_platform()
+
+    def check_platform_collision(self, index):
+        """Pouso de um inimigo em queda (ver Enemy.check_platform_collision)"""
+        if self.vy[index] <= 0:
+            return
+        rect = pygame.Rect(int(self.x[index]), int(self.y[index]), int(self.w[index]), int(self.h[index]))
+        for platform in self.platform_group.collide_rect(rect):
+            if rect.bottom <= platform.rect.top + 10:
+                self.y[index] = platform.rect.top - rect.height
+                self.vy[index] = 0
+                self.on_ground[index] = True
+                self.platform[index] = self.platform_slot(platform)
+                self.patrol_left[index], self.patrol_right[index] = Enemy.patrol_bounds(platform)
+                break
+
+    def ensure_on_platform(self):
+        """Mantém cada inimigo sobre a sua plataforma (ver Enemy.ensure_on_platform)"""
+        if not self.platforms:
+            return
+        supported = self.platform >= 0
+        left, right, top, centerx = self.platform_bounds[:, np.where(supported, self.platform, 0)]
+
+        off = supported & ((self.x + self.w < left) | (self.x > right))
+        self.x[off] = centerx[off] - self.w[off] // 2
+        self.vx[off] = 0
+        self.turn_around(off)
+
+        sunk = supported & (np.abs(self.y + self.h - top) > 5)
+        self.y[sunk] = top[sunk] - self.h[sunk]
+        self.vy[sunk] = 0
+        self.on_ground[sunk] = True
+
+    def apply_sprite(self):
+        """Sprite de cada inimigo neste frame (ver Enemy.apply_sprite)"""
+        self.sprite_state = np.select(
+            [self.damage_timer > 0, self.state == ATTACK, np.abs(self.vx) > 0.1],
+            [DAMAGE, ATTACKING, WALKING], IDLE)
+        self.sprite_facing = self.facing_right.copy()
+
+    def update_timers(self):
+        """Timers (ver Enemy.update_timers)"""
+        self.damage_timer[self.damage_timer > 0] -= 1
+        self.state_timer[self.state_timer > 0] -= 1
+        self.animation_timer += 1
+
+    def check_if_stuck(self):
+        """Vira inimigos parados há mais de 1 segundo (ver Enemy.check_if_stuck)"""
+        still = self.x == self.last_x
+        self.stuck_timer[still] += 1
+        stuck = still & (self.stuck_timer > 60)
+        self.turn_around(stuck)
+        self.stuck_timer[stuck | ~still] = 0
+        self.last_x = self.x.copy()
+
+    def take_damage(self, enemy, damage=1):
+        """Dano num inimigo do lote (ver Enemy.take_damage)"""
+        index = enemy.batch_index
+        self.health[index] -= damage
+        self.damage_timer[index] = 30
+        self.state[index] = DAMAGED
+        self.vx[index] = -3 if self.facing_right[index] else 3
+        self.sync(index)
+        return bool(self.health[index] <= 0)
+
+    def sync(self, index):
+        """Copia o estado do lote para o objeto Enemy (desenho, colisão, efeitos)"""
+        enemy = self.enemies[index]
+        enemy.rect.topleft = (int(self.x[index]), int(self.y[index]))
+        enemy.velocity.update(float(self.vx[index]), float(self.vy[index]))
+        enemy.direction = int(self.direction[index])
+        enemy.facing_right = bool(self.facing_right[index])
+        enemy.state = STATES[self.state[index]]
+        enemy.state_timer = int(self.state_timer[index])
+        enemy.damage_timer = int(self.damage_timer[index])
+        enemy.pause_timer = int(self.pause_timer[index])
+        enemy.health = int(self.health[index])
+        enemy.on_ground = bool(self.on_ground[index])
+        enemy.patrol_left = int(self.patrol_left[index])
+        enemy.patrol_right = int(self.patrol_right[index])
+        slot = self.platform[index]
+        enemy.ground_platform = self.platforms[slot] if slot >= 0 else None
+
+        sprite_state = SPRITE_STATES[self.sprite_state[index]]
+        if sprite_state not in enemy.sprites:
+            sprite_state = 'IDLE'
+        enemy.image = enemy.sprite_table[(sprite_state, bool(self.sprite_facing[index]), False)]
+        enemy.current_sprite_state = sprite_state
+        return enemy
+
+    def sync_all(self):
+        """Sincroniza todos os objetos Enemy (ex.: antes de resumir o estado da simulação)"""
+        self.flush()
+        return [self.sync(index) for index in range(len(self.enemies))]
+
+    def collide_rect(self, rect):
+        """Inimigos (sincronizados) cujo rect colide com o rect dado"""
+        self.flush()
+        hits = np.flatnonzero(self.alive &
+                              (self.x < rect.right) & (self.x + self.w > rect.left) &
+                              (self.y < rect.bottom) & (self.y + self.h > rect.top))
+        return [self.sync(index) for index in hits]
+
+    def visible(self, view):
+        """Inimigos dentro da área visível, sincronizados para o desenho"""
+        return self.collide_rect(view)
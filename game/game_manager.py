@@ -1,17 +1,41 @@
 import pygame
-import random
+import math
+import os
 import sys
-from game.utils import load_image, draw_text, draw_text_left, draw_text_right, Camera, clamp, draw_gradient_rect, load_sound
+import time
+from game.utils import (load_image, draw_text, draw_text_left, draw_text_right, Camera, clamp, load_sound,
+                        asset_cache, collide_sprites, collide_rect, random_streams)
 from game.settings import *
-from game.player import Player
 from game.enemy import Enemy
-from game.coin import Coin, PowerUpCoin, BonusCoin
-from game.platform import Platform, MovingPlatform, DisappearingPlatform, BouncePlatform
+from game.dirty_rects import DirtyRectTracker
+from game.background import load_parallax_background
+from game.hud import HUD
+from game.spatial import SpatialGroup
+from game.enemy_batch import EnemyBatch, NUMPY_AVAILABLE
+from game.simulation_lod import SimulationLOD
+from game.level_format import load_level_number, level_count
+from game.level_scene import LevelScene
+from game.level_preloader import LevelPreloader
+from game.controls import KeyboardControls
+from game.perf_overlay import FrameTimer, PerfOverlay
+from game.profiling import profiler
 
 class GameManager:
     """Gerenciador principal do jogo"""
     
-    def __init__(self):
+    def __init__(self, headless=False, controls=None, seed=None, levels_path=LEVELS_PATH):
+        # Modo headless: drivers SDL "dummy" (sem janela nem áudio), nada é
+        # desenhado e o loop não espera o FPS (ver run e simulate)
+        self.headless = headless
+        if headless:
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        
+        # Entrada do jogador: teclado ou teclas definidas por código (ScriptedControls,
+        # InputReplay); com seed, os sorteios se repetem a cada execução
+        self.controls = controls or KeyboardControls()
+        random_streams.seed(seed)
+        
         # Inicialização do Pygame
         pygame.init()
         pygame.mixer.init()
@@ -21,6 +45,9 @@ class GameManager:
         pygame.display.set_caption("Super Hero - Jogo de Plataforma")
         self.clock = pygame.time.Clock()
         
+        # Pacote de assets pré-processado (opcional)
+        asset_cache.load_pack(ASSET_PACK)
+        
         # Estado do jogo
         self.game_state = GAME_MENU
         self.running = True
@@ -36,9 +63,24 @@ class GameManager:
         self.font_medium = pygame.font.Font(None, HUD_FONT_SIZE)
         self.font_small = pygame.font.Font(None, TEXT_FONT_SIZE)
         
-        # Background
+        # HUD retido
+        self.hud = HUD(self.font_medium, self.font_small)
+        
+        # Tempo de cada etapa do frame (desligado até F3 ou gravação de amostras)
+        self.frame_timer = FrameTimer()
+        self.perf_overlay = PerfOverlay(self.frame_timer)
+        
+        # Instrumentação do loop (medem só com o profiler ligado, ver enable_profiling)
+        self.frame_span = profiler.timer('frame', 'loop')
+        self.update_span = profiler.timer('update_game', 'loop')
+        self.draw_span = profiler.timer('draw', 'loop')
+        if PROFILE_CAPTURE_AFTER:
+            profiler.capture_at = PROFILE_CAPTURE_AFTER
+        
+        # Background (não é desenhado no modo headless)
         self.background = None
-        self.load_background()
+        if not headless:
+            self.load_background()
         
         # Sons
         self.load_sounds()
@@ -46,20 +88,37 @@ class GameManager:
         # Variáveis do jogo
         self.score = 0
         self.level = 1
-        self.max_level = 2  # Apenas 2 fases
+        self.levels_path = levels_path  # Diretório das fases (benchmarks usam níveis sintéticos)
+        self.max_level = level_count(levels_path)  # Um arquivo por fase, de 1 a N
         self.lives = INITIAL_LIVES
         self.time_remaining = 300  # 5 minutos
         self.game_timer = 0
         
         # Grupos de sprites
         self.all_sprites = pygame.sprite.Group()
-        self.platforms = pygame.sprite.Group()
-        self.enemies = pygame.sprite.Group()
-        self.coins = pygame.sprite.Group()
+        self.platforms = SpatialGroup()
+        self.enemy_batching = self.use_enemy_batch()
+        self.enemies = self.create_enemy_group(self.platforms)
+        self.coins = SpatialGroup()
         
         # Player
         self.player = None
         
+        # Nível de detalhe da simulação (entidades longe da câmera dormem)
+        self.lod = SimulationLOD()
+        
+        # Plataformas estáticas pré-desenhadas do nível atual
+        self.static_layer = None
+        
+        # Nível em jogo (LevelScene): dados do arquivo e chunks carregados em volta da câmera
+        self.scene = None
+        self.level_data = None
+        self.world = None
+        
+        # Próximo nível montado em segundo plano durante o atual
+        self.preloader = LevelPreloader(self.create_scene, directory=levels_path)
+        self.transition_ms = None  # Duração da última troca de nível (ms)
+        
         # Interface
         self.menu_selection = 0
         self.menu_options = ["JOGAR", "SAIR"]
@@ -68,280 +127,105 @@ class GameManager:
         
         # Efeitos visuais
         self.fade_alpha = 0
+        self.fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+        self.fade_surface.fill(BLACK)
         self.transition_timer = 0
         
+        # Contadores de culling do último frame desenhado
+        self.cull_stats = {'drawn': 0, 'culled': 0}
+        
+        # Renderização por retângulos sujos (opcional)
+        self.dirty_rendering = DIRTY_RECT_RENDERING
+        self.dirty_tracker = DirtyRectTracker(self.screen.get_rect())
+        
         # Estatísticas
         self.coins_collected = 0
         self.enemies_defeated = 0
         self.best_score = 0
         
+    def use_enemy_batch(self):
+        """Se os inimigos são simulados em lote, conforme ENEMY_BACKEND"""
+        if ENEMY_BACKEND == 'numpy':
+            if NUMPY_AVAILABLE:
+                print("🧮 Inimigos simulados em lote (NumPy)")
+                return True
+            print("⚠️ NumPy não instalado: usando inimigos por objeto")
+        return False
+    
+    def create_enemy_group(self, platforms):
+        """Grupo de inimigos do backend escolhido (lote NumPy ou objetos indexados)"""
+        if self.enemy_batching:
+            return EnemyBatch(platforms)
+        return SpatialGroup()
+    
     def load_background(self):
-        """Carrega imagem de fundo sem esticar"""
-        try:
-            # Carrega a imagem original
-            original_bg = load_image(BACKGROUND_IMAGE)
-            original_width = original_bg.get_width()
-            original_height = original_bg.get_height()
-            
-            print(f"📸 Imagem de fundo original: {original_width}x{original_height}px")
-            
-            # Calcula escala mantendo proporção
-            scale_x = WORLD_WIDTH / original_width
-            scale_y = WORLD_HEIGHT / original_height
-            scale = min(scale_x, scale_y)  # Usa menor escala para não esticar
-            
-            # Redimensiona mantendo proporção
-            new_width = int(original_width * scale)
-            new_height = int(original_height * scale)
-            scaled_bg = pygame.transform.scale(original_bg, (new_width, new_height))
-            
-            print(f"📸 Imagem redimensionada: {new_width}x{new_height}px (escala: {scale:.2f})")
-            
-            # Cria superfície do mundo
-            self.background = pygame.Surface((WORLD_WIDTH, WORLD_HEIGHT))
-            
-            # Se a imagem for menor que o mundo, repete ela
-            if new_width < WORLD_WIDTH or new_height < WORLD_HEIGHT:
-                print("🔄 Repetindo imagem de fundo para preencher o mundo...")
-                
-                # Preenche com cor de céu primeiro
-                self.background.fill(SKY_BLUE)
-                
-                # Repete a imagem horizontalmente e verticalmente
-                for x in range(0, WORLD_WIDTH, new_width):
-                    for y in range(0, WORLD_HEIGHT, new_height):
-                        # Calcula área a ser copiada
-                        copy_width = min(new_width, WORLD_WIDTH - x)
-                        copy_height = min(new_height, WORLD_HEIGHT - y)
-                        
-                        if copy_width > 0 and copy_height > 0:
-                            # Cria subsuperfície se necessário
-                            if copy_width == new_width and copy_height == new_height:
-                                self.background.blit(scaled_bg, (x, y))
-                            else:
-                                sub_surface = pygame.Surface((copy_width, copy_height))
-                                sub_surface.blit(scaled_bg, (0, 0))
-                                self.background.blit(sub_surface, (x, y))
-            else:
-                # Se a imagem é maior ou igual, apenas centraliza
-                offset_x = (WORLD_WIDTH - new_width) // 2
-                offset_y = (WORLD_HEIGHT - new_height) // 2
-                self.background.fill(SKY_BLUE)
-                self.background.blit(scaled_bg, (offset_x, offset_y))
-            
-            print("✅ Fundo carregado com sucesso!")
-            
-        except Exception as e:
-            print(f"⚠️ Erro ao carregar fundo: {e}")
-            # Cria um fundo gradiente se não conseguir carregar
-            self.background = pygame.Surface((WORLD_WIDTH, WORLD_HEIGHT))
-            draw_gradient_rect(self.background, 
-                             pygame.Rect(0, 0, WORLD_WIDTH, WORLD_HEIGHT),
-                             SKY_BLUE, (135, 206, 250))
-            print("🎨 Usando fundo gradiente como fallback")
+        """Carrega o fundo com parallax (chunks montados conforme a câmera)"""
+        self.background = load_parallax_background()
     
     def load_sounds(self):
         """Carrega sons do jogo"""
         try:
-            self.coin_sound = load_sound(COIN_SOUND, 0.5)
-            self.game_over_sound = load_sound(GAME_OVER_SOUND, 0.7)
+            self.coin_sound = asset_cache.sound(COIN_SOUND, 0.5)
+            self.game_over_sound = asset_cache.sound(GAME_OVER_SOUND, 0.7)
         except:
             self.coin_sound = None
             self.game_over_sound = None
     
     def create_level(self, level_num):
-        """Cria um nível específico"""
-        # Limpa sprites existentes
-        self.all_sprites.empty()
-        self.platforms.empty()
-        self.enemies.empty()
-        self.coins.empty()
-        
-        if level_num == 1:
-            self.create_level_1()
-        elif level_num == 2:
-            self.create_level_2()
-        
-        # Cria o player
-        self.player = Player(100, SCREEN_HEIGHT - 200, self.platforms)
-        self.all_sprites.add(self.player)
-
-    def create_level_1(self):
-        """Cria o primeiro nível - Tutorial e introdução"""
-        print("🎮 Criando Nível 1 - Tutorial")
-        
-        # Plataformas básicas - tutorial de movimento (espaçamentos melhorados)
-        platforms_data = [
-            # Plataformas iniciais (tutorial)
-            (0, SCREEN_HEIGHT - 100, 300, 40, "grass"),      # Plataforma inicial
-            (350, SCREEN_HEIGHT - 150, 200, 40, "normal"),   # Primeira elevação (reduzido de 400 para 350)
-            (600, SCREEN_HEIGHT - 200, 180, 40, "wood"),     # Segunda elevação (reduzido de 700 para 600)
-            (830, SCREEN_HEIGHT - 120, 150, 40, "stone"),    # Descida (reduzido de 950 para 830)
-            
-            # Seção de saltos básicos
-            (1030, SCREEN_HEIGHT - 180, 120, 40, "normal"),  # Salto médio (reduzido de 1200 para 1030)
-            (1200, SCREEN_HEIGHT - 240, 100, 40, "wood"),    # Salto alto (reduzido de 1400 para 1200)
-            (1350, SCREEN_HEIGHT - 180, 120, 40, "grass"),   # Descida (reduzido de 1600 para 1350)
-            (1520, SCREEN_HEIGHT - 120, 200, 40, "stone"),   # Plataforma larga (reduzido de 1800 para 1520)
-            
-            # Seção de plataformas especiais
-            (1770, SCREEN_HEIGHT - 200, 80, 40, "cloud"),    # Plataforma nuvem (reduzido de 2100 para 1770)
-            (1900, SCREEN_HEIGHT - 280, 80, 40, "ice"),      # Plataforma gelo (reduzido de 2250 para 1900)
-            (2030, SCREEN_HEIGHT - 200, 100, 40, "bounce"),  # Plataforma de impulso (reduzido de 2400 para 2030)
-            (2180, SCREEN_HEIGHT - 300, 120, 40, "wood"),    # Plataforma alta (reduzido de 2600 para 2180)
-            
-            # Final do nível
-            (2350, SCREEN_HEIGHT - 160, 300, 40, "grass"),   # Plataforma final (reduzido de 2800 para 2350)
-            (2700, SCREEN_HEIGHT - 200, 200, 40, "stone"),   # Última plataforma (reduzido de 3200 para 2700)
-        ]
-        
-        # Cria plataformas
-        for x, y, width, height, platform_type in platforms_data:
-            if platform_type == "bounce":
-                platform = BouncePlatform(x, y, width, height)
-            else:
-                platform = Platform(x, y, width, height, platform_type)
-            self.platforms.add(platform)
-            self.all_sprites.add(platform)
-        
-        # Moedas do nível 1 (ajustadas para novas posições)
-        coin_positions = [
-            (400, SCREEN_HEIGHT - 200, "normal"),    # Ajustado de 450 para 400
-            (650, SCREEN_HEIGHT - 250, "bonus"),     # Ajustado de 750 para 650
-            (880, SCREEN_HEIGHT - 170, "normal"),    # Ajustado de 1000 para 880
-            (1080, SCREEN_HEIGHT - 230, "special"),  # Ajustado de 1250 para 1080
-            (1250, SCREEN_HEIGHT - 290, "bonus"),    # Ajustado de 1450 para 1250
-            (1400, SCREEN_HEIGHT - 230, "normal"),   # Ajustado de 1660 para 1400
-            (1570, SCREEN_HEIGHT - 170, "normal"),   # Ajustado de 1900 para 1570
-            (1820, SCREEN_HEIGHT - 250, "bonus"),    # Ajustado de 2150 para 1820
-            (1950, SCREEN_HEIGHT - 330, "special"),  # Ajustado de 2300 para 1950
-            (2080, SCREEN_HEIGHT - 250, "normal"),   # Ajustado de 2450 para 2080
-            (2230, SCREEN_HEIGHT - 350, "bonus"),    # Ajustado de 2660 para 2230
-            (2400, SCREEN_HEIGHT - 210, "special"),  # Ajustado de 2900 para 2400
-            (2750, SCREEN_HEIGHT - 250, "special"),  # Ajustado de 3300 para 2750
-        ]
-        
-        for x, y, coin_type in coin_positions:
-            if coin_type == "special":
-                coin = PowerUpCoin(x, y)
-            elif coin_type == "bonus":
-                coin = BonusCoin(x, y)
-            else:
-                coin = Coin(x, y)
-            self.coins.add(coin)
-            self.all_sprites.add(coin)
-        
-        # Inimigos alinhados com as plataformas (ajustados para novas posições)
-        enemy_positions = [
-            (400, SCREEN_HEIGHT - 200),   # Alinhado com plataforma wood (350-530)
-            (880, SCREEN_HEIGHT - 170),   # Alinhado com plataforma stone (830-980)
-            (1570, SCREEN_HEIGHT - 170),  # Alinhado com plataforma stone (1520-1720)
-            (2400, SCREEN_HEIGHT - 210),  # Alinhado com plataforma final (2350-2650)
-        ]
-        
-        for x, y in enemy_positions:
-            enemy = Enemy(x, y, self.platforms)
-            self.enemies.add(enemy)
-            self.all_sprites.add(enemy)
-
-    def create_level_2(self):
-        """Cria o segundo nível - Desafio Intermediário Mais Fácil"""
-        print("🎮 Criando Nível 2 - Desafio Intermediário")
-        
-        # Plataformas muito mais acessíveis (espaçamentos mínimos)
-        platforms_data = [
-            # Início com progressão muito suave
-            (0, SCREEN_HEIGHT - 100, 200, 40, "stone"),
-            (200, SCREEN_HEIGHT - 160, 150, 40, "wood"),      # Reduzido de 220 para 200, aumentado largura
-            (350, SCREEN_HEIGHT - 220, 130, 40, "normal"),    # Reduzido de 380 para 350, aumentado largura
-            (480, SCREEN_HEIGHT - 280, 120, 40, "normal"),    # Reduzido de 520 para 480, removido gelo escorregadio
-            
-            # Seção de plataformas especiais (sem obstáculos difíceis)
-            (600, SCREEN_HEIGHT - 200, 120, 40, "wood"),      # Reduzido de 640 para 600, aumentado largura
-            (720, SCREEN_HEIGHT - 280, 130, 40, "normal"),    # Reduzido de 760 para 720, mudado de cloud para normal
-            (850, SCREEN_HEIGHT - 180, 120, 40, "wood"),      # Reduzido de 890 para 850, removido disappear
-            (970, SCREEN_HEIGHT - 240, 140, 40, "normal"),    # Reduzido de 1010 para 970, removido bounce
-            
-            # Seção de desafio muito acessível
-            (1110, SCREEN_HEIGHT - 320, 120, 40, "stone"),    # Reduzido de 1150 para 1110, aumentado largura
-            (1230, SCREEN_HEIGHT - 260, 130, 40, "wood"),     # Reduzido de 1270 para 1230, aumentado largura
-            (1360, SCREEN_HEIGHT - 200, 140, 40, "normal"),   # Reduzido de 1400 para 1360, aumentado largura
-            (1500, SCREEN_HEIGHT - 280, 120, 40, "normal"),   # Reduzido de 1540 para 1500, removido gelo
-            
-            # Seção de precisão muito fácil
-            (1620, SCREEN_HEIGHT - 360, 110, 40, "normal"),   # Reduzido de 1660 para 1620, mudado de cloud para normal
-            (1730, SCREEN_HEIGHT - 300, 120, 40, "normal"),   # Reduzido de 1770 para 1730, aumentado largura
-            (1850, SCREEN_HEIGHT - 240, 130, 40, "wood"),     # Reduzido de 1890 para 1850, aumentado largura
-            (1980, SCREEN_HEIGHT - 180, 140, 40, "stone"),    # Reduzido de 2020 para 1980, aumentado largura
-            
-            # Seção final muito acessível
-            (2120, SCREEN_HEIGHT - 260, 120, 40, "normal"),   # Reduzido de 2160 para 2120, aumentado largura
-            (2240, SCREEN_HEIGHT - 200, 130, 40, "wood"),     # Reduzido de 2280 para 2240, removido bounce
-            (2370, SCREEN_HEIGHT - 280, 160, 40, "grass"),    # Reduzido de 2410 para 2370, aumentado largura
-            (2530, SCREEN_HEIGHT - 200, 220, 40, "stone"),    # Reduzido de 2570 para 2530, aumentado largura
-        ]
-        
-        # Cria plataformas simples (sem obstáculos especiais)
-        for x, y, width, height, platform_type in platforms_data:
-            platform = Platform(x, y, width, height, platform_type)
-            self.platforms.add(platform)
-            self.all_sprites.add(platform)
-        
-        # Moedas melhor distribuídas (mais fáceis de coletar)
-        coin_positions = [
-            (250, SCREEN_HEIGHT - 210, "normal"),      # Ajustado para nova posição
-            (400, SCREEN_HEIGHT - 270, "bonus"),       # Ajustado para nova posição
-            (530, SCREEN_HEIGHT - 330, "special"),     # Ajustado para nova posição
-            (650, SCREEN_HEIGHT - 250, "normal"),      # Ajustado para nova posição
-            (770, SCREEN_HEIGHT - 330, "bonus"),       # Ajustado para nova posição
-            (900, SCREEN_HEIGHT - 230, "normal"),      # Ajustado para nova posição
-            (1020, SCREEN_HEIGHT - 290, "special"),    # Ajustado para nova posição
-            (1160, SCREEN_HEIGHT - 370, "bonus"),      # Ajustado para nova posição
-            (1280, SCREEN_HEIGHT - 310, "normal"),     # Ajustado para nova posição
-            (1410, SCREEN_HEIGHT - 250, "special"),    # Ajustado para nova posição
-            (1550, SCREEN_HEIGHT - 330, "bonus"),      # Ajustado para nova posição
-            (1670, SCREEN_HEIGHT - 410, "special"),    # Ajustado para nova posição
-            (1780, SCREEN_HEIGHT - 350, "normal"),     # Ajustado para nova posição
-            (1900, SCREEN_HEIGHT - 290, "bonus"),      # Ajustado para nova posição
-            (2030, SCREEN_HEIGHT - 230, "normal"),     # Ajustado para nova posição
-            (2170, SCREEN_HEIGHT - 310, "special"),    # Ajustado para nova posição
-            (2290, SCREEN_HEIGHT - 250, "bonus"),      # Ajustado para nova posição
-            (2420, SCREEN_HEIGHT - 330, "special"),    # Ajustado para nova posição
-            (2580, SCREEN_HEIGHT - 250, "normal"),     # Ajustado para nova posição
-        ]
-        
-        for x, y, coin_type in coin_positions:
-            if coin_type == "special":
-                coin = PowerUpCoin(x, y)
-            elif coin_type == "bonus":
-                coin = BonusCoin(x, y)
-            else:
-                coin = Coin(x, y)
-            self.coins.add(coin)
-            self.all_sprites.add(coin)
-        
-        # Inimigos muito mais fáceis (ainda menos inimigos)
-        enemy_positions = [
-            (650, SCREEN_HEIGHT - 250),   # Plataforma wood
-            (1160, SCREEN_HEIGHT - 370),  # Plataforma stone
-            (1780, SCREEN_HEIGHT - 350),  # Plataforma normal
-            (2420, SCREEN_HEIGHT - 330),  # Plataforma grass
-        ]
-        
-        for x, y in enemy_positions:
-            enemy = Enemy(x, y, self.platforms)
-            enemy.health = 1  # Inimigos fracos
-            enemy.speed = ENEMY_SPEED * 0.7  # Ainda mais lentos
-            enemy.detection_range = 80  # Detecção ainda menor
-            self.enemies.add(enemy)
-            self.all_sprites.add(enemy)
-
+        """Entra no nível: usa a cena pré-carregada se houver, senão monta agora"""
+        scene = self.preloader.take(level_num)
+        if scene is None:
+            scene = self.create_scene(level_num, load_level_number(level_num, self.levels_path))
+            scene.build()
+        self.enter_scene(scene)
+        
+        # Começa a preparar o próximo nível enquanto este é jogado
+        if PRELOAD_NEXT_LEVEL and level_num < self.max_level:
+            self.preloader.start(level_num + 1)
+        
+        stats = self.world.stats()
+        print(f"🗺️ {len(self.world.entities)} entidades em {stats['chunks']} chunks ({stats['live']} carregadas)")
+        stats = asset_cache.stats()
+        print(f"📦 Cache de assets: {stats['entries']} itens, {stats['hits']} hits, {stats['misses']} misses")
+    
+    def create_scene(self, level_num, data):
+        """Cena ainda não montada do nível (ver LevelScene.build)"""
+        print(f"🎮 Criando Nível {level_num} - {data.name}")
+        return LevelScene(level_num, data, self.create_enemy_group, self.controls)
+    
+    def enter_scene(self, scene):
+        """Troca para a cena montada: só referências, tempo constante"""
+        self.scene = scene
+        self.level_data = scene.data
+        self.world = scene.world
+        self.all_sprites = scene.all_sprites
+        self.platforms = scene.platforms
+        self.coins = scene.coins
+        self.enemies = scene.enemies
+        self.static_layer = scene.static_layer
+        self.camera = scene.camera
+        self.player = scene.player
+    
     def handle_events(self):
         """Gerencia eventos do jogo"""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
             
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.perf_overlay.toggle()
+                self.dirty_tracker.invalidate()
+            
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                profiler.start_capture()
+            
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+                # Liga a instrumentação ou exporta o que está nos buffers
+                if profiler.enabled:
+                    profiler.export()
+                else:
+                    self.enable_profiling()
+            
             elif event.type == pygame.KEYDOWN:
                 if self.game_state == GAME_MENU:
                     self.handle_menu_input(event.key)
@@ -392,9 +276,10 @@ class GameManager:
         elif key == pygame.K_ESCAPE:
             self.game_state = GAME_PLAYING
     
-    def start_game(self):
-        """Inicia o jogo"""
+    def start_game(self, level=1):
+        """Inicia o jogo (a partir do nível dado)"""
         self.reset_game()
+        self.level = level
         self.create_level(self.level)
         self.game_state = GAME_PLAYING
     
@@ -414,7 +299,9 @@ class GameManager:
     def update(self):
         """Atualização principal do jogo"""
         if self.game_state == GAME_PLAYING:
+            self.update_span.start()
             self.update_game()
+            self.update_span.stop()
         
         # Atualiza efeitos visuais
         if self.screen_shake > 0:
@@ -433,30 +320,64 @@ class GameManager:
                 self.game_over()
                 return
         
-        # Atualiza sprites individualmente para controlar parâmetros
+        # Atualiza sprites individualmente para controlar parâmetros,
+        # só os que estão perto da câmera neste frame (ver SimulationLOD)
+        self.lod.begin_frame(self.camera.viewport)
+        
+        self.frame_timer.lap('update')
+        
         # Atualiza plataformas
-        self.platforms.update()
+        platforms = self.lod.select(self.platforms)
+        for platform, frames in platforms:
+            platform.update(frames)
+        self.platforms.reindex(platform for platform, _ in platforms)
+        self.frame_timer.lap('platforms')
         
         # Atualiza moedas
-        self.coins.update()
+        coins = self.lod.select(self.coins)
+        for coin, frames in coins:
+            coin.update(frames)
+        self.coins.reindex(coin for coin, _ in coins)
+        self.frame_timer.lap('coins')
         
         # Atualiza o player
         if self.player:
             self.player.update()
-        
-        # Atualiza inimigos passando o player como parâmetro
-        for enemy in self.enemies:
-            enemy.update(self.player)
-        
-        # Atualiza câmera
+        self.frame_timer.lap('player')
+        
+        # Atualiza inimigos passando o player e, para os próximos, a distância²
+        # vinda do índice espacial (os demais estão fora de alcance da IA)
+        if self.enemy_batching:
+            # Lote vetorizado: custo por inimigo já é mínimo, todos são simulados
+            self.enemies.step(self.player)
+            self.lod.count_active(len(self.enemies))
+        else:
+            enemies = self.lod.select(self.enemies)
+            # Raio da consulta: maior alcance entre os inimigos simulados
+            # (o nível pode definir detection_range acima do padrão)
+            radius = max((enemy.awareness_range for enemy, _ in enemies), default=Enemy.AWARENESS_RANGE)
+            nearby = dict(self.enemies.in_radius(self.player.rect.center, radius))
+            for enemy, frames in enemies:
+                enemy.update(self.player, nearby.get(enemy, math.inf), frames)
+            self.enemies.reindex(enemy for enemy, _ in enemies)
+        self.frame_timer.lap('enemies')
+        
+        # Atualiza câmera e os chunks carregados em volta dela
         if self.player:
             self.camera.update(self.player)
+        self.scene.stream()
+        self.frame_timer.lap('streaming')
         
         # Verifica colisões
         self.check_collisions()
+        self.frame_timer.lap('collisions')
 
         # Verifica condições de vitória/derrota
         self.check_game_conditions()
+        
+        # Monta um pouco do próximo nível (orçamento de tempo por frame)
+        self.preloader.step()
+        self.frame_timer.lap('logic')
 
     def check_collisions(self):
         """Verifica todas as colisões"""
@@ -464,8 +385,10 @@ class GameManager:
             return
         
         # Colisão jogador-moedas
-        collected_coins = pygame.sprite.spritecollide(self.player, self.coins, True)
+        collected_coins = collide_sprites(self.player, self.coins, PIXEL_PERFECT_COLLISIONS)
         for coin in collected_coins:
+            coin.consumed = True
+            coin.kill()
             self.score += coin.value
             self.coins_collected += 1
             
@@ -474,7 +397,7 @@ class GameManager:
 
         # Colisão jogador-inimigos
         if not self.player.invulnerable:
-            hit_enemies = pygame.sprite.spritecollide(self.player, self.enemies, False)
+            hit_enemies = collide_sprites(self.player, self.enemies, pixel_perfect=False)
             for enemy in hit_enemies:
                 if self.player.take_damage():
                     self.game_over()
@@ -487,9 +410,10 @@ class GameManager:
         if self.player.is_attacking:
             attack_rect = self.player.get_attack_rect()
             if attack_rect:
-                hit_enemies = [enemy for enemy in self.enemies if attack_rect.colliderect(enemy.rect)]
+                hit_enemies = collide_rect(attack_rect, self.enemies, PIXEL_PERFECT_COLLISIONS)
                 for enemy in hit_enemies:
                     if enemy.take_damage(self.player.attack_damage):
+                        enemy.consumed = True
                         self.enemies.remove(enemy)
                         self.all_sprites.remove(enemy)
                         self.enemies_defeated += 1
@@ -502,7 +426,7 @@ class GameManager:
             else:
                 self.lives -= 1
                 # Reposiciona o jogador
-                self.player.reset_position(100, SCREEN_HEIGHT - 200)
+                self.player.reset_position(*self.level_data.spawn)
                 self.screen_shake = 15
     
     def check_game_conditions(self):
@@ -510,23 +434,14 @@ class GameManager:
         if not self.player:
             return
         
-        # Verifica se chegou ao final do nível baseado no nível atual
-        if self.level == 1:
-            # Nível 1: última plataforma termina em X=2900 (2700 + 200)
-            end_position = 2900
-        elif self.level == 2:
-            # Nível 2: última plataforma termina em X=2750 (2530 + 220)
-            end_position = 2750
-        else:
-            # Fallback para outros níveis
-            end_position = WORLD_WIDTH - 200
-        
-        if self.player.rect.x >= end_position:
+        # Verifica se chegou ao final do nível (posição definida no arquivo do nível)
+        if self.player.rect.x >= self.level_data.end_x:
             print(f"🏁 Jogador chegou ao final do nível {self.level}! Posição: {self.player.rect.x}")
             self.next_level()
         
-        # Verifica se coletou todas as moedas (bônus alternativo)
-        if len(self.coins) == 0:
+        # Verifica se coletou todas as moedas do nível, carregadas ou não (bônus alternativo)
+        self.world.collect_consumed()
+        if self.world.remaining['coin'] == 0:
             print(f"🪙 Todas as moedas coletadas no nível {self.level}!")
             self.score += 1000  # Bônus por coletar tudo
             self.next_level()
@@ -540,7 +455,10 @@ class GameManager:
             self.score += self.time_remaining * 10  # Bônus de tempo
             self.time_remaining = 300  # Reset do tempo
             print(f"🆙 Avançando para nível {self.level}")
+            start = time.perf_counter()
             self.create_level(self.level)
+            self.transition_ms = (time.perf_counter() - start) * 1000
+            print(f"⏱️ Troca de nível: {self.transition_ms:.1f} ms")
             self.transition_timer = 60
             self.fade_alpha = 255
         else:
@@ -567,9 +485,28 @@ class GameManager:
     
     def draw(self):
         """Desenha tudo na tela"""
+        if self.headless:
+            return
+        
+        self.draw_span.start()
+        # Com o overlay visível a tela é redesenhada inteira (ele fica sobre tudo)
+        if self.dirty_rendering and not self.perf_overlay.visible:
+            self.draw_dirty()
+        else:
+            self.draw_frame()
+            if self.perf_overlay.visible:
+                self.perf_overlay.draw(self.screen)
+                self.frame_timer.lap('overlay')
+            pygame.display.flip()
+        self.frame_timer.lap('flip')
+        self.draw_span.stop()
+    
+    def draw_frame(self):
+        """Desenha o frame completo na superfície da tela (sem atualizar o display)"""
         # Efeito de screen shake
         shake_offset = (0, 0)
         if self.screen_shake > 0:
+            random = random_streams.stream('effects')
             shake_offset = (random.randint(-3, 3), random.randint(-3, 3))
         
         if self.game_state == GAME_MENU:
@@ -584,15 +521,67 @@ class GameManager:
         elif self.game_state == GAME_COMPLETE:
             self.draw_game_complete()
         
-        # Efeito de transição
-        if self.fade_alpha > 0:
-            fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            fade_surface.fill(BLACK)
-            fade_surface.set_alpha(self.fade_alpha)
-            self.screen.blit(fade_surface, (0, 0))
+        # Efeito de transição (opaco: só preenche; senão blend com superfície reaproveitada)
+        if self.fade_alpha >= 255:
+            self.screen.fill(BLACK)
+            self.fade_alpha -= 5
+        elif self.fade_alpha > 0:
+            self.fade_surface.set_alpha(self.fade_alpha)
+            self.screen.blit(self.fade_surface, (0, 0))
             self.fade_alpha = max(0, self.fade_alpha - 5)
+    
+    def draw_dirty(self):
+        """Modo de retângulos sujos: redesenha só o que mudou e usa display.update(rects)"""
+        tracker = self.dirty_tracker
+        
+        # Telas estáticas: só redesenha quando o conteúdo muda
+        if self.game_state != GAME_PLAYING or self.screen_shake > 0 or self.fade_alpha > 0:
+            if tracker.static_frame(self.static_screen_key()):
+                self.draw_frame()
+                pygame.display.flip()
+            return
+        
+        sprites = self.visible_sprites()
+        hud_rect = pygame.Rect(0, 0, SCREEN_WIDTH, HUD_HEIGHT)
+        camera_pos = (self.camera.camera.x, self.camera.camera.y)
+        dirty, redraw = tracker.plan(sprites, camera_pos, self.hud_state(), hud_rect)
+        
+        # Câmera rolou (ou primeira vez): redesenho completo
+        if dirty is None:
+            self.draw_frame()
+            pygame.display.flip()
+            return
+        
+        if not dirty:
+            return
         
-        pygame.display.flip()
+        # Restaura o fundo apenas nas regiões sujas
+        for rect in dirty:
+            self.screen.set_clip(rect)
+            self.draw_background()
+        self.screen.set_clip(None)
+        self.frame_timer.lap('background')
+        
+        self.draw_sprites(sprites=redraw)
+        self.frame_timer.lap('sprites')
+        if hud_rect.collidelist(dirty) != -1:
+            self.draw_hud()
+        self.frame_timer.lap('hud')
+        
+        pygame.display.update(dirty)
+    
+    def static_screen_key(self):
+        """Descreve o conteúdo de uma tela estática (None se ela muda todo frame)"""
+        if self.screen_shake > 0 or self.fade_alpha > 0:
+            return None
+        if self.game_state == GAME_MENU:
+            return (GAME_MENU,)
+        if self.game_state == GAME_PAUSED:
+            return (GAME_PAUSED, self.pause_selection)
+        if self.game_state == GAME_OVER:
+            return (GAME_OVER, self.score, self.level, self.coins_collected, self.enemies_defeated)
+        # Tela de conclusão tem partículas animadas
+        return None
     
     def draw_menu(self):
         """Desenha o menu principal - versão simplificada"""
@@ -636,80 +625,73 @@ class GameManager:
     
     def draw_game(self, shake_offset=(0, 0)):
         """Desenha o jogo"""
-        # Fundo simples
-        self.screen.fill(SKY_BLUE)
+        # Fundo e plataformas estáticas
+        self.draw_background(shake_offset)
+        self.frame_timer.lap('background')
         
-        # Se tiver imagem de fundo, desenha como pattern
-        if self.background:
-            bg_x = -(self.camera.camera.x * 0.3) % self.background.get_width()
-            self.screen.blit(self.background, (bg_x - self.background.get_width(), 0))
-            self.screen.blit(self.background, (bg_x, 0))
-            if bg_x + self.background.get_width() < SCREEN_WIDTH:
-                self.screen.blit(self.background, (bg_x + self.background.get_width(), 0))
-        
-        # Sprites
-        for sprite in self.all_sprites:
-            offset_rect = self.camera.apply(sprite)
-            offset_rect.x += shake_offset[0]
-            offset_rect.y += shake_offset[1]
-            self.screen.blit(sprite.image, offset_rect)
+        # Sprites (apenas os que intersectam a área visível)
+        self.draw_sprites(shake_offset)
+        self.frame_timer.lap('sprites')
         
         # HUD
         self.draw_hud()
+        self.frame_timer.lap('hud')
     
-    def draw_hud(self):
-        """Desenha a interface do usuário - versão simplificada"""
-        # Painel do HUD com fundo mais simples
-        hud_rect = pygame.Rect(0, 0, SCREEN_WIDTH, HUD_HEIGHT)
-        pygame.draw.rect(self.screen, (0, 0, 0, 180), hud_rect)
-        pygame.draw.rect(self.screen, WHITE, hud_rect, 2)
-        
-        margin = 20
-        y_pos = 25
-        
-        # Vidas
-        lives_text = f"Vidas: {self.lives}"
-        draw_text_left(self.screen, lives_text, 28, margin, y_pos, RED, self.font_medium)
-        
-        # Pontuação (centro)
-        score_text = f"Pontuação: {self.score:,}"
-        draw_text(self.screen, score_text, 28, SCREEN_WIDTH // 2, y_pos, GOLD, self.font_medium)
-        
-        # Nível (direita)
-        level_text = f"Nível: {self.level}/{self.max_level}"
-        draw_text_right(self.screen, level_text, 28, SCREEN_WIDTH - margin, y_pos, WHITE, self.font_medium)
-        
-        # Segunda linha
-        y_pos2 = 55
-        
-        # Tempo
-        time_minutes = self.time_remaining // 60
-        time_seconds = self.time_remaining % 60
-        time_text = f"Tempo: {time_minutes:02d}:{time_seconds:02d}"
-        time_color = RED if self.time_remaining < 60 else WHITE
-        draw_text_left(self.screen, time_text, 22, margin, y_pos2, time_color, self.font_small)
+    def draw_background(self, shake_offset=(0, 0)):
+        """Desenha o céu, a imagem de fundo com parallax e a camada de plataformas estáticas"""
+        # Fundo simples
+        self.screen.fill(SKY_BLUE)
         
-        # Estatísticas
-        stats_text = f"Moedas: {self.coins_collected} | Inimigos: {self.enemies_defeated}"
-        draw_text_right(self.screen, stats_text, 22, SCREEN_WIDTH - margin, y_pos2, LIGHT_GRAY, self.font_small)
+        # Camadas de parallax: só a janela visível de cada uma
+        if self.background:
+            self.background.draw(self.screen, self.camera.camera.x)
         
-        # Barra de vida do jogador (mais simples)
-        if self.player:
-            health_x = SCREEN_WIDTH // 2 - 75
-            health_y = y_pos2 + 5
-            health_width = 150
-            health_height = 12
-            
-            # Fundo da barra
-            pygame.draw.rect(self.screen, (100, 0, 0), (health_x, health_y, health_width, health_height))
-            
-            # Vida atual
-            current_health_width = int(health_width * (self.player.health / self.player.max_health))
-            if current_health_width > 0:
-                pygame.draw.rect(self.screen, (0, 200, 0), (health_x, health_y, current_health_width, health_height))
-            
-            # Borda
-            pygame.draw.rect(self.screen, WHITE, (health_x, health_y, health_width, health_height), 1)
+        # Plataformas estáticas (acompanham o shake como os sprites)
+        if self.static_layer:
+            offset = (self.camera.camera.x + shake_offset[0], self.camera.camera.y + shake_offset[1])
+            view = self.camera.viewport.inflate(CULLING_MARGIN * 2, CULLING_MARGIN * 2)
+            self.static_layer.draw(self.screen, offset, view)
+    
+    def visible_sprites(self):
+        """Culling: sprites que intersectam a área visível da câmera, na ordem de desenho"""
+        # Margem extra para o screen shake não cortar sprites na borda
+        view = self.camera.viewport.inflate(CULLING_MARGIN * 2, CULLING_MARGIN * 2)
+        sprites = self.all_sprites.sprites()
+        visible = [sprites[index] for index in view.collidelistall([sprite.rect for sprite in sprites])]
+        total = len(sprites)
+        
+        # Inimigos em lote: culling vetorizado, desenhados antes do jogador
+        if self.enemy_batching:
+            enemies = self.enemies.visible(view)
+            at = len(visible) - 1 if visible and visible[-1] is self.player else len(visible)
+            visible[at:at] = enemies
+            total += len(self.enemies)
+        
+        self.cull_stats['drawn'] = len(visible)
+        self.cull_stats['culled'] = total - len(visible)
+        return visible
+    
+    def draw_sprites(self, shake_offset=(0, 0), sprites=None):
+        """Desenha os sprites visíveis (ou a lista dada) com o offset da câmera"""
+        if sprites is None:
+            sprites = self.visible_sprites()
+        
+        offset_x = self.camera.camera.x + shake_offset[0]
+        offset_y = self.camera.camera.y + shake_offset[1]
+        blit = self.screen.blit
+        for sprite in sprites:
+            blit(sprite.image, (sprite.rect.x + offset_x, sprite.rect.y + offset_y))
+    
+    def hud_state(self):
+        """Valores exibidos no HUD (mudam raramente)"""
+        health = (self.player.health, self.player.max_health) if self.player else None
+        return (self.lives, self.score, self.level, self.max_level, self.time_remaining,
+                self.coins_collected, self.enemies_defeated, health)
+    
+    def draw_hud(self):
+        """Desenha a interface do usuário (painel retido, refeito só quando os valores mudam)"""
+        self.hud.update(*self.hud_state())
+        self.hud.draw(self.screen)
     
     def draw_pause_overlay(self):
         """Desenha overlay de pausa - versão simplificada"""
@@ -810,6 +792,7 @@ class GameManager:
         draw_text(self.screen, "🚪 Pressione Alt+F4 para sair do jogo", 18, SCREEN_WIDTH // 2, 655, GRAY, self.font_small)
         
         # Efeito de partículas douradas (simulado com pontos)
+        random = random_streams.stream('effects')
         for _ in range(20):
             x = random.randint(0, SCREEN_WIDTH)
             y = random.randint(0, SCREEN_HEIGHT)
@@ -821,9 +804,51 @@ class GameManager:
     def run(self):
         """Loop principal do jogo"""
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
-        
+            self.run_frame()
+            if not self.headless:
+                self.clock.tick(FPS)
+        
+        self.frame_timer.stop_stream()
+        profiler.stop_capture()
+        if profiler.enabled:
+            profiler.export()
         pygame.quit()
+    
+    def run_frame(self):
+        """Um frame: eventos, atualização e desenho, com as medições de desempenho"""
+        self.frame_span.start()
+        self.frame_timer.begin_frame()
+        self.handle_events()
+        self.frame_timer.lap('events')
+        self.update()
+        self.draw()
+        self.frame_timer.end_frame(self.frame_counts)
+        self.frame_span.stop()
+        profiler.end_frame()
+    
+    def enable_profiling(self):
+        """Liga a instrumentação: spans do loop e etapas do FrameTimer vão para o profiler"""
+        profiler.enable()
+        if profiler.record_stage not in self.frame_timer.hooks:
+            self.frame_timer.hooks.append(profiler.record_stage)
+        self.frame_timer.enable()
+    
+    def frame_counts(self):
+        """Entidades vivas e atualizadas no frame (amostras do FrameTimer)"""
+        return {
+            'platforms_live': len(self.platforms),
+            'coins_live': len(self.coins),
+            'enemies_live': len(self.enemies),
+            'sprites_live': len(self.all_sprites),
+            'ticked': self.lod.stats()['ticked'],
+        }
+    
+    def simulate(self, frames):
+        """Executa até frames atualizações o mais rápido possível; retorna estatísticas"""
+        start = time.perf_counter()
+        count = 0
+        while self.running and count < frames:
+            self.run_frame()
+            count += 1
+        elapsed = time.perf_counter() - start
+        return {'frames': count, 'seconds': elapsed, 'fps': count / elapsed if elapsed else 0.0}
@@ -0,0 +1,116 @@
+# Modo headless: simulação sem janela, para testes de resistência e medir vazão
+#
+# Uso:  python -m game.headless --frames 20000 --level 1 --input run
+#       python -m game.headless --frames 20000 --seed 7 --record partida.rec
+#       python -m game.headless --replay partida.rec
+# Roda o GameManager com drivers SDL "dummy", sem desenhar nem esperar o FPS,
+# com a entrada do jogador gerada por código ou reproduzida de uma gravação
+# (ver game.replay). Em game over ou fim de jogo a partida recomeça no mesmo
+# nível, até completar os frames pedidos (ou a gravação).
+import argparse
+import time
+import pygame
+from game.settings import *
+from game.controls import ScriptedControls
+from game.game_manager import GameManager
+from game.replay import InputRecorder, InputReplay, read_recording, write_recording, state_digest
+
+def idle_input(frame):
+    """Jogador parado"""
+    return ()
+
+def run_input(frame):
+    """Corre para a direita, volta um pouco, pula e ataca em intervalos fixos"""
+    keys = []
+    phase = frame % 300
+    if phase < 200:
+        keys.append(pygame.K_RIGHT)
+    elif phase >= 250:
+        keys.append(pygame.K_LEFT)
+    if frame % 45 == 0:
+        keys.append(pygame.K_SPACE)
+    if frame % 20 == 0:
+        keys.append(pygame.K_x)
+    return keys
+
+INPUTS = {'idle': idle_input, 'run': run_input}
+
+class PatternControls(ScriptedControls):
+    """Teclas dadas por pattern(leitura), uma leitura por atualização do jogador"""
+
+    def __init__(self, pattern):
+        super().__init__()
+        self.pattern = pattern
+        self.tick = 0
+
+    def pressed(self):
+        self.set(self.pattern(self.tick))
+        self.tick += 1
+        return self.keys
+
+def soak(frames, level=1, controls=None, seed=None):
+    """Simula até frames atualizações no nível level; retorna estatísticas da execução.
+
+    Com controls = InputReplay a simulação para quando a gravação termina.
+    """
+    controls = controls or PatternControls(run_input)
+    game = GameManager(headless=True, controls=controls, seed=seed)
+    game.start_game(level)
+
+    restarts = 0
+    ticked = 0
+    frame = 0
+    start = time.perf_counter()
+    while frame < frames and not getattr(controls, 'finished', False):
+        if game.game_state != GAME_PLAYING:
+            restarts += 1
+            game.start_game(level)
+        game.update()
+        ticked += game.lod.stats()['ticked']
+        frame += 1
+    elapsed = time.perf_counter() - start
+
+    stats = {
+        'frames': frame,
+        'seconds': elapsed,
+        'fps': frame / elapsed if elapsed else 0.0,
+        'level': game.level,
+        'score': game.score,
+        'restarts': restarts,
+        'ticked_per_frame': ticked / frame if frame else 0.0,
+        'digest': state_digest(game),
+    }
+    pygame.quit()
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Simulação headless do Super Hero')
+    parser.add_argument('--frames', type=int, default=10000, help='atualizações a simular')
+    parser.add_argument('--level', type=int, default=1, help='nível inicial')
+    parser.add_argument('--input', choices=sorted(INPUTS), default='run', help='padrão de entrada do jogador')
+    parser.add_argument('--seed', type=int, default=0, help='semente dos fluxos aleatórios')
+    parser.add_argument('--record', metavar='ARQUIVO', help='grava a entrada simulada')
+    parser.add_argument('--replay', metavar='ARQUIVO', help='reproduz uma partida gravada')
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        recording = read_recording(args.replay)
+        print(f"📼 Reproduzindo {args.replay}: {len(recording.ticks)} atualizações, "
+              f"nível {recording.level}, semente {recording.seed}")
+        stats = soak(len(recording.ticks), recording.level, InputReplay(recording.ticks), recording.seed)
+    else:
+        controls = PatternControls(INPUTS[args.input])
+        if args.record:
+            controls = InputRecorder(controls)
+        stats = soak(args.frames, args.level, controls, args.seed)
+        if args.record:
+            write_recording(args.record, controls.recording(args.seed, args.level))
+            print(f"📼 Entrada gravada em {args.record} ({len(controls.ticks)} atualizações)")
+    print(f"🤖 {stats['frames']} frames em {stats['seconds']:.2f} s "
+          f"({stats['fps']:.0f} frames/s, {stats['fps'] / FPS:.1f}x tempo real)")
+    print(f"🎮 Nível {stats['level']}, pontuação {stats['score']}, {stats['restarts']} reinícios")
+    print(f"🧠 {stats['ticked_per_frame']:.1f} entidades atualizadas por frame")
+    print(f"🔑 Estado final: {stats['digest']}")
+
+if __name__ == '__main__':
+    main()
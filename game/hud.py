@@ -0,0 +1,150 @@
+# HUD retido: superfície única refeita por widget só quando seus valores mudam
+import pygame
+from collections import deque
+from game.settings import *
+from game.utils import draw_text, draw_text_left, draw_text_right
+
+class HUD:
+    """Painel do HUD mantido numa superfície própria.
+
+    Cada widget (vidas, pontuação, nível, tempo, estatísticas, vida do
+    jogador) guarda os valores com que foi desenhado e só é redesenhado
+    quando eles mudam; por frame o custo é um único blit.
+    """
+
+    MARGIN = 20
+    LINE_1_Y = 25
+    LINE_2_Y = 55
+
+    def __init__(self, font_medium, font_small):
+        self.font_medium = font_medium
+        self.font_small = font_small
+        self.rect = pygame.Rect(0, 0, SCREEN_WIDTH, HUD_HEIGHT)
+        self.surface = pygame.Surface(self.rect.size)
+
+        # Valores e área desenhada de cada widget
+        self.inputs = {}
+        self.widget_rects = {}
+        self.needs_panel = True
+
+        # Estatísticas: widgets refeitos no total e em cada um dos últimos FPS frames
+        self.rebuilds = 0
+        self.recent_rebuilds = deque(maxlen=FPS)
+
+    def invalidate(self):
+        """Força o redesenho completo do painel na próxima atualização"""
+        self.needs_panel = True
+
+    def update(self, lives, score, level, max_level, time_remaining,
+               coins_collected, enemies_defeated, health):
+        """Refaz apenas os widgets cujos valores mudaram (health é (vida, máx) ou None)"""
+        if self.needs_panel:
+            self.draw_panel()
+
+        inputs = {
+            'lives': (lives,),
+            'score': (score,),
+            'level': (level, max_level),
+            'time': (time_remaining,),
+            'stats': (coins_collected, enemies_defeated),
+            'health': (health,),
+        }
+
+        rebuilt = 0
+        for name, values in inputs.items():
+            if self.inputs.get(name) != values:
+                self.inputs[name] = values
+                self.rebuild_widget(name, values)
+                rebuilt += 1
+
+        self.rebuilds += rebuilt
+        self.recent_rebuilds.append(rebuilt)
+        return rebuilt
+
+    def draw(self, screen):
+        """Blita o painel já pronto"""
+        screen.blit(self.surface, self.rect)
+
+    def stats(self):
+        """Widgets refeitos no total e no último segundo de frames"""
+        return {
+            'rebuilds': self.rebuilds,
+            'rebuilds_per_second': sum(self.recent_rebuilds),
+        }
+
+    def draw_panel(self):
+        """Fundo e borda do painel; todos os widgets precisam ser refeitos"""
+        self.surface.fill(BLACK)
+        pygame.draw.rect(self.surface, WHITE, self.surface.get_rect(), 2)
+        self.inputs.clear()
+        self.widget_rects.clear()
+        self.needs_panel = False
+
+    def rebuild_widget(self, name, values):
+        """Apaga a área antiga do widget e o redesenha com os novos valores"""
+        old_rect = self.widget_rects.get(name)
+        if old_rect:
+            self.surface.fill(BLACK, old_rect)
+
+        # Redesenha e registra a área tocada para a próxima limpeza
+        rect = getattr(self, 'render_' + name)(*values)
+        self.widget_rects[name] = rect
+
+    def render_lives(self, lives):
+        text = f"Vidas: {lives}"
+        draw_text_left(self.surface, text, 28, self.MARGIN, self.LINE_1_Y, RED, self.font_medium)
+        return pygame.Rect((self.MARGIN, self.LINE_1_Y), self.font_medium.size(text))
+
+    def render_score(self, score):
+        text = f"Pontuação: {score:,}"
+        draw_text(self.surface, text, 28, SCREEN_WIDTH // 2, self.LINE_1_Y, GOLD, self.font_medium)
+        rect = pygame.Rect((0, 0), self.font_medium.size(text))
+        rect.center = (SCREEN_WIDTH // 2, self.LINE_1_Y)
+        return rect
+
+    def render_level(self, level, max_level):
+        text = f"Nível: {level}/{max_level}"
+        right = SCREEN_WIDTH - self.MARGIN
+        draw_text_right(self.surface, text, 28, right, self.LINE_1_Y, WHITE, self.font_medium)
+        rect = pygame.Rect((0, self.LINE_1_Y), self.font_medium.size(text))
+        rect.right = right
+        return rect
+
+    def render_time(self, time_remaining):
+        time_minutes = time_remaining // 60
+        time_seconds = time_remaining % 60
+        text = f"Tempo: {time_minutes:02d}:{time_seconds:02d}"
+        time_color = RED if time_remaining < 60 else WHITE
+        draw_text_left(self.surface, text, 22, self.MARGIN, self.LINE_2_Y, time_color, self.font_small)
+        return pygame.Rect((self.MARGIN, self.LINE_2_Y), self.font_small.size(text))
+
+    def render_stats(self, coins_collected, enemies_defeated):
+        text = f"Moedas: {coins_collected} | Inimigos: {enemies_defeated}"
+        right = SCREEN_WIDTH - self.MARGIN
+        draw_text_right(self.surface, text, 22, right, self.LINE_2_Y, LIGHT_GRAY, self.font_small)
+        rect = pygame.Rect((0, self.LINE_2_Y), self.font_small.size(text))
+        rect.right = right
+        return rect
+
+    def render_health(self, health):
+        """Barra de vida do jogador (mais simples)"""
+        if health is None:
+            return None
+
+        current, maximum = health
+        health_x = SCREEN_WIDTH // 2 - 75
+        health_y = self.LINE_2_Y + 5
+        health_width = 150
+        health_height = 12
+
+        # Fundo da barra
+        pygame.draw.rect(self.surface, (100, 0, 0), (health_x, health_y, health_width, health_height))
+
+        # Vida atual
+        current_health_width = int(health_width * (current / maximum))
+        if current_health_width > 0:
+            pygame.draw.rect(self.surface, (0, 200, 0), (health_x, health_y, current_health_width, health_height))
+
+        # Borda
+        pygame.draw.rect(self.surface, WHITE, (health_x, health_y, health_width, health_height), 1)
+        return pygame.Rect(health_x, health_y, health_width, health_height)
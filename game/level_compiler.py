@@ -0,0 +1,96 @@
+# Compilador de níveis: pré-calcula offline o que o jogo derivaria ao carregar
+#
+# Uso offline:  python -m game.level_compiler                  (todos os level_N.json de LEVELS_PATH)
+#               python -m game.level_compiler origem destino    (um nível, .json -> .lvl ou .json)
+# Cada inimigo sai já posicionado sobre a sua plataforma, com o id dela e os
+# limites de patrulha; o nível ganha o índice de chunks do mundo em streaming
+# e o gatilho de fim (posição final) resolvido. Assim o carregamento não
+# procura plataformas nem percorre todas as entidades para montar o índice.
+import os
+import sys
+import pygame
+from game.settings import *
+from game.spatial import SpatialGrid
+from game.enemy import Enemy
+from game.world_streaming import chunk_table
+from game.level_format import LevelData, load_level, write_level, write_level_json, level_numbers
+
+class Footprint:
+    """Retângulo de uma entidade da descrição do nível (item do SpatialGrid)"""
+
+    def __init__(self, entity_id, rect):
+        self.entity_id = entity_id
+        self.rect = rect
+
+def place_enemies(entities):
+    """Cópia das entidades com cada inimigo atribuído à plataforma (ver Enemy.find_initial_platform)"""
+    grid = SpatialGrid()
+    for entity_id, spec in enumerate(entities):
+        if spec['kind'] == 'platform':
+            grid.insert(Footprint(entity_id, pygame.Rect(spec['x'], spec['y'], spec['width'], spec['height'])))
+
+    placed = []
+    for spec in entities:
+        if spec['kind'] != 'enemy':
+            placed.append(spec)
+            continue
+
+        rect = pygame.Rect(spec['x'], spec['y'], ENEMY_WIDTH, ENEMY_HEIGHT)
+        closest = None
+        min_distance = float('inf')
+        for footprint in grid.query_column(rect.centerx):
+            distance = abs(rect.bottom - footprint.rect.top)
+            if distance < min_distance:
+                min_distance = distance
+                closest = footprint
+
+        spec = {key: value for key, value in spec.items() if key not in ('platform', 'patrol')}
+        if closest:
+            # Mesma posição que Enemy.place_on_platform daria ao nascer
+            patrol_left, patrol_right = Enemy.patrol_bounds(closest)
+            rect.bottom = closest.rect.top
+            if rect.left < patrol_left:
+                rect.left = patrol_left
+            elif rect.right > patrol_right:
+                rect.right = patrol_right
+            spec.update(x=rect.x, y=rect.y, platform=closest.entity_id, patrol=(patrol_left, patrol_right))
+        placed.append(spec)
+    return placed
+
+def compile_level(level, chunk_width=WORLD_CHUNK_WIDTH):
+    """Nível compilado a partir da descrição (LevelData)"""
+    # Ids das entidades na ordem do arquivo: plataformas, moedas, inimigos
+    order = {'platform': 0, 'coin': 1, 'enemy': 2}
+    entities = sorted(level.entities, key=lambda spec: order[spec['kind']])
+
+    entities = place_enemies(entities)
+    chunks, right_edge = chunk_table(entities, chunk_width)
+    # Gatilho de fim já resolvido na leitura da descrição (ver LevelData.from_json)
+    return LevelData(level.name, level.spawn, level.end_x, entities, chunk_width, chunks, right_edge)
+
+def compile_file(source, target):
+    """Compila um arquivo de nível (formato de saída pela extensão do destino)"""
+    level = compile_level(load_level(source))
+    if target.endswith('.json'):
+        write_level_json(target, level)
+    else:
+        write_level(target, level)
+    return level
+
+def compile_levels(directory=LEVELS_PATH):
+    """Gera o .lvl compilado de cada level_N.json do diretório"""
+    for number in level_numbers(directory):
+        source = os.path.join(directory, f'level_{number}.json')
+        if not os.path.exists(source):
+            continue
+        target = os.path.join(directory, f'level_{number}.lvl')
+        level = compile_file(source, target)
+        placed = sum(1 for spec in level.entities if 'platform' in spec)
+        print(f"🗺️ Nível {number} compilado: {target} ({len(level.entities)} entidades, "
+              f"{placed} inimigos posicionados, {len(level.chunks)} chunks, {os.path.getsize(target)} bytes)")
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        compile_file(sys.argv[1], sys.argv[2])
+    else:
+        compile_levels()
@@ -0,0 +1,310 @@
+# Formato de arquivo de nível: binário versionado (mmap) + variante JSON
+#
+# Uso offline:  python -m game.level_format origem destino   (converte .json <-> .lvl)
+# O JSON é o formato de edição; o .lvl, gerado pelo compilador de níveis
+# (python -m game.level_compiler), é o que o jogo carrega quando está em dia.
+import json
+import mmap
+import os
+import re
+import struct
+import sys
+from game.settings import *
+
+LEVEL_MAGIC = b'SHLV'
+LEVEL_VERSION = 2
+LEVEL_FORMAT = 'super-hero-level'
+
+# Cabeçalho: magic, versão, tamanho do nome, spawn x/y, fim x, contagens (plataformas, moedas, inimigos),
+# índice de chunks (largura, 0 se o nível não foi compilado; número de chunks; borda direita do conteúdo)
+HEADER = struct.Struct('<4sHHiiiIIIIIi')
+# Plataforma: x, y, largura, altura, tipo, flags, destino x/y, velocidade
+PLATFORM = struct.Struct('<iiiiBBiid')
+# Moeda: x, y, tipo
+COIN = struct.Struct('<iiB')
+# Inimigo: x, y, flags dos atributos presentes, vida, velocidade, alcance de detecção,
+# plataforma inicial (id da entidade, -1 se não compilado) e limites de patrulha
+ENEMY = struct.Struct('<iiBidiiii')
+# Chunk do índice: número do chunk e quantidade de ids (seguidos de uint32 cada)
+CHUNK = struct.Struct('<iI')
+
+PLATFORM_TYPES = ('normal', 'grass', 'stone', 'wood', 'ice', 'cloud', 'lava', 'bounce')
+COIN_TYPES = ('normal', 'bonus', 'special')
+
+# Flags de plataforma
+PLATFORM_MOVING = 1
+PLATFORM_DISAPPEARING = 2
+
+# Flags de inimigo (atributos que substituem o padrão)
+ENEMY_HEALTH = 1
+ENEMY_SPEED_SET = 2
+ENEMY_DETECTION = 4
+
+LEVEL_FILE = re.compile(r'level_(\d+)\.(json|lvl)$')
+
+class LevelData:
+    """Nível carregado: nome, ponto de spawn, fim do nível e entidades (dicts de world_streaming).
+
+    Níveis compilados (game.level_compiler) trazem também o índice de chunks
+    (chunk_width, chunks, right_edge) e, nos inimigos, 'platform' e 'patrol'.
+    """
+
+    def __init__(self, name, spawn, end_x, entities, chunk_width=None, chunks=None, right_edge=None):
+        self.name = name
+        self.spawn = tuple(spawn)
+        self.end_x = end_x
+        self.entities = entities
+        self.chunk_width = chunk_width
+        self.chunks = chunks
+        self.right_edge = right_edge
+
+    @property
+    def compiled(self):
+        return self.chunks is not None
+
+    def count(self, kind):
+        return sum(1 for spec in self.entities if spec['kind'] == kind)
+
+    def to_json(self):
+        """Dicionário da variante JSON"""
+        groups = {'platform': [], 'coin': [], 'enemy': []}
+        for spec in self.entities:
+            entry = {key: value for key, value in spec.items() if key != 'kind'}
+            for key in ('end', 'patrol'):
+                if key in entry:
+                    entry[key] = list(entry[key])
+            groups[spec['kind']].append(entry)
+        data = {
+            'format': LEVEL_FORMAT,
+            'version': LEVEL_VERSION,
+            'name': self.name,
+            'spawn': list(self.spawn),
+            'end_x': self.end_x,
+            'platforms': groups['platform'],
+            'coins': groups['coin'],
+            'enemies': groups['enemy'],
+        }
+        if self.compiled:
+            data['chunk_width'] = self.chunk_width
+            data['right_edge'] = self.right_edge
+            data['chunks'] = [[index, ids] for index, ids in sorted(self.chunks.items())]
+        return data
+
+    @classmethod
+    def from_json(cls, data):
+        """Nível a partir do dicionário da variante JSON"""
+        if data.get('format') != LEVEL_FORMAT or data.get('version') != LEVEL_VERSION:
+            raise ValueError("Nível JSON inválido ou de versão diferente")
+
+        entities = []
+        for entry in data.get('platforms', ()):
+            spec = dict(entry, kind='platform')
+            spec.setdefault('type', 'normal')
+            if 'end' in spec:
+                spec['end'] = tuple(spec['end'])
+            entities.append(spec)
+        for entry in data.get('coins', ()):
+            entities.append(dict({'type': 'normal'}, **entry, kind='coin'))
+        for entry in data.get('enemies', ()):
+            spec = dict(entry, kind='enemy')
+            if 'patrol' in spec:
+                spec['patrol'] = tuple(spec['patrol'])
+            entities.append(spec)
+
+        end_x = data.get('end_x')
+        if end_x is None:
+            # Sem fim explícito: borda direita da última plataforma
+            end_x = max((spec['x'] + spec['width'] for spec in entities if spec['kind'] == 'platform'),
+                        default=WORLD_WIDTH - 200)
+
+        chunks = None
+        if 'chunks' in data:
+            chunks = {index: ids for index, ids in data['chunks']}
+        return cls(data.get('name', ''), data['spawn'], end_x, entities,
+                   data.get('chunk_width'), chunks, data.get('right_edge'))
+
+def write_level(path, level):
+    """Grava o nível no formato binário"""
+    platforms = [spec for spec in level.entities if spec['kind'] == 'platform']
+    coins = [spec for spec in level.entities if spec['kind'] == 'coin']
+    enemies = [spec for spec in level.entities if spec['kind'] == 'enemy']
+    name = level.name.encode('utf-8')
+    chunks = sorted(level.chunks.items()) if level.compiled else []
+
+    # Ids das entidades seguem a ordem do arquivo (plataformas, moedas, inimigos)
+    if level.entities != platforms + coins + enemies:
+        raise ValueError("Entidades do nível precisam estar na ordem plataformas, moedas, inimigos")
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(LEVEL_MAGIC, LEVEL_VERSION, len(name), level.spawn[0], level.spawn[1],
+                            level.end_x, len(platforms), len(coins), len(enemies),
+                            level.chunk_width or 0, len(chunks), level.right_edge or 0))
+        f.write(name)
+
+        for spec in platforms:
+            flags = 0
+            end_x, end_y = spec.get('end', (0, 0))
+            if 'end' in spec:
+                flags |= PLATFORM_MOVING
+            if spec.get('disappearing'):
+                flags |= PLATFORM_DISAPPEARING
+            f.write(PLATFORM.pack(spec['x'], spec['y'], spec['width'], spec['height'],
+                                  PLATFORM_TYPES.index(spec['type']), flags,
+                                  end_x, end_y, spec.get('speed', 2)))
+
+        for spec in coins:
+            f.write(COIN.pack(spec['x'], spec['y'], COIN_TYPES.index(spec['type'])))
+
+        for spec in enemies:
+            flags = ((ENEMY_HEALTH if 'health' in spec else 0) |
+                     (ENEMY_SPEED_SET if 'speed' in spec else 0) |
+                     (ENEMY_DETECTION if 'detection_range' in spec else 0))
+            patrol_left, patrol_right = spec.get('patrol', (0, 0))
+            f.write(ENEMY.pack(spec['x'], spec['y'], flags, spec.get('health', 0),
+                               spec.get('speed', 0.0), spec.get('detection_range', 0),
+                               spec.get('platform', -1), patrol_left, patrol_right))
+
+        for index, ids in chunks:
+            f.write(CHUNK.pack(index, len(ids)))
+            f.write(struct.pack(f'<{len(ids)}I', *ids))
+
+def read_level(path):
+    """Lê um nível binário (mapeado em memória, registros desempacotados em bloco)"""
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        magic, version = struct.unpack_from('<4sH', data, 0)
+        if magic != LEVEL_MAGIC or version != LEVEL_VERSION:
+            raise ValueError(f"Nível inválido ou de versão diferente: {path}")
+        (_, _, name_len, spawn_x, spawn_y, end_x, platform_count, coin_count, enemy_count,
+         chunk_width, chunk_count, right_edge) = HEADER.unpack_from(data, 0)
+
+        pos = HEADER.size
+        name = bytes(data[pos:pos + name_len]).decode('utf-8')
+        pos += name_len
+
+        view = memoryview(data)
+        try:
+            entities = []
+            end = pos + PLATFORM.size * platform_count
+            for x, y, width, height, type_code, flags, end_x_, end_y_, speed in PLATFORM.iter_unpack(view[pos:end]):
+                spec = {'kind': 'platform', 'x': x, 'y': y, 'width': width, 'height': height,
+                        'type': PLATFORM_TYPES[type_code]}
+                if flags & PLATFORM_MOVING:
+                    spec['end'] = (end_x_, end_y_)
+                    spec['speed'] = speed
+                if flags & PLATFORM_DISAPPEARING:
+                    spec['disappearing'] = True
+                entities.append(spec)
+
+            pos, end = end, end + COIN.size * coin_count
+            entities.extend({'kind': 'coin', 'x': x, 'y': y, 'type': COIN_TYPES[type_code]}
+                            for x, y, type_code in COIN.iter_unpack(view[pos:end]))
+
+            pos, end = end, end + ENEMY.size * enemy_count
+            for (x, y, flags, health, speed, detection_range,
+                 platform, patrol_left, patrol_right) in ENEMY.iter_unpack(view[pos:end]):
+                spec = {'kind': 'enemy', 'x': x, 'y': y}
+                if flags & ENEMY_HEALTH:
+                    spec['health'] = health
+                if flags & ENEMY_SPEED_SET:
+                    spec['speed'] = speed
+                if flags & ENEMY_DETECTION:
+                    spec['detection_range'] = detection_range
+                if platform >= 0:
+                    spec['platform'] = platform
+                    spec['patrol'] = (patrol_left, patrol_right)
+                entities.append(spec)
+
+            # Índice de chunks pré-calculado
+            chunks = None
+            if chunk_width:
+                chunks = {}
+                pos = end
+                for _ in range(chunk_count):
+                    index, count = CHUNK.unpack_from(data, pos)
+                    pos += CHUNK.size
+                    chunks[index] = list(struct.unpack_from(f'<{count}I', data, pos))
+                    pos += 4 * count
+        finally:
+            view.release()
+
+    return LevelData(name, (spawn_x, spawn_y), end_x, entities,
+                     chunk_width or None, chunks, right_edge if chunk_width else None)
+
+def write_level_json(path, level):
+    """Grava o nível na variante JSON"""
+    data = level.to_json()
+    lines = []
+    for key, value in data.items():
+        if isinstance(value, list) and value and isinstance(value[0], dict):
+            # Uma entidade por linha (fácil de editar e de comparar em diffs)
+            entries = ',\n'.join('    ' + json.dumps(entry, ensure_ascii=False) for entry in value)
+            lines.append(f'  {json.dumps(key)}: [\n{entries}\n  ]')
+        else:
+            lines.append(f'  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{\n' + ',\n'.join(lines) + '\n}\n')
+
+def read_level_json(path):
+    """Lê um nível na variante JSON"""
+    with open(path, encoding='utf-8') as f:
+        return LevelData.from_json(json.load(f))
+
+def load_level(path):
+    """Lê um nível pelo formato indicado na extensão (.lvl ou .json)"""
+    if path.endswith('.json'):
+        return read_level_json(path)
+    return read_level(path)
+
+def convert(source, target):
+    """Converte entre as variantes (formato pela extensão)"""
+    level = load_level(source)
+    if target.endswith('.json'):
+        write_level_json(target, level)
+    else:
+        write_level(target, level)
+    return level
+
+def level_numbers(directory=LEVELS_PATH):
+    """Números dos níveis presentes no diretório (level_N.json ou level_N.lvl)"""
+    if not os.path.isdir(directory):
+        return []
+    numbers = set()
+    for filename in os.listdir(directory):
+        match = LEVEL_FILE.match(filename)
+        if match:
+            numbers.add(int(match.group(1)))
+    return sorted(numbers)
+
+def level_count(directory=LEVELS_PATH):
+    """Número de fases: os níveis precisam ir de 1 a N sem lacunas (ValueError se não)"""
+    numbers = level_numbers(directory)
+    if numbers != list(range(1, len(numbers) + 1)):
+        raise ValueError(f"Níveis em {directory} devem ser numerados de 1 a N sem lacunas: "
+                         f"encontrados {numbers}")
+    return len(numbers)
+
+def level_path(number, directory=LEVELS_PATH):
+    """Arquivo do nível: o binário se estiver em dia com o JSON, senão o JSON"""
+    binary = os.path.join(directory, f'level_{number}.lvl')
+    source = os.path.join(directory, f'level_{number}.json')
+    if os.path.exists(binary) and (not os.path.exists(source) or
+                                   os.path.getmtime(binary) >= os.path.getmtime(source)):
+        return binary
+    return source
+
+def load_level_number(number, directory=LEVELS_PATH):
+    """Nível pelo número: o binário se estiver em dia e for legível, senão o JSON"""
+    path = level_path(number, directory)
+    if path.endswith('.lvl'):
+        try:
+            return read_level(path)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"⚠️ Ignorando nível compilado {path}: {e}")
+            path = os.path.join(directory, f'level_{number}.json')
+    return read_level_json(path)
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print("Uso: python -m game.level_format origem.(json|lvl) destino.(json|lvl)")
+        sys.exit(1)
+    convert(sys.argv[1], sys.argv[2])
@@ -0,0 +1,84 @@
+# Pré-carregamento do próximo nível enquanto o atual é jogado
+import struct
+import threading
+from game.settings import *
+from game.level_format import load_level_number
+
+class LevelPreloader:
+    """Prepara uma LevelScene em segundo plano.
+
+    Uma thread lê e decodifica o arquivo do nível (E/S, sem pygame); depois
+    a cena é montada na thread principal, em passos de até budget segundos
+    por frame (texturas, sprites e camada estática usam pygame, que não é
+    seguro entre threads). take() entrega a cena pronta, terminando o que
+    faltar se a transição chegar antes.
+    """
+
+    def __init__(self, make_scene, budget=PRELOAD_FRAME_BUDGET, directory=LEVELS_PATH):
+        self.make_scene = make_scene  # (número, LevelData) -> LevelScene
+        self.budget = budget
+        self.directory = directory
+        self.reset()
+
+    def reset(self):
+        self.number = None
+        self.thread = None
+        self.data = None
+        self.error = None
+        self.scene = None
+
+    def start(self, number):
+        """Começa a preparar o nível number (descarta outro em preparo)"""
+        if self.number == number:
+            return
+        self.reset()
+        self.number = number
+        self.thread = threading.Thread(target=self.read, args=(number,), daemon=True,
+                                       name=f'level-preload-{number}')
+        self.thread.start()
+
+    def read(self, number):
+        """Thread de leitura: só E/S e decodificação do arquivo"""
+        try:
+            self.data = load_level_number(number, self.directory)
+        except (OSError, ValueError, struct.error) as e:
+            self.error = e
+
+    def step(self):
+        """Avança a preparação (uma vez por frame, dentro do orçamento)"""
+        if self.number is None or (self.scene is not None and self.scene.ready):
+            return
+        if self.scene is None:
+            if self.thread.is_alive() or not self.create_scene():
+                return
+        self.scene.build(self.budget)
+
+    def create_scene(self):
+        if self.data is None:
+            print(f"⚠️ Pré-carregamento do nível {self.number} falhou: {self.error}")
+            self.reset()
+            return False
+        self.scene = self.make_scene(self.number, self.data)
+        return True
+
+    def take(self, number):
+        """Cena pronta do nível number, ou None se ele não estava em preparo"""
+        if self.number != number:
+            return None
+        if self.scene is None:
+            self.thread.join()
+            if not self.create_scene():
+                return None
+        self.scene.build()
+        scene = self.scene
+        self.reset()
+        return scene
+
+    @property
+    def progress(self):
+        """'lendo', 'montando', 'pronto' ou None"""
+        if self.number is None:
+            return None
+        if self.scene is None:
+            return 'lendo'
+        return 'pronto' if self.scene.ready else 'montando'
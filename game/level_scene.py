@@ -0,0 +1,122 @@
+# Conteúdo de um nível em jogo: grupos, mundo em streaming, camada estática, jogador e câmera
+import time
+import pygame
+from game.settings import *
+from game.utils import Camera, random_streams
+from game.player import Player
+from game.static_layer import StaticGeometryLayer
+from game.spatial import SpatialGroup
+from game.enemy_batch import EnemyBatch
+from game.world_streaming import WorldStreamer, create_entity
+
+class LevelScene:
+    """Tudo o que um nível cria para ser jogado, montado fora do GameManager.
+
+    A montagem é um gerador de passos pequenos (build): pode rodar inteira
+    de uma vez ou aos poucos, alguns milissegundos por frame, enquanto outro
+    nível é jogado (ver LevelPreloader). Pronta a cena, o GameManager só
+    troca as referências para ela, sem nada a construir na transição.
+    """
+
+    def __init__(self, number, data, enemy_group, controls=None):
+        self.number = number
+        self.data = data
+        self.controls = controls
+
+        # Fluxo aleatório próprio: a montagem em segundo plano (LevelPreloader)
+        # não altera os sorteios do nível em jogo
+        self.random = random_streams.stream(f'level-{number}')
+
+        # Grupos de sprites (enemy_group recebe o grupo de plataformas)
+        self.all_sprites = pygame.sprite.Group()
+        self.platforms = SpatialGroup()
+        self.coins = SpatialGroup()
+        self.enemies = enemy_group(self.platforms)
+        self.enemy_batching = isinstance(self.enemies, EnemyBatch)
+
+        # Plataformas estáticas são assadas por chunk conforme carregam
+        self.static_layer = StaticGeometryLayer()
+        self.camera = Camera(WORLD_WIDTH, WORLD_HEIGHT)
+        self.world = None
+        self.player = None
+
+        self.ready = False
+        self.steps = self.build_steps()
+
+    def build(self, budget=None):
+        """Avança a montagem (até budget segundos, ou até o fim); retorna True quando pronta"""
+        start = time.perf_counter()
+        for _ in self.steps:
+            if budget is not None and time.perf_counter() - start >= budget:
+                break
+        return self.ready
+
+    def build_steps(self):
+        """Passos da montagem: mundo, jogador e chunks em volta do spawn"""
+        data = self.data
+        if data.compiled and data.chunk_width == WORLD_CHUNK_WIDTH:
+            # Índice de chunks pré-calculado pelo compilador de níveis
+            self.world = WorldStreamer(data.entities, self.spawn_entity,
+                                       chunks=data.chunks, right_edge=data.right_edge)
+        else:
+            self.world = WorldStreamer(data.entities, self.spawn_entity)
+        self.camera.set_bounds(self.world.extent, WORLD_HEIGHT)
+        yield
+
+        self.player = Player(*data.spawn, self.platforms, self.controls)
+        self.player.world_width = self.world.extent
+        self.all_sprites.add(self.player)
+        self.camera.update(self.player)
+        yield
+
+        yield from self.stream_steps()
+        self.ready = True
+
+    def spawn_entity(self, spec, state):
+        """Cria o sprite de uma entidade de chunk carregado e o registra nos grupos"""
+        # Inimigo de nível compilado: plataforma e patrulha já conhecidas
+        placement = None
+        ground = self.world.live.get(spec['platform']) if 'platform' in spec else None
+        if ground is not None:
+            placement = (ground, *spec['patrol'])
+
+        sprite = create_entity(spec, self.platforms, state, placement, self.random)
+        kind = spec['kind']
+        if kind == 'platform':
+            self.platforms.add(sprite)
+            # Estáticas são desenhadas pela camada pré-desenhada
+            if not sprite.is_static():
+                self.all_sprites.add(sprite)
+        elif kind == 'coin':
+            self.coins.add(sprite)
+            self.all_sprites.add(sprite)
+        else:
+            self.enemies.add(sprite)
+            # Inimigos em lote são desenhados a partir do EnemyBatch (ver visible_sprites)
+            if not self.enemy_batching:
+                self.all_sprites.add(sprite)
+        return sprite
+
+    def stream(self):
+        """Carrega/libera chunks conforme a câmera (uma vez por frame)"""
+        for _ in self.stream_steps():
+            pass
+
+    def stream_steps(self):
+        """Streaming em passos: entidades criadas e colunas da camada estática refeitas"""
+        changed = []
+        yield from self.world.stream(self.camera.viewport, changed)
+        if not changed:
+            return
+
+        for left, right in changed:
+            left, right = self.static_layer.column_bounds(left, right)
+            static_platforms = [platform for platform in self.platforms.in_span(left, right)
+                                if platform.is_static()]
+            self.static_layer.refresh(left, right, static_platforms)
+            yield
+
+        # O jogador continua sendo desenhado por cima do que acabou de carregar
+        if self.player:
+            self.all_sprites.remove(self.player)
+            self.all_sprites.add(self.player)
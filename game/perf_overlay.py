@@ -0,0 +1,179 @@
+# Overlay de desempenho: tempo de cada etapa do frame, percentis, contagens e misses de cache
+import csv
+import time
+import pygame
+from collections import deque
+from game.settings import *
+from game.utils import asset_cache, text_cache, mask_cache
+
+# Etapas do frame, na ordem em que acontecem (ver FrameTimer.lap)
+STAGES = ('events', 'update', 'platforms', 'coins', 'player', 'enemies', 'streaming',
+          'collisions', 'logic', 'background', 'sprites', 'hud', 'overlay', 'flip')
+
+def cache_misses():
+    """Misses dos caches (assets, textos, máscaras) até agora: cada um cria uma superfície
+    ou máscara; superfícies criadas direto com pygame.Surface no desenho não entram"""
+    return asset_cache.misses + text_cache.misses + mask_cache.misses
+
+class FrameTimer:
+    """Divide o tempo de cada frame entre as etapas do loop do jogo.
+
+    O GameManager chama lap(etapa) ao fim de cada etapa: o tempo desde a
+    marca anterior vai para ela. Desligado, begin_frame, lap e end_frame
+    só testam um atributo e retornam. Ligado, guarda as últimas
+    PERF_WINDOW amostras (percentis móveis) e pode gravar todas num CSV.
+    Ganchos em hooks recebem (etapa, início, fim) de cada etapa (ver
+    Profiler.record_stage).
+    """
+
+    def __init__(self, window=PERF_WINDOW):
+        self.enabled = False
+        self.samples = deque(maxlen=window)
+        self.frame = 0
+        self.stages = dict.fromkeys(STAGES, 0.0)
+        self.frame_start = 0.0
+        self.mark = 0.0
+        self.miss_base = 0
+        self.stream = None
+        self.writer = None
+        self.hooks = []
+
+    def enable(self, enabled=True):
+        """Liga/desliga a medição (o frame em andamento é descartado)"""
+        self.enabled = enabled
+        self.frame_start = 0.0
+
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.stages = dict.fromkeys(STAGES, 0.0)
+        self.frame_start = self.mark = time.perf_counter()
+        self.miss_base = cache_misses()
+
+    def lap(self, stage):
+        """Fim da etapa stage: soma a ela o tempo desde a marca anterior"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.stages[stage] += now - self.mark
+        for hook in self.hooks:
+            hook(stage, self.mark, now)
+        self.mark = now
+
+    def end_frame(self, counts=None):
+        """Fecha o frame (counts: função que devolve as contagens de entidades)"""
+        if not self.enabled or not self.frame_start:
+            return
+        self.frame += 1
+        sample = {'frame': self.frame, 'total_ms': (self.mark - self.frame_start) * 1000}
+        for stage, seconds in self.stages.items():
+            sample[stage] = seconds * 1000
+        sample['cache_misses'] = cache_misses() - self.miss_base
+        if counts:
+            sample.update(counts())
+        self.samples.append(sample)
+
+        if self.stream:
+            if self.writer is None:
+                self.writer = csv.DictWriter(self.stream, fieldnames=list(sample))
+                self.writer.writeheader()
+            self.writer.writerow(sample)
+
+    def start_stream(self, path):
+        """Grava todas as amostras seguintes em path (CSV, uma linha por frame)"""
+        self.stop_stream()
+        self.stream = open(path, 'w', newline='', encoding='utf-8')
+        self.enable()
+        print(f"📈 Gravando amostras de desempenho em {path}")
+
+    def stop_stream(self):
+        if self.stream:
+            self.stream.close()
+        self.stream = None
+        self.writer = None
+
+    @property
+    def needed(self):
+        """Há quem use as medições além do overlay (gravação ou ganchos)"""
+        return self.stream is not None or bool(self.hooks)
+
+    def percentiles(self):
+        """p50/p95/p99 do tempo de frame (ms) na janela de amostras"""
+        totals = sorted(sample['total_ms'] for sample in self.samples)
+        if not totals:
+            return {'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
+        last = len(totals) - 1
+        return {f'p{p}': totals[min(last, int(p / 100 * len(totals)))] for p in (50, 95, 99)}
+
+    def summary(self):
+        """Médias da janela: tempo de frame, de cada etapa, contagens e misses de cache por frame"""
+        if not self.samples:
+            return {}
+        count = len(self.samples)
+        summary = {key: sum(sample[key] for sample in self.samples) / count
+                   for key in self.samples[-1] if key != 'frame'}
+        summary.update(self.percentiles())
+        summary['fps'] = 1000 / summary['total_ms'] if summary['total_ms'] else 0.0
+        return summary
+
+class PerfOverlay:
+    """Painel com o resumo do FrameTimer, refeito a cada PERF_OVERLAY_REFRESH frames"""
+
+    WIDTH = 330
+    LINE_HEIGHT = 17
+    BAR_WIDTH = 120
+
+    def __init__(self, timer):
+        self.timer = timer
+        self.font = pygame.font.Font(None, 18)
+        self.visible = False
+        self.frames = 0
+        lines = len(STAGES) + 4
+        self.rect = pygame.Rect(SCREEN_WIDTH - self.WIDTH - 10, HUD_HEIGHT + 10,
+                                self.WIDTH, lines * self.LINE_HEIGHT + 12)
+        self.surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+
+    def toggle(self):
+        self.visible = not self.visible
+        # O timer continua ligado se as amostras estiverem sendo gravadas
+        self.timer.enable(self.visible or self.timer.needed)
+        self.frames = 0
+        print(f"📊 Overlay de desempenho {'ligado' if self.visible else 'desligado'}")
+
+    def draw(self, screen):
+        if self.frames % PERF_OVERLAY_REFRESH == 0:
+            self.rebuild()
+        self.frames += 1
+        screen.blit(self.surface, self.rect)
+
+    def rebuild(self):
+        """Redesenha o painel (fora do cache de textos, para não contar como superfície do jogo)"""
+        self.surface.fill(UI_BG_COLOR)
+        summary = self.timer.summary()
+        if not summary:
+            return
+
+        y = 6
+        frame_ms = summary['total_ms']
+        self.text(f"Frame {frame_ms:.2f} ms ({summary['fps']:.0f} FPS)", 8, y, WHITE)
+        y += self.LINE_HEIGHT
+        self.text(f"p50 {summary['p50']:.2f}  p95 {summary['p95']:.2f}  p99 {summary['p99']:.2f} ms", 8, y, LIGHT_GRAY)
+        y += self.LINE_HEIGHT
+
+        for stage in STAGES:
+            ms = summary[stage]
+            share = ms / frame_ms if frame_ms else 0.0
+            color = RED if share > 0.3 else YELLOW if share > 0.1 else GREEN
+            self.text(stage, 8, y, LIGHT_GRAY)
+            self.text(f"{ms:.2f}", 100, y, WHITE)
+            pygame.draw.rect(self.surface, color, (160, y + 3, max(1, int(self.BAR_WIDTH * share)), 10))
+            y += self.LINE_HEIGHT
+
+        self.text(f"Plataformas {summary.get('platforms_live', 0):.0f}  moedas {summary.get('coins_live', 0):.0f}  "
+                  f"inimigos {summary.get('enemies_live', 0):.0f}", 8, y, LIGHT_GRAY)
+        y += self.LINE_HEIGHT
+        self.text(f"Sprites {summary.get('sprites_live', 0):.0f}  atualizados {summary.get('ticked', 0):.0f}  "
+                  f"misses de cache/frame {summary['cache_misses']:.2f}", 8, y, LIGHT_GRAY)
+
+    def text(self, text, x, y, color):
+        self.surface.blit(self.font.render(text, True, color), (x, y))
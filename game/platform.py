@@ -1,11 +1,17 @@
 import pygame
 import math
 from game.settings import *
-from game.utils import load_image
+from game.utils import asset_cache, mask_cache, random_streams
+
+# Tipos cuja textura nunca muda depois de criada (sem animação)
+STATIC_PLATFORM_TYPES = ('normal', 'grass', 'stone', 'wood')
 
 class Platform(pygame.sprite.Sprite):
     """Classe base para plataformas"""
     
+    # Plataformas fixas são indexadas uma única vez (ver SpatialGroup)
+    moves = False
+    
     def __init__(self, x, y, width, height, platform_type='normal'):
         super().__init__()
         
@@ -14,12 +20,11 @@ class Platform(pygame.sprite.Sprite):
         self.height = height
         self.platform_type = platform_type
         
-        # Cria a imagem da plataforma
+        # Cria a imagem da plataforma (compartilhada entre plataformas iguais)
         self.create_platform_image()
         
-        # Posição
+        # Posição (colisão usa o rect; a máscara só é criada se for pedida)
         self.rect = pygame.Rect(x, y, width, height)
-        self.mask = pygame.mask.from_surface(self.image)
         
         # Propriedades específicas do tipo
         self.setup_platform_properties()
@@ -28,8 +33,44 @@ class Platform(pygame.sprite.Sprite):
         self.animation_timer = 0
         self.glow_intensity = 0
         
+        # O brilho do gelo é desenhado no lugar (ver DirtyRectTracker)
+        self.dirty_tracking = platform_type != 'ice'
+    
+    @property
+    def mask(self):
+        """Máscara de colisão da imagem atual (compartilhada, calculada sob demanda)"""
+        return mask_cache.mask(self.image)
+    
+    def texture_name(self):
+        """Nome da textura procedural no cache"""
+        return self.platform_type
+    
+    def texture_key(self, variant=None):
+        """Chave da textura (tipo, tamanho e variante) no cache de assets"""
+        return ('platform', self.texture_name(), (self.width, self.height), None, variant)
+    
     def create_platform_image(self):
-        """Cria a imagem da plataforma baseada no tipo"""
+        """Usa a textura do cache, desenhando-a só na primeira plataforma de cada tipo/tamanho"""
+        self.base_image = asset_cache.get(self.texture_key(), self.render_platform_image)
+        self.set_texture(self.base_image)
+    
+    def texture_variant(self, variant, builder):
+        """Variante da textura base (ex.: frame de animação), criada uma vez por tipo/tamanho"""
+        return asset_cache.get(self.texture_key(variant), lambda: builder(self.base_image))
+    
+    def set_texture(self, image):
+        """Exibe uma textura compartilhada do cache"""
+        self.image = image
+        self.owns_image = False
+    
+    def own_image(self):
+        """Copia a textura compartilhada antes de alterá-la no lugar"""
+        if not self.owns_image:
+            self.image = self.image.copy()
+            self.owns_image = True
+    
+    def render_platform_image(self):
+        """Desenha a textura procedural da plataforma baseada no tipo"""
         self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         
         if self.platform_type == 'grass':
@@ -46,6 +87,7 @@ class Platform(pygame.sprite.Sprite):
             self.create_lava_platform()
         else:
             self.create_normal_platform()
+        return self.image
     
     def create_normal_platform(self):
         """Cria plataforma normal com textura melhorada"""
@@ -128,12 +170,12 @@ class Platform(pygame.sprite.Sprite):
         ice_surface.fill(ice_color)
         self.image.blit(ice_surface, (0, 0))
         
-        # Efeitos de cristal
+        # Efeitos de cristal (uma única superfície reaproveitada)
+        crystal_color = (200, 230, 255, 150)
+        crystal_surface = pygame.Surface((15, 10), pygame.SRCALPHA)
+        crystal_surface.fill(crystal_color)
         for i in range(0, self.width, 20):
             for j in range(0, self.height, 15):
-                crystal_color = (200, 230, 255, 150)
-                crystal_surface = pygame.Surface((15, 10), pygame.SRCALPHA)
-                crystal_surface.fill(crystal_color)
                 self.image.blit(crystal_surface, (i, j))
         
         # Brilho
@@ -180,6 +222,10 @@ class Platform(pygame.sprite.Sprite):
         # Bordas escuras
         pygame.draw.rect(self.image, (100, 0, 0), (0, 0, self.width, self.height), 3)
     
+    def is_static(self):
+        """Plataforma que nunca se move nem muda de textura (pode ser assada na camada estática)"""
+        return type(self) is Platform and self.platform_type in STATIC_PLATFORM_TYPES
+    
     def setup_platform_properties(self):
         """Configura propriedades específicas do tipo de plataforma"""
         self.friction = 1.0
@@ -198,8 +244,13 @@ class Platform(pygame.sprite.Sprite):
         elif self.platform_type == 'wood':
             self.friction = 0.8
     
-    def update(self):
-        """Atualização da plataforma"""
+    def update(self, frames=1):
+        """Avança frames passos (mais de um longe da câmera, ver SimulationLOD)"""
+        for _ in range(frames):
+            self.step()
+    
+    def step(self):
+        """Um frame da plataforma"""
         self.animation_timer += 1
         
         # Animações específicas por tipo
@@ -213,34 +264,46 @@ class Platform(pygame.sprite.Sprite):
     def animate_lava(self):
         """Anima a plataforma de lava"""
         if self.animation_timer % 20 == 0:  # Atualiza a cada 20 frames
-            # Recria o efeito de borbulhamento
-            self.create_lava_platform()
-            
-            # Adiciona brilho variável
-            glow_intensity = abs(math.sin(self.animation_timer * 0.1)) * 50
-            glow_surface = pygame.Surface((self.width, 8), pygame.SRCALPHA)
-            glow_color = (255, 100, 0, int(glow_intensity))
-            glow_surface.fill(glow_color)
-            self.image.blit(glow_surface, (0, 0), special_flags=pygame.BLEND_ADD)
+            # Brilho variável: um frame em cache por intensidade
+            glow_alpha = int(abs(math.sin(self.animation_timer * 0.1)) * 50)
+            self.set_texture(self.texture_variant(('glow', glow_alpha),
+                                                  lambda base: self.create_lava_glow(base, glow_alpha)))
+    
+    def create_lava_glow(self, base, glow_alpha):
+        """Frame da lava: textura base com brilho aditivo no topo"""
+        image = base.copy()
+        glow_surface = pygame.Surface((self.width, 8), pygame.SRCALPHA)
+        glow_surface.fill((255, 100, 0, glow_alpha))
+        image.blit(glow_surface, (0, 0), special_flags=pygame.BLEND_ADD)
+        return image
     
     def animate_cloud(self):
         """Anima a plataforma de nuvem"""
         # Efeito de flutuação suave
         if self.animation_timer % 120 == 0:  # A cada 2 segundos
-            self.create_cloud_platform()
-            
-            # Adiciona brilho sutil
+            # Adiciona brilho sutil: um frame em cache por transparência
             alpha_variation = abs(math.sin(self.animation_timer * 0.05)) * 30
-            self.image.set_alpha(int(200 + alpha_variation))
+            alpha = int(200 + alpha_variation)
+            self.set_texture(self.texture_variant(('alpha', alpha),
+                                                  lambda base: self.create_alpha_frame(base, alpha)))
+    
+    @staticmethod
+    def create_alpha_frame(base, alpha):
+        """Frame da nuvem: textura base com transparência global"""
+        image = base.copy()
+        image.set_alpha(alpha)
+        return image
     
     def animate_ice(self):
         """Anima a plataforma de gelo"""
         if self.animation_timer % 60 == 0:  # A cada segundo
+            # Brilhos aleatórios acumulam na própria cópia da textura
+            self.own_image()
             # Efeito de cristalização
             sparkle_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
             
             # Adiciona pequenos brilhos aleatórios
-            import random
+            random = random_streams.stream('platforms')
             for _ in range(3):
                 x = random.randint(5, self.width - 5)
                 y = random.randint(5, self.height - 5)
@@ -288,6 +351,9 @@ class Platform(pygame.sprite.Sprite):
 class MovingPlatform(Platform):
     """Plataforma que se move com física avançada"""
     
+    # Reposicionada no índice espacial a cada update (ver SpatialGroup)
+    moves = True
+    
     def __init__(self, x, y, width, height, start_pos, end_pos, speed=2, platform_type='normal'):
         super().__init__(x, y, width, height, platform_type)
         
@@ -312,9 +378,9 @@ class MovingPlatform(Platform):
         self.pause_timer = 0
         self.pause_duration = 60  # Pausa nos pontos finais
         
-    def update(self):
+    def step(self):
         """Atualiza movimento da plataforma com física suave"""
-        super().update()
+        super().step()
         
         # Atualiza física do movimento
         self.update_movement_physics()
@@ -385,6 +451,9 @@ class MovingPlatform(Platform):
 class DisappearingPlatform(Platform):
     """Plataforma que desaparece quando pisada"""
     
+    # Treme antes de sumir (ver SpatialGroup)
+    moves = True
+    
     def __init__(self, x, y, width, height, delay=60, platform_type='cloud'):
         super().__init__(x, y, width, height, platform_type)
         
@@ -395,31 +464,36 @@ class DisappearingPlatform(Platform):
         self.respawn_timer = 0
         self.respawn_delay = 300  # 5 segundos
         
+        # Transparência é alterada no lugar
+        self.dirty_tracking = False
+        
     def trigger(self):
         """Ativa o desaparecimento da plataforma"""
         if not self.triggered:
             self.triggered = True
             self.timer = self.delay
     
-    def update(self):
+    def step(self):
         """Atualiza o desaparecimento"""
-        super().update()
+        super().step()
         
         if self.triggered and self.timer > 0:
             self.timer -= 1
             
             # Efeito de desaparecimento gradual
             alpha = int(self.original_alpha * (self.timer / self.delay))
+            self.own_image()
             self.image.set_alpha(alpha)
             
             # Efeito de tremor
             if self.timer < 20:
-                import random
+                random = random_streams.stream('platforms')
                 self.rect.x += random.randint(-2, 2)
                 self.rect.y += random.randint(-1, 1)
             
             if self.timer <= 0:
                 # Plataforma desapareceu
+                self.own_image()
                 self.image.set_alpha(0)
                 self.respawn_timer = self.respawn_delay
         
@@ -429,6 +503,7 @@ class DisappearingPlatform(Platform):
                 # Respawn da plataforma
                 self.triggered = False
                 self.timer = 0
+                self.own_image()
                 self.image.set_alpha(self.original_alpha)
 
 class BouncePlatform(Platform):
@@ -441,8 +516,18 @@ class BouncePlatform(Platform):
         self.bounce_timer = 0
         self.activated = False
         
-        # Visual especial para plataforma de impulso
+        # Brilho de ativação é desenhado no lugar
+        self.dirty_tracking = False
+    
+    def texture_name(self):
+        """Visual especial para plataforma de impulso (nuvem com setas)"""
+        return 'bounce'
+    
+    def render_platform_image(self):
+        """Desenha a textura de nuvem com as setas de impulso"""
+        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         self.create_bounce_visual()
+        return self.image
     
     def create_bounce_visual(self):
         """Cria visual especial para plataforma de impulso"""
@@ -470,9 +555,9 @@ class BouncePlatform(Platform):
         self.activated = True
         self.bounce_timer = 20  # Duração do efeito visual
     
-    def update(self):
+    def step(self):
         """Atualiza a plataforma de impulso"""
-        super().update()
+        super().step()
         
         if self.bounce_timer > 0:
             self.bounce_timer -= 1
@@ -481,8 +566,9 @@ class BouncePlatform(Platform):
             if self.bounce_timer % 4 < 2:  # Pisca
                 glow_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
                 glow_surface.fill((0, 255, 0, 100))
+                self.own_image()
                 self.image.blit(glow_surface, (0, 0), special_flags=pygame.BLEND_ADD)
             
             if self.bounce_timer <= 0:
                 self.activated = False
-                self.create_bounce_visual()  # Restaura visual normal
+                self.set_texture(self.base_image)  # Restaura visual normal
@@ -2,12 +2,16 @@ import pygame
 import math
 import os
 from game.settings import *
-from game.utils import load_image, load_sprite
+from game.utils import asset_cache
+from game.controls import KeyboardControls
 
 class Player(pygame.sprite.Sprite):
     """Classe do jogador principal com animação estável"""
     
-    def __init__(self, x, y, platform_group):
+    # A aparência só muda trocando self.image (ver DirtyRectTracker)
+    dirty_tracking = True
+    
+    def __init__(self, x, y, platform_group, controls=None):
         super().__init__()
         
         # Posição inicial
@@ -26,6 +30,12 @@ class Player(pygame.sprite.Sprite):
         # Referência às plataformas
         self.platform_group = platform_group
         
+        # Fonte de entrada (teclado, ou teclas definidas por código no modo headless)
+        self.controls = controls or KeyboardControls()
+        
+        # Largura do mundo (o GameManager usa a extensão do nível em streaming)
+        self.world_width = WORLD_WIDTH
+        
         # ===== FÍSICA SIMPLIFICADA =====
         
         # Velocidade
@@ -74,25 +84,25 @@ class Player(pygame.sprite.Sprite):
         self.jump_sound = None
         self.attack_sound = None
         try:
-            from game.utils import load_sound
-            self.jump_sound = load_sound(JUMP_SOUND, 0.4)
-            self.attack_sound = load_sound(ATTACK_SOUND, 0.3)
+            self.jump_sound = asset_cache.sound(JUMP_SOUND, 0.4)
+            self.attack_sound = asset_cache.sound(ATTACK_SOUND, 0.3)
         except:
             pass
     
     def load_sprites(self):
-        """Carrega sprites do jogador"""
+        """Carrega sprites do jogador (compartilhados via cache entre níveis)"""
         sprite_files = {
             'IDLE': 'pparado.png',
             'WALK': 'pandando.png',
             'JUMP': 'ppulando.png',
             'ATTACK': 'patacando.png'
         }
+        sprite_files = {state: os.path.join('assets', 'images', filename)
+                        for state, filename in sprite_files.items()}
         
-        for state, filename in sprite_files.items():
-            path = os.path.join('assets', 'images', filename)
-            sprite = load_sprite(path, (PLAYER_WIDTH, PLAYER_HEIGHT))
-            self.sprites[state] = sprite
+        # Variantes pré-espelhadas e com brilho de invulnerabilidade
+        self.sprite_table = asset_cache.sprite_table(sprite_files, (PLAYER_WIDTH, PLAYER_HEIGHT), blink=True)
+        self.sprites = {state: self.sprite_table[(state, True, False)] for state in sprite_files}
         
         # Sprite inicial
         self.image = self.sprites['IDLE']
@@ -142,7 +152,7 @@ class Player(pygame.sprite.Sprite):
     
     def handle_input(self):
         """Controle de entrada simplificado"""
-        keys = pygame.key.get_pressed()
+        keys = self.controls.pressed()
         
         # Reset do movimento
         self.is_moving = False
@@ -211,33 +221,17 @@ class Player(pygame.sprite.Sprite):
             self.state_changed = False
     
     def apply_sprite(self):
-        """Aplica sprite apenas quando necessário"""
-        # Só atualiza sprite se mudou de estado
-        if self.state_changed or self.current_state not in self.sprites:
-            
-            # Usa sprite do estado atual
-            if self.current_state in self.sprites:
-                base_sprite = self.sprites[self.current_state]
-            else:
-                base_sprite = self.sprites['IDLE']
-            
-            # Cria nova imagem
-            self.image = base_sprite.copy()
-            
-            # Espelha se necessário
-            if not self.facing_right:
-                self.image = pygame.transform.flip(self.image, True, False)
-            
-            # Aplica efeito de invulnerabilidade (sem piscar excessivo)
-            if self.invulnerable and self.blink_timer % 20 < 10:
-                # Efeito mais sutil
-                overlay = pygame.Surface(self.image.get_size(), pygame.SRCALPHA)
-                overlay.fill((255, 255, 255, 100))
-                self.image.blit(overlay, (0, 0))
+        """Escolhe o frame na tabela de variantes (sem cópias nem flips por frame)"""
+        state = self.current_state if self.current_state in self.sprites else 'IDLE'
+        
+        # Efeito de invulnerabilidade (sem piscar excessivo)
+        blinking = self.invulnerable and self.blink_timer % 20 < 10
+        
+        self.image = self.sprite_table[(state, self.facing_right, blinking)]
     
     def check_platform_collision_x(self):
         """Colisão horizontal simplificada"""
-        collisions = pygame.sprite.spritecollide(self, self.platform_group, False)
+        collisions = self.platform_group.collide_rect(self.rect)
         for platform in collisions:
             if self.velocity.x > 0:
                 self.rect.right = platform.rect.left
@@ -251,7 +245,7 @@ class Player(pygame.sprite.Sprite):
         self.on_ground = False
         self.ground_platform = None
         
-        collisions = pygame.sprite.spritecollide(self, self.platform_group, False)
+        collisions = self.platform_group.collide_rect(self.rect)
         
         for platform in collisions:
             if self.velocity.y > 0:  # Caindo
@@ -342,8 +336,8 @@ class Player(pygame.sprite.Sprite):
         if self.rect.left < 0:
             self.rect.left = 0
             self.velocity.x = 0
-        elif self.rect.right > WORLD_WIDTH:
-            self.rect.right = WORLD_WIDTH
+        elif self.rect.right > self.world_width:
+            self.rect.right = self.world_width
             self.velocity.x = 0
         
         # Se caiu do mundo, reposiciona
@@ -0,0 +1,201 @@
+# Instrumentação leve: timers e contadores por nome, buffers circulares e exportação
+#
+# Uso em qualquer módulo (entidades inclusive):
+#     from game.profiling import profiler
+#     SEARCHES = profiler.counter('enemy.platform_search')   # uma vez, no import
+#     SEARCHES.add()                                          # no caminho medido
+#     with profiler.timer('world.load'): ...                  # ou timer.start()/stop()
+# Desligado (padrão), start/stop/add só testam profiler.enabled. Ligado
+# (python main.py --profile, ou F5 durante o jogo), cada medição vai para o
+# buffer circular do seu nome: só as últimas PROFILE_BUFFER_SIZE ficam, então
+# dá para deixar ligado numa sessão inteira e exportar quando o travamento
+# acontecer (F5), em trace JSON do Chrome (chrome://tracing, Perfetto) e CSV.
+# F4 (ou PROFILE_CAPTURE_AFTER frames) abre uma janela de captura com
+# cProfile e tracemalloc de PROFILE_CAPTURE_FRAMES frames.
+import cProfile
+import csv
+import json
+import os
+import pstats
+import time
+import tracemalloc
+from collections import deque
+from game.settings import *
+
+class Timer:
+    """Medições (início, duração, frame) de um trecho, nas últimas size vezes"""
+
+    def __init__(self, profiler, name, category='timer', size=PROFILE_BUFFER_SIZE):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.samples = deque(maxlen=size)
+        self.started = None
+
+    def start(self):
+        if self.profiler.enabled:
+            self.started = time.perf_counter()
+
+    def stop(self):
+        if self.started is None:
+            return
+        now = time.perf_counter()
+        self.samples.append((self.started, now - self.started, self.profiler.frame))
+        self.started = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+        return False
+
+class Counter:
+    """Contagem por frame (ex.: entidades criadas), guardada ao fim de cada frame"""
+
+    def __init__(self, profiler, name, size=PROFILE_BUFFER_SIZE):
+        self.profiler = profiler
+        self.name = name
+        self.value = 0
+        self.samples = deque(maxlen=size)  # (instante, frame, valor)
+
+    def add(self, amount=1):
+        if self.profiler.enabled:
+            self.value += amount
+
+class Profiler:
+    """Registro de timers e contadores, janela de captura e exportação"""
+
+    def __init__(self):
+        self.enabled = False
+        self.timers = {}
+        self.counters = {}
+        self.frame = 0
+        self.origin = time.perf_counter()
+
+        # Janela de captura (cProfile + tracemalloc)
+        self.capture_at = None  # Frame em que a captura começa sozinha
+        self.capture = None
+        self.capture_left = 0
+        self.capture_tracing = False  # tracemalloc foi ligado pela captura
+
+    def timer(self, name, category='timer'):
+        """Timer registrado com esse nome (criado na primeira consulta)"""
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = Timer(self, name, category)
+        return timer
+
+    def counter(self, name):
+        """Contador registrado com esse nome (criado na primeira consulta)"""
+        counter = self.counters.get(name)
+        if counter is None:
+            counter = self.counters[name] = Counter(self, name)
+        return counter
+
+    def record_stage(self, stage, start, end):
+        """Gancho do FrameTimer: cada etapa do frame vira uma medição 'stage.<etapa>'"""
+        if self.enabled:
+            self.timer(f'stage.{stage}', 'stage').samples.append((start, end - start, self.frame))
+
+    def enable(self, enabled=True):
+        self.enabled = enabled
+        print(f"🔬 Instrumentação {'ligada' if enabled else 'desligada'}")
+
+    def end_frame(self):
+        """Fim do frame: guarda os contadores e avança a janela de captura"""
+        self.frame += 1
+        if self.capture_at == self.frame:
+            self.start_capture()
+        if self.capture is not None:
+            self.capture_left -= 1
+            if self.capture_left <= 0:
+                self.stop_capture()
+
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        for counter in self.counters.values():
+            counter.samples.append((now, self.frame, counter.value))
+            counter.value = 0
+
+    def start_capture(self, frames=PROFILE_CAPTURE_FRAMES):
+        """Abre a janela de captura: cProfile e tracemalloc pelos próximos frames"""
+        if self.capture is not None:
+            return
+        print(f"🔬 Capturando perfil de {frames} frames (cProfile + tracemalloc)")
+        self.capture_left = frames
+        self.capture_start = self.frame
+        # Quem já estava rastreando (benchmark, python -X tracemalloc) continua
+        self.capture_tracing = not tracemalloc.is_tracing()
+        if self.capture_tracing:
+            tracemalloc.start()
+        self.capture = cProfile.Profile()
+        self.capture.enable()
+
+    def stop_capture(self, directory=PROFILE_OUTPUT):
+        """Fecha a janela de captura e grava <dir>/capture_<frame>.prof e _memory.txt"""
+        if self.capture is None:
+            return None
+        self.capture.disable()
+        snapshot = tracemalloc.take_snapshot()
+        if self.capture_tracing:
+            tracemalloc.stop()
+            self.capture_tracing = False
+
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, f'capture_{self.capture_start}')
+        self.capture.dump_stats(base + '.prof')
+        with open(base + '_memory.txt', 'w', encoding='utf-8') as f:
+            for stat in snapshot.statistics('lineno')[:PROFILE_MEMORY_TOP]:
+                f.write(f'{stat}\n')
+
+        top = pstats.Stats(self.capture).sort_stats('cumulative')
+        self.capture = None
+        calls = sum(count for count, _, _, _, _ in top.stats.values())
+        print(f"💾 Perfil em {base}.prof ({calls} chamadas; abra com python -m pstats ou snakeviz) "
+              f"e alocações em {base}_memory.txt")
+        return base
+
+    def export(self, directory=PROFILE_OUTPUT):
+        """Grava o conteúdo dos buffers em <dir>/trace_<frame>.json (Chrome) e .csv"""
+        os.makedirs(directory, exist_ok=True)
+        base = os.path.join(directory, f'trace_{self.frame}')
+        self.export_chrome_trace(base + '.json')
+        self.export_csv(base + '.csv')
+        print(f"💾 Trace em {base}.json (chrome://tracing ou ui.perfetto.dev) e {base}.csv")
+        return base
+
+    def export_chrome_trace(self, path):
+        """Formato trace-event do Chrome: timers como eventos 'X', contadores como 'C'"""
+        events = []
+        for timer in self.timers.values():
+            for start, duration, frame in timer.samples:
+                events.append({'name': timer.name, 'cat': timer.category, 'ph': 'X',
+                               'ts': (start - self.origin) * 1e6, 'dur': duration * 1e6,
+                               'pid': 1, 'tid': 1, 'args': {'frame': frame}})
+        for counter in self.counters.values():
+            for instant, frame, value in counter.samples:
+                events.append({'name': counter.name, 'ph': 'C', 'ts': (instant - self.origin) * 1e6,
+                               'pid': 1, 'tid': 1, 'args': {'value': value}})
+        events.sort(key=lambda event: event['ts'])
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+    def export_csv(self, path):
+        """Uma linha por medição: tipo, nome, frame, início (ms), duração (ms) ou valor"""
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['kind', 'name', 'frame', 'start_ms', 'duration_ms', 'value'])
+            for timer in self.timers.values():
+                for start, duration, frame in timer.samples:
+                    writer.writerow([timer.category, timer.name, frame,
+                                     f'{(start - self.origin) * 1000:.4f}', f'{duration * 1000:.4f}', ''])
+            for counter in self.counters.values():
+                for instant, frame, value in counter.samples:
+                    writer.writerow(['counter', counter.name, frame,
+                                     f'{(instant - self.origin) * 1000:.4f}', '', value])
+
+# Instância única usada pelo GameManager e pelas entidades
+profiler = Profiler()
@@ -0,0 +1,130 @@
+# Gravação e reprodução da entrada do jogador, para partidas reproduzíveis
+#
+# Uma gravação guarda a semente dos fluxos aleatórios (ver RandomStreams),
+# o nível inicial e as teclas lidas pelo jogador a cada atualização. Com a
+# mesma semente e a mesma entrada a simulação se repete exatamente, o que
+# permite comparar tempos de builds diferentes sobre a mesma partida.
+#
+# Formato (little-endian):
+#   cabeçalho  '<4sHqHI'  mágico b'SHRP', versão, semente, nível, nº de atualizações
+#   execuções  '<HH'      (repetições, teclas) — teclas como bits de INPUT_KEYS
+import hashlib
+import struct
+import pygame
+from game.controls import KeyState
+
+REPLAY_MAGIC = b'SHRP'
+REPLAY_VERSION = 1
+
+HEADER = struct.Struct('<4sHqHI')
+RUN = struct.Struct('<HH')
+MAX_RUN = 0xFFFF
+
+# Teclas consultadas por Player.handle_input, na ordem dos bits
+INPUT_KEYS = (pygame.K_LEFT, pygame.K_a, pygame.K_RIGHT, pygame.K_d,
+              pygame.K_SPACE, pygame.K_UP, pygame.K_w, pygame.K_x)
+
+def encode_keys(keys):
+    """Teclas pressionadas (formato de pygame.key.get_pressed) -> máscara de bits"""
+    mask = 0
+    for bit, key in enumerate(INPUT_KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+def decode_keys(mask):
+    """Máscara de bits -> teclas pressionadas (KeyState)"""
+    return KeyState(key for bit, key in enumerate(INPUT_KEYS) if mask & (1 << bit))
+
+class Recording:
+    """Partida gravada: semente, nível inicial e máscara de teclas por atualização"""
+
+    def __init__(self, seed, level, ticks):
+        self.seed = seed
+        self.level = level
+        self.ticks = ticks
+
+class InputRecorder:
+    """Controles que repassam outra fonte (ex.: teclado) e gravam cada leitura.
+
+    O jogador recebe as teclas já decodificadas da máscara gravada, então a
+    partida gravada e a reproduzida veem exatamente a mesma entrada.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.ticks = []
+
+    def pressed(self):
+        mask = encode_keys(self.source.pressed())
+        self.ticks.append(mask)
+        return decode_keys(mask)
+
+    def recording(self, seed, level=1):
+        return Recording(seed, level, list(self.ticks))
+
+class InputReplay:
+    """Controles que devolvem a entrada gravada, uma máscara por leitura"""
+
+    def __init__(self, ticks):
+        self.ticks = ticks
+        self.tick = 0
+        self._keys = {}  # KeyState por máscara (poucas combinações distintas)
+
+    def pressed(self):
+        mask = self.ticks[self.tick] if self.tick < len(self.ticks) else 0
+        self.tick += 1
+        keys = self._keys.get(mask)
+        if keys is None:
+            keys = self._keys[mask] = decode_keys(mask)
+        return keys
+
+    @property
+    def finished(self):
+        return self.tick >= len(self.ticks)
+
+def write_recording(path, recording):
+    """Grava a partida com as máscaras compactadas em execuções (run-length)"""
+    runs = []
+    for mask in recording.ticks:
+        if runs and runs[-1][1] == mask and runs[-1][0] < MAX_RUN:
+            runs[-1][0] += 1
+        else:
+            runs.append([1, mask])
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, recording.seed,
+                            recording.level, len(recording.ticks)))
+        for count, mask in runs:
+            f.write(RUN.pack(count, mask))
+
+def read_recording(path):
+    """Lê uma partida gravada (ValueError se o arquivo não for uma gravação válida)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise ValueError(f"Gravação truncada: {path}")
+    magic, version, seed, level, count = HEADER.unpack_from(data)
+    if magic != REPLAY_MAGIC:
+        raise ValueError(f"Não é uma gravação do Super Hero: {path}")
+    if version != REPLAY_VERSION:
+        raise ValueError(f"Versão de gravação não suportada: {version}")
+
+    ticks = []
+    for repeat, mask in RUN.iter_unpack(data[HEADER.size:]):
+        ticks.extend([mask] * repeat)
+    if len(ticks) != count:
+        raise ValueError(f"Gravação corrompida: {len(ticks)} atualizações, esperado {count}")
+    return Recording(seed, level, ticks)
+
+def state_digest(game):
+    """Resumo (md5) do estado da simulação, para conferir que a reprodução foi exata"""
+    if game.enemy_batching:
+        # Objetos do lote só são sincronizados quando desenhados ou atingidos
+        game.enemies.sync_all()
+    player = game.player
+    state = (game.level, game.score, game.lives, game.time_remaining, game.game_state,
+             tuple(player.rect), tuple(player.velocity),
+             sorted((tuple(enemy.rect), enemy.health) for enemy in game.enemies),
+             len(game.coins))
+    return hashlib.md5(repr(state).encode()).hexdigest()
@@ -125,6 +125,9 @@ MENU_FONT_SIZE = 64
 HUD_FONT_SIZE = 32
 TEXT_FONT_SIZE = 24
 
+# Cache de textos renderizados (HUD e menus)
+TEXT_CACHE_SIZE = 256
+
 # Configurações de efeitos visuais
 PARTICLE_COUNT = 10
 EFFECT_DURATION = 60
@@ -133,6 +136,62 @@ GLOW_INTENSITY = 50
 # Configurações da câmera
 CAMERA_SMOOTHING = 0.1
 CAMERA_DEADZONE = 200
+CULLING_MARGIN = 8  # Margem (px) além da tela ao descartar sprites invisíveis
+
+STATIC_LAYER_CHUNK_WIDTH = 512  # Largura (px) dos chunks de plataformas estáticas pré-desenhadas
+SPATIAL_CELL_SIZE = 128  # Lado (px) das células do índice espacial de colisões
+
+# Nível de detalhe da simulação em volta da câmera: até LOD_ACTIVE_MARGIN px
+# além da tela tudo é atualizado todo frame; até LOD_REDUCED_MARGIN, a cada
+# LOD_REDUCED_INTERVAL frames; mais longe as entidades dormem
+SIMULATION_LOD = True
+LOD_ACTIVE_MARGIN = 256
+LOD_REDUCED_MARGIN = 1024
+LOD_REDUCED_INTERVAL = 4
+
+# Mundo em streaming: o nível é dividido em chunks de WORLD_CHUNK_WIDTH px;
+# um chunk é carregado a STREAM_LOAD_DISTANCE px da tela e liberado além de
+# STREAM_UNLOAD_DISTANCE (a folga evita recarregar chunks na borda)
+WORLD_CHUNK_WIDTH = 512
+STREAM_LOAD_DISTANCE = 512
+STREAM_UNLOAD_DISTANCE = 1024
+
+# Pré-carregamento do próximo nível durante o atual: leitura numa thread e
+# montagem na thread principal, até PRELOAD_FRAME_BUDGET segundos por frame
+PRELOAD_NEXT_LEVEL = True
+PRELOAD_FRAME_BUDGET = 0.002
+
+# Overlay de desempenho (F3): amostras da janela de percentis e frames entre redesenhos do painel
+PERF_WINDOW = 120
+PERF_OVERLAY_REFRESH = 15
+
+# Instrumentação (game.profiling): medições guardadas por timer/contador, pasta
+# das exportações, frames da janela de cProfile/tracemalloc (F4), frame em que
+# ela abre sozinha (None: só pela tecla) e linhas do relatório de alocações
+PROFILE_BUFFER_SIZE = 4096
+PROFILE_OUTPUT = 'profiles/'
+PROFILE_CAPTURE_FRAMES = 300
+PROFILE_CAPTURE_AFTER = None
+PROFILE_MEMORY_TOP = 25
+
+# Benchmarks (python -m game.benchmark): escalas dos níveis sintéticos (quantidade
+# de plataformas, de moedas e de inimigos), frames medidos por escala, resultados
+# de referência e piora tolerada antes de acusar regressão
+BENCHMARK_SCALES = (100, 1000, 10000)
+BENCHMARK_FRAMES = 600
+BENCHMARK_BASELINE = 'benchmarks/baseline.json'
+BENCHMARK_TOLERANCE = 0.15
+
+# Simulação dos inimigos: 'objects' (Enemy.update por objeto) ou 'numpy'
+# (EnemyBatch vetorizado, para níveis com milhares de inimigos; requer NumPy)
+ENEMY_BACKEND = 'objects'
+
+# Renderização por retângulos sujos: redesenha só o que mudou (hardware fraco)
+DIRTY_RECT_RENDERING = False
+
+# Colisões por pixel (máscaras sob demanda) para coleta de moedas e ataque;
+# desligado mantém as colisões por retângulo originais
+PIXEL_PERFECT_COLLISIONS = False
 
 # Configurações dos inimigos
 ENEMY_PATROL_DISTANCE = 200
@@ -161,6 +220,16 @@ GAME_OVER_SOUND = SOUNDS_PATH + 'game-over.mp3'
 BACKGROUND_IMAGE = IMAGES_PATH + 'cenario.jpg'
 COIN_IMAGE = IMAGES_PATH + 'coin.png'
 
+# Camadas do fundo com parallax: (imagem, fator de parallax), de trás para frente
+BACKGROUND_LAYERS = [(BACKGROUND_IMAGE, 0.3)]
+BACKGROUND_CHUNK_WIDTH = 256  # Largura (px) de cada pedaço do fundo em memória
+
+# Pacote de assets pré-processado (gerado com: python -m game.asset_pack)
+ASSET_PACK = ASSETS_PATH + 'assets.pack'
+
+# Níveis: level_N.json (edição) e level_N.lvl (binário, gerado com: python -m game.level_compiler)
+LEVELS_PATH = ASSETS_PATH + 'levels/'
+
 # Imagens do jogador
 PLAYER_IDLE = IMAGES_PATH + "pparado.png"      # Jogador parado
 PLAYER_WALK = IMAGES_PATH + "pandando.png"     # Jogador andando  
@@ -0,0 +1,91 @@
+# Nível de detalhe da simulação: entidades longe da câmera dormem
+import pygame
+from game.settings import *
+
+class SimulationLOD:
+    """Escolhe, a cada frame, quais entidades de um grupo são atualizadas.
+
+    Em volta da área visível da câmera ficam duas regiões: na ativa as
+    entidades são atualizadas todo frame; na intermediária, uma vez a cada
+    reduced_interval frames, recebendo o número de frames passados desde a
+    última atualização (update(frames=n)) para andar e animar na velocidade
+    normal; fora dela ficam dormentes (sem IA, física nem animação) e
+    retomam de onde pararam quando voltam a entrar. A fase de cada entidade
+    na região intermediária vem da sua ordem de inserção no índice espacial,
+    então a escolha é determinística e a carga se espalha entre os frames.
+    Entidades com tempo contado (timed = True, ex.: BonusCoin) são
+    atualizadas todo frame onde estiverem. Grupos precisam ser SpatialGroup:
+    só as entidades das regiões são consultadas, e as dormentes não custam nada.
+    """
+
+    def __init__(self, enabled=SIMULATION_LOD, active_margin=LOD_ACTIVE_MARGIN,
+                 reduced_margin=LOD_REDUCED_MARGIN, reduced_interval=LOD_REDUCED_INTERVAL):
+        self.enabled = enabled
+        self.active_margin = active_margin
+        self.reduced_margin = reduced_margin
+        self.reduced_interval = reduced_interval
+
+        self.frame = 0
+        self.active_region = None
+        self.reduced_region = None
+
+        # Contagens do último frame (somadas entre os grupos)
+        self.counts = {'active': 0, 'reduced': 0, 'ticked': 0, 'dormant': 0}
+
+    def begin_frame(self, viewport):
+        """Recalcula as regiões em volta da área visível (coordenadas do mundo)"""
+        self.frame += 1
+        self.active_region = viewport.inflate(self.active_margin * 2, self.active_margin * 2)
+        self.reduced_region = viewport.inflate(self.reduced_margin * 2, self.reduced_margin * 2)
+        for key in self.counts:
+            self.counts[key] = 0
+
+    def select(self, group):
+        """[(sprite, frames)] a atualizar neste frame: frames é quantos frames
+        simular de uma vez (1 na região ativa; até reduced_interval na intermediária)"""
+        if not self.enabled:
+            sprites = group.sprites()
+            self.count_active(len(sprites))
+            return [(sprite, 1) for sprite in sprites]
+
+        nearby = group.collide_rect(self.reduced_region)
+        active_region = self.active_region
+        grid = group.grid
+        timed = group.timed
+        frame = self.frame
+        ticked = []
+        active = reduced = 0
+        for sprite in nearby:
+            if sprite in timed:
+                continue
+            if active_region.colliderect(sprite.rect):
+                active += 1
+            else:
+                reduced += 1
+                if (frame + grid.order(sprite)) % self.reduced_interval:
+                    continue
+            # Frames desde a última atualização; quem acorda não recupera o
+            # tempo dormente (no máximo um intervalo da região intermediária)
+            last = getattr(sprite, 'lod_frame', frame - 1)
+            sprite.lod_frame = frame
+            ticked.append((sprite, min(frame - last, self.reduced_interval)))
+
+        # Tempo contado (ex.: duração da moeda bônus) não para longe da câmera
+        for sprite in timed:
+            sprite.lod_frame = frame
+            ticked.append((sprite, 1))
+
+        self.counts['active'] += active + len(timed)
+        self.counts['reduced'] += reduced
+        self.counts['ticked'] += len(ticked)
+        self.counts['dormant'] += len(group) - active - reduced - len(timed)
+        return ticked
+
+    def count_active(self, count):
+        """Registra entidades atualizadas fora do LOD (ex.: inimigos em lote)"""
+        self.counts['active'] += count
+        self.counts['ticked'] += count
+
+    def stats(self):
+        """Contagens do último frame"""
+        return dict(self.counts)
@@ -0,0 +1,222 @@
+# Índice espacial em grade uniforme (broadphase de colisões)
+import pygame
+from game.settings import *
+
+class SpatialGrid:
+    """Hash espacial de grade uniforme para objetos com rect.
+
+    Cada objeto é registrado em todas as células de cell_size pixels que o
+    seu rect ocupa; uma consulta só examina os objetos dessas células. Os
+    resultados vêm na ordem de inserção, a mesma em que um pygame.sprite.Group
+    seria percorrido.
+    """
+
+    def __init__(self, cell_size=SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        self.cells = {}
+        # objeto -> [ordem de inserção, (coluna0, linha0, coluna1, linha1)]
+        self.items = {}
+        self.counter = 0
+
+        # Linhas já ocupadas (para consultas de coluna inteira)
+        self.min_row = 0
+        self.max_row = -1
+
+        # Estatísticas
+        self.queries = 0
+        self.candidates = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def __contains__(self, item):
+        return item in self.items
+
+    def cell_span(self, rect):
+        """Faixa de células (inclusiva) coberta pelo rect"""
+        size = self.cell_size
+        return (rect.left // size, rect.top // size,
+                max(rect.left, rect.right - 1) // size, max(rect.top, rect.bottom - 1) // size)
+
+    def insert(self, item):
+        """Registra o objeto nas células do seu rect atual"""
+        if item in self.items:
+            return
+        span = self.cell_span(item.rect)
+        self.items[item] = [self.counter, span]
+        self.counter += 1
+        self._link(item, span)
+
+    def remove(self, item):
+        """Retira o objeto do índice"""
+        entry = self.items.pop(item, None)
+        if entry is not None:
+            self._unlink(item, entry[1])
+
+    def update(self, item):
+        """Reposiciona o objeto se o rect mudou de células; retorna True se mudou"""
+        entry = self.items.get(item)
+        if entry is None:
+            return False
+        span = self.cell_span(item.rect)
+        if span == entry[1]:
+            return False
+        self._unlink(item, entry[1])
+        self._link(item, span)
+        entry[1] = span
+        return True
+
+    def order(self, item):
+        """Ordem de inserção do objeto (estável enquanto ele estiver no índice)"""
+        return self.items[item][0]
+
+    def clear(self):
+        """Esvazia o índice"""
+        self.cells.clear()
+        self.items.clear()
+        self.min_row = 0
+        self.max_row = -1
+
+    def query_rect(self, rect):
+        """Objetos cujo rect colide com o rect dado"""
+        x0, y0, x1, y1 = self.cell_span(rect)
+        found = self._gather(range(x0, x1 + 1), range(y0, y1 + 1))
+        return self._ordered(item for item in found if rect.colliderect(item.rect))
+
+    def query_point(self, x, y):
+        """Objetos cujo rect contém o ponto"""
+        size = self.cell_size
+        found = self.cells.get((x // size, y // size), ())
+        return self._ordered(item for item in found if item.rect.collidepoint(x, y))
+
+    def query_neighbourhood(self, point, radius):
+        """Candidatos das células ao redor do ponto (sem teste exato, só broadphase)"""
+        x, y = point
+        size = self.cell_size
+        found = self._gather(range(int(x - radius) // size, int(x + radius) // size + 1),
+                             range(int(y - radius) // size, int(y + radius) // size + 1))
+        return self._ordered(found)
+
+    def query_radius(self, point, radius):
+        """[(objeto, distância²)] dos objetos com centro a até radius do ponto"""
+        x, y = point
+        radius_sq = radius * radius
+        found = []
+        for item in self.query_neighbourhood(point, radius):
+            dx = item.rect.centerx - x
+            dy = item.rect.centery - y
+            distance_sq = dx * dx + dy * dy
+            if distance_sq <= radius_sq:
+                found.append((item, distance_sq))
+        return found
+
+    def query_column(self, x):
+        """Objetos cujo rect cobre a coordenada x (bordas inclusivas), em qualquer altura"""
+        size = self.cell_size
+        columns = {(x - 1) // size, x // size}
+        found = self._gather(columns, range(self.min_row, self.max_row + 1))
+        return self._ordered(item for item in found if item.rect.left <= x <= item.rect.right)
+
+    def query_span(self, left, right):
+        """Objetos cujo rect cruza a faixa horizontal [left, right), em qualquer altura"""
+        size = self.cell_size
+        found = self._gather(range(left // size, (right - 1) // size + 1),
+                             range(self.min_row, self.max_row + 1))
+        return self._ordered(item for item in found
+                             if item.rect.right > left and item.rect.left < right)
+
+    def _gather(self, columns, rows):
+        found = set()
+        for column in columns:
+            for row in rows:
+                cell = self.cells.get((column, row))
+                if cell:
+                    found.update(cell)
+        self.queries += 1
+        self.candidates += len(found)
+        return found
+
+    def _ordered(self, items):
+        return sorted(items, key=lambda item: self.items[item][0])
+
+    def _link(self, item, span):
+        x0, y0, x1, y1 = span
+        for column in range(x0, x1 + 1):
+            for row in range(y0, y1 + 1):
+                self.cells.setdefault((column, row), set()).add(item)
+        self.min_row = min(self.min_row, y0) if self.max_row >= self.min_row else y0
+        self.max_row = max(self.max_row, y1)
+
+    def _unlink(self, item, span):
+        x0, y0, x1, y1 = span
+        for column in range(x0, x1 + 1):
+            for row in range(y0, y1 + 1):
+                cell = self.cells.get((column, row))
+                if cell is not None:
+                    cell.discard(item)
+                    if not cell:
+                        del self.cells[(column, row)]
+
+class SpatialGroup(pygame.sprite.Group):
+    """Grupo de sprites que mantém um SpatialGrid sincronizado.
+
+    Sprites com o atributo moves = True (plataformas móveis, moedas,
+    inimigos) são reposicionados no índice depois de cada update() ou de
+    reindex(); os demais são indexados só ao entrar no grupo. Sprites com
+    timed = True ficam também em timed (ver SimulationLOD).
+    """
+
+    def __init__(self, *sprites, cell_size=SPATIAL_CELL_SIZE):
+        self.grid = SpatialGrid(cell_size)
+        self.moving = {}
+        self.timed = {}
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.grid.insert(sprite)
+        if getattr(sprite, 'moves', False):
+            self.moving[sprite] = None
+        if getattr(sprite, 'timed', False):
+            self.timed[sprite] = None
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.grid.remove(sprite)
+        if getattr(sprite, 'moves', False):
+            self.moving.pop(sprite, None)
+        if getattr(sprite, 'timed', False):
+            self.timed.pop(sprite, None)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.reindex()
+
+    def reindex(self, sprites=None):
+        """Atualiza no índice a posição dos sprites que se movem (ou só dos dados)"""
+        for sprite in self.moving if sprites is None else sprites:
+            self.grid.update(sprite)
+
+    def collide_rect(self, rect):
+        """Sprites do grupo que colidem com o rect"""
+        return self.grid.query_rect(rect)
+
+    def collide_point(self, x, y):
+        """Sprites do grupo que contêm o ponto"""
+        return self.grid.query_point(x, y)
+
+    def near(self, point, radius):
+        """Sprites nas células ao redor do ponto (candidatos, sem teste exato)"""
+        return self.grid.query_neighbourhood(point, radius)
+
+    def in_radius(self, point, radius):
+        """[(sprite, distância²)] dos sprites com centro a até radius do ponto"""
+        return self.grid.query_radius(point, radius)
+
+    def in_column(self, x):
+        """Sprites do grupo que cobrem a coordenada x, em qualquer altura"""
+        return self.grid.query_column(x)
+
+    def in_span(self, left, right):
+        """Sprites do grupo que cruzam a faixa horizontal [left, right)"""
+        return self.grid.query_span(left, right)
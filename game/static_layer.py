@@ -0,0 +1,80 @@
+# Camada de geometria estática: plataformas que nunca mudam, pré-desenhadas em chunks
+import pygame
+from game.settings import *
+from game.profiling import profiler
+
+# Tempo de cada coluna refeita pelo streaming (ver game.profiling)
+REFRESH_TIMER = profiler.timer('static_layer.refresh')
+
+class StaticGeometryLayer:
+    """Plataformas estáticas de um nível assadas em superfícies por coluna do mundo.
+
+    O mundo é dividido em colunas de chunk_width pixels; cada coluna vira uma
+    superfície do tamanho exato da área ocupada pelas plataformas dela. No
+    desenho são blitados só os chunks das colunas visíveis, em vez de uma
+    plataforma por vez. As plataformas continuam no grupo de colisão.
+    """
+
+    def __init__(self, sprites=(), chunk_width=STATIC_LAYER_CHUNK_WIDTH):
+        self.chunk_width = chunk_width
+        self.chunks = {}
+        self.sprite_count = 0
+        self.bake(sprites)
+
+    def bake(self, sprites):
+        """Desenha as plataformas nos chunks das colunas que elas ocupam"""
+        columns = {}
+        for sprite in sprites:
+            first = sprite.rect.left // self.chunk_width
+            last = (sprite.rect.right - 1) // self.chunk_width
+            for index in range(first, last + 1):
+                columns.setdefault(index, []).append(sprite)
+            self.sprite_count += 1
+
+        for index, column_sprites in columns.items():
+            self.bake_column(index, column_sprites)
+
+    def column_bounds(self, left, right):
+        """Faixa [esquerda, direita) das colunas inteiras que cobrem left..right"""
+        return (left // self.chunk_width * self.chunk_width,
+                ((right - 1) // self.chunk_width + 1) * self.chunk_width)
+
+    def refresh(self, left, right, sprites):
+        """Refaz as colunas entre left e right com as plataformas dadas (mundo em streaming)"""
+        REFRESH_TIMER.start()
+        for index in range(left // self.chunk_width, (right - 1) // self.chunk_width + 1):
+            column = pygame.Rect(index * self.chunk_width, 0, self.chunk_width, 0)
+            self.bake_column(index, [sprite for sprite in sprites
+                                     if sprite.rect.right > column.left and sprite.rect.left < column.right])
+        REFRESH_TIMER.stop()
+
+    def bake_column(self, index, column_sprites):
+        """Chunk de uma coluna: superfície do tamanho da área ocupada pelas plataformas"""
+        if not column_sprites:
+            self.chunks.pop(index, None)
+            return
+
+        # Área ocupada pelas plataformas dentro da coluna
+        top = min(sprite.rect.top for sprite in column_sprites)
+        bottom = max(sprite.rect.bottom for sprite in column_sprites)
+        area = pygame.Rect(index * self.chunk_width, top, self.chunk_width, bottom - top)
+
+        surface = pygame.Surface(area.size, pygame.SRCALPHA)
+        for sprite in column_sprites:
+            surface.blit(sprite.image, (sprite.rect.x - area.x, sprite.rect.y - area.y))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+
+        self.chunks[index] = (area, surface)
+
+    def draw(self, surface, offset, view):
+        """Blita os chunks das colunas que intersectam view (coordenadas do mundo)"""
+        offset_x, offset_y = offset
+        drawn = 0
+        for index in range(view.left // self.chunk_width, (view.right - 1) // self.chunk_width + 1):
+            chunk = self.chunks.get(index)
+            if chunk is not None and chunk[0].colliderect(view):
+                area, image = chunk
+                surface.blit(image, (area.x + offset_x, area.y + offset_y))
+                drawn += 1
+        return drawn
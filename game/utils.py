@@ -2,6 +2,10 @@
 import pygame
 import os
 import math
+import random
+import struct
+import weakref
+from collections import OrderedDict
 from game.settings import *
 
 def load_image(path, size=None, scale=None):
@@ -89,7 +93,7 @@ def load_sound(path, volume=1.0):
         sound = pygame.mixer.Sound(path)
         sound.set_volume(volume)
         return sound
-    except pygame.error as e:
+    except (pygame.error, FileNotFoundError) as e:
         print(f"Erro ao carregar som {path}: {e}")
         return None
 
@@ -110,26 +114,85 @@ def scale_image_smart(image, target_size, maintain_aspect=True):
     else:
         return pygame.transform.scale(image, target_size)
 
+class TextCache:
+    """Cache LRU de textos renderizados, por (fonte, texto, antialias, cor).
+
+    As superfícies devolvidas são compartilhadas: só devem ser blitadas.
+    """
+    
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._fonts = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def font(self, size):
+        """Fonte padrão do tamanho dado (criada uma única vez)"""
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = pygame.font.Font(None, size)
+        return font
+    
+    def render(self, font, text, antialias, color):
+        """Equivalente a font.render, reaproveitando renderizações anteriores"""
+        key = (font, text, antialias, tuple(color))
+        surface = self._entries.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return surface
+        
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._entries[key] = surface
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return surface
+    
+    def stats(self):
+        """Estatísticas de uso do cache"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+    
+    def clear(self):
+        """Descarta os textos em cache e zera as estatísticas"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+# Instância única usada por draw_text, draw_text_left e draw_text_right
+text_cache = TextCache()
+
 def draw_text(screen, text, size, x, y, color, font=None):
     """Desenha texto centralizado"""
     if font is None:
-        font = pygame.font.Font(None, size)
-    text_surface = font.render(str(text), True, color)
+        font = text_cache.font(size)
+    text_surface = text_cache.render(font, str(text), True, color)
     text_rect = text_surface.get_rect(center=(x, y))
     screen.blit(text_surface, text_rect)
 
 def draw_text_left(screen, text, size, x, y, color, font=None):
     """Desenha texto alinhado à esquerda"""
     if font is None:
-        font = pygame.font.Font(None, size)
-    text_surface = font.render(str(text), True, color)
+        font = text_cache.font(size)
+    text_surface = text_cache.render(font, str(text), True, color)
     screen.blit(text_surface, (x, y))
 
 def draw_text_right(screen, text, size, x, y, color, font=None):
     """Desenha texto alinhado à direita"""
     if font is None:
-        font = pygame.font.Font(None, size)
-    text_surface = font.render(str(text), True, color)
+        font = text_cache.font(size)
+    text_surface = text_cache.render(font, str(text), True, color)
     text_rect = text_surface.get_rect()
     text_rect.right = x
     text_rect.y = y
@@ -288,6 +351,14 @@ class Camera:
         self.camera = pygame.Rect(0, 0, width, height)
         self.width = width
         self.height = height
+        
+        # Área visível em coordenadas do mundo (usada para culling)
+        self.viewport = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+    def set_bounds(self, width, height):
+        """Ajusta os limites do mundo (extensão do nível carregado)"""
+        self.width = width
+        self.height = height
 
     def apply(self, entity):
         """Aplica o offset da câmera a uma entidade"""
@@ -305,6 +376,7 @@ class Camera:
         y = max(-(self.height - SCREEN_HEIGHT), y)  # Baixo
         
         self.camera = pygame.Rect(x, y, self.width, self.height)
+        self.viewport = pygame.Rect(-x, -y, SCREEN_WIDTH, SCREEN_HEIGHT)
 
 def clamp(value, min_value, max_value):
     """Limita um valor entre min e max"""
@@ -370,4 +442,251 @@ def load_sprite(path, size=None):
         # Desenha um retângulo colorido transparente
         pygame.draw.rect(placeholder, (255, 100, 100, 150), placeholder.get_rect())
         pygame.draw.rect(placeholder, (255, 255, 255, 200), placeholder.get_rect(), 2)
-        return placeholder 
\ No newline at end of file
+        return placeholder 
+
+def make_sprite_variant(surface, facing_right=True, blink=False):
+    """Gera a variante espelhada e/ou com o brilho de invulnerabilidade de um sprite"""
+    image = surface.copy() if facing_right else pygame.transform.flip(surface, True, False)
+    if blink:
+        overlay = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+        overlay.fill((255, 255, 255, 100))
+        image.blit(overlay, (0, 0))
+    return image
+
+class AssetCache:
+    """Registro central de assets compartilhado por todo o processo.
+
+    Cada arquivo é decodificado uma única vez por combinação de
+    (caminho, tamanho, variante). As superfícies devolvidas são
+    compartilhadas entre todas as entidades e devem ser tratadas como
+    somente leitura: quem precisar alterá-las deve trabalhar numa cópia.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self.pack = None
+        self.hits = 0
+        self.misses = 0
+        self.pack_loads = 0
+
+    def get(self, key, loader):
+        """Retorna o asset da chave, chamando loader() apenas na primeira vez.
+
+        Se houver um pacote de assets carregado com a chave, a superfície vem
+        dele em vez de ser decodificada.
+        """
+        if key in self._entries:
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        if self.pack is not None and key in self.pack:
+            self.pack_loads += 1
+            asset = self.pack.surface(key)
+        else:
+            asset = loader()
+        self._entries[key] = asset
+        return asset
+
+    def load_pack(self, path):
+        """Usa o pacote pré-processado (game/asset_pack.py) se existir e for válido"""
+        if not os.path.exists(path):
+            return False
+        from game.asset_pack import AssetPack
+        try:
+            self.pack = AssetPack(path)
+        except (OSError, ValueError, struct.error) as e:
+            print(f"⚠️ Ignorando pacote de assets {path}: {e}")
+            self.pack = None
+            return False
+        print(f"📦 Pacote de assets carregado: {path} ({len(self.pack.entries)} imagens)")
+        if self.pack.stale:
+            print(f"⚠️ {len(self.pack.stale)} imagens do pacote ignoradas: arquivos de origem alterados "
+                  f"(rode python -m game.asset_pack)")
+        return True
+
+    def items(self):
+        """Pares (chave, asset) atualmente em cache"""
+        return self._entries.items()
+
+    def image(self, path, size=None, scale=None, variant=None, builder=None):
+        """Imagem via load_image; variant/builder geram derivadas da imagem base"""
+        key = ('image', path, size, scale, variant)
+        if variant is None:
+            return self.get(key, lambda: load_image(path, size=size, scale=scale))
+        return self.get(key, lambda: builder(self.image(path, size=size, scale=scale)))
+
+    def sprite(self, path, size=None, variant=None, builder=None):
+        """Sprite de personagem via load_sprite; variant/builder como em image()"""
+        key = ('sprite', path, size, None, variant)
+        if variant is None:
+            return self.get(key, lambda: load_sprite(path, size))
+        return self.get(key, lambda: builder(self.sprite(path, size)))
+
+    def sprite_table(self, files, size, kind='sprite', blink=False):
+        """Tabela de variantes {(estado, virado_para_direita, piscando): Surface}.
+
+        Construída uma única vez por conjunto de arquivos e compartilhada por
+        todas as entidades, de modo que escolher o frame é só uma consulta ao
+        dicionário (sem copy/flip por frame).
+        """
+        load = self.sprite if kind == 'sprite' else self.image
+        blink_options = (False, True) if blink else (False,)
+
+        def build():
+            table = {}
+            for state, path in files.items():
+                for facing_right in (True, False):
+                    for blinking in blink_options:
+                        if facing_right and not blinking:
+                            surface = load(path, size)
+                        else:
+                            surface = load(path, size, variant=(facing_right, blinking),
+                                           builder=lambda base, right=facing_right, b=blinking:
+                                               make_sprite_variant(base, right, b))
+                        table[(state, facing_right, blinking)] = surface
+            return table
+
+        key = ('table', kind, tuple(files.items()), size, blink)
+        return self.get(key, build)
+
+    def sound(self, path, volume=1.0):
+        """Som via load_sound (falhas também ficam em cache como None)"""
+        return self.get(('sound', path, None, volume, None), lambda: load_sound(path, volume))
+
+    def stats(self):
+        """Estatísticas de uso do cache"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'pack_loads': self.pack_loads,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def clear(self):
+        """Descarta todos os assets e zera as estatísticas"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.pack_loads = 0
+
+# Instância única usada por Coin, Enemy, Player e GameManager
+asset_cache = AssetCache()
+
+class MaskCache:
+    """Máscaras de colisão calculadas sob demanda, uma por superfície.
+
+    A chave é a própria superfície (referência fraca): entidades que exibem o
+    mesmo frame compartilhado usam a mesma máscara, e máscaras de superfícies
+    descartadas somem junto com elas. Superfícies alteradas no lugar depois
+    de consultadas não devem ser usadas aqui.
+    """
+
+    def __init__(self):
+        self._masks = weakref.WeakKeyDictionary()
+        self._rect_masks = {}
+        self.hits = 0
+        self.misses = 0
+
+    def mask(self, surface):
+        """Máscara da superfície (pygame.mask.from_surface só na primeira vez)"""
+        mask = self._masks.get(surface)
+        if mask is not None:
+            self.hits += 1
+            return mask
+
+        self.misses += 1
+        mask = self._masks[surface] = pygame.mask.from_surface(surface)
+        return mask
+
+    def rect_mask(self, size):
+        """Máscara cheia de um retângulo (ex.: área de ataque)"""
+        mask = self._rect_masks.get(size)
+        if mask is None:
+            mask = self._rect_masks[size] = pygame.Mask(size, fill=True)
+        return mask
+
+    def stats(self):
+        """Estatísticas de uso do cache"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._masks),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+        }
+
+    def clear(self):
+        """Descarta as máscaras e zera as estatísticas"""
+        self._masks.clear()
+        self._rect_masks.clear()
+        self.hits = 0
+        self.misses = 0
+
+# Instância única usada pelas colisões por pixel
+mask_cache = MaskCache()
+
+class RandomStreams:
+    """Geradores aleatórios independentes, um por subsistema.
+
+    Com semente, cada fluxo (ex.: 'effects', 'platforms', 'level-1') é
+    derivado de (semente, nome): a sequência de um não depende de quantos
+    números os outros já consumiram. Assim efeitos só de desenho (screen
+    shake) não alteram a simulação, e uma partida gravada se repete igual
+    (ver game.replay). Sem semente, os fluxos são aleatórios como antes.
+    """
+
+    def __init__(self, seed=None):
+        self.seed(seed)
+
+    def seed(self, seed=None):
+        """Reinicia todos os fluxos a partir de seed (None: semente do sistema)"""
+        self.base_seed = seed
+        self._streams = {}
+
+    def stream(self, name):
+        """Gerador do subsistema name (criado na primeira consulta)"""
+        generator = self._streams.get(name)
+        if generator is None:
+            if self.base_seed is None:
+                generator = random.Random()
+            else:
+                generator = random.Random(f'{self.base_seed}:{name}')
+            self._streams[name] = generator
+        return generator
+
+# Instância única usada por inimigos, plataformas e efeitos do GameManager
+random_streams = RandomStreams()
+
+def collide_sprites(sprite, group, pixel_perfect=True):
+    """Colisão em duas fases: retângulos primeiro, máscara só nos candidatos.
+
+    Grupos com índice espacial (SpatialGroup) respondem só com os vizinhos.
+    """
+    if hasattr(group, 'collide_rect'):
+        candidates = group.collide_rect(sprite.rect)
+    else:
+        candidates = pygame.sprite.spritecollide(sprite, group, False)
+    if not pixel_perfect or not candidates:
+        return candidates
+
+    mask = mask_cache.mask(sprite.image)
+    return [other for other in candidates
+            if mask.overlap(mask_cache.mask(other.image),
+                            (other.rect.x - sprite.rect.x, other.rect.y - sprite.rect.y))]
+
+def collide_rect(rect, sprites, pixel_perfect=True):
+    """Sprites atingidos por uma área retangular (ex.: ataque), em duas fases"""
+    if hasattr(sprites, 'collide_rect'):
+        candidates = sprites.collide_rect(rect)
+    else:
+        candidates = [sprite for sprite in sprites if rect.colliderect(sprite.rect)]
+    if not pixel_perfect or not candidates:
+        return candidates
+
+    mask = mask_cache.rect_mask(rect.size)
+    return [sprite for sprite in candidates
+            if mask.overlap(mask_cache.mask(sprite.image),
+                            (sprite.rect.x - rect.x, sprite.rect.y - rect.y))]
@@ -0,0 +1,257 @@
+# Mundo em streaming: entidades criadas e liberadas por chunks conforme a câmera
+import pygame
+from collections import Counter
+from game.settings import *
+from game.platform import Platform, MovingPlatform, DisappearingPlatform, BouncePlatform
+from game.coin import Coin, PowerUpCoin, BonusCoin
+from game.enemy import Enemy
+from game.profiling import profiler
+
+# Sprites criados e liberados pelo streaming a cada frame (ver game.profiling)
+SPAWNED = profiler.counter('world.spawned')
+UNLOADED = profiler.counter('world.unloaded')
+
+# Ordem de criação ao carregar chunks: inimigos procuram a plataforma ao nascer
+SPAWN_ORDER = {'platform': 0, 'coin': 1, 'enemy': 2}
+
+def platform_spec(x, y, width, height, platform_type='normal', **options):
+    """Descrição de plataforma (options: end=(x, y) e speed para móvel, disappearing=True)"""
+    return dict(kind='platform', x=x, y=y, width=width, height=height, type=platform_type, **options)
+
+def coin_spec(x, y, coin_type='normal'):
+    """Descrição de moeda ('normal', 'bonus' ou 'special')"""
+    return dict(kind='coin', x=x, y=y, type=coin_type)
+
+def enemy_spec(x, y, **attributes):
+    """Descrição de inimigo (attributes: health, speed, detection_range)"""
+    return dict(kind='enemy', x=x, y=y, **attributes)
+
+def entity_bounds(spec):
+    """Faixa horizontal [esquerda, direita) que a entidade pode ocupar"""
+    x = spec['x']
+    if spec['kind'] == 'platform':
+        right = x + spec['width']
+        if 'end' in spec:
+            # Plataforma móvel cobre todo o percurso
+            x = min(x, spec['end'][0])
+            right = max(right, spec['end'][0] + spec['width'])
+        return x, right
+    if spec['kind'] == 'coin':
+        return x, x + COIN_SIZE
+    return x, x + ENEMY_WIDTH
+
+def chunk_table(entities, chunk_width=WORLD_CHUNK_WIDTH):
+    """Índice {chunk: [ids das entidades que o ocupam]} e borda direita do conteúdo"""
+    chunks = {}
+    right_edge = 0
+    for entity_id, spec in enumerate(entities):
+        left, right = entity_bounds(spec)
+        for index in range(left // chunk_width, (right - 1) // chunk_width + 1):
+            chunks.setdefault(index, []).append(entity_id)
+        right_edge = max(right_edge, right)
+    return chunks, right_edge
+
+def entity_state(sprite):
+    """Estado a guardar quando o sprite é liberado (None: recomeça do zero ao voltar)"""
+    if isinstance(sprite, Enemy):
+        return {'health': sprite.health}
+    if isinstance(sprite, BonusCoin):
+        return {'spawn_timer': sprite.spawn_timer}
+    if isinstance(sprite, MovingPlatform):
+        return {'position': tuple(sprite.position), 'velocity': tuple(sprite.velocity),
+                'direction': sprite.direction, 'pause_timer': sprite.pause_timer,
+                'state': sprite.state}
+    return None
+
+def create_entity(spec, platform_group, state=None, placement=None, random=None):
+    """Instancia o sprite descrito por spec (state: estado salvo de uma descarga anterior,
+    ver entity_state, com 'elapsed' = frames desde a descarga; placement: plataforma e
+    patrulha pré-calculadas de um inimigo, ver Enemy; random: gerador usado pelo inimigo)"""
+    kind = spec['kind']
+    x, y = spec['x'], spec['y']
+
+    if kind == 'platform':
+        width, height, platform_type = spec['width'], spec['height'], spec['type']
+        if 'end' in spec:
+            platform = MovingPlatform(x, y, width, height, (x, y), tuple(spec['end']),
+                                      spec.get('speed', 2), platform_type)
+            if state:
+                # Retoma do ponto do percurso em que foi liberada
+                platform.position.update(state['position'])
+                platform.velocity.update(state['velocity'])
+                platform.direction = state['direction']
+                platform.pause_timer = state['pause_timer']
+                platform.state = state['state']
+                platform.rect.center = (int(platform.position.x), int(platform.position.y))
+            return platform
+        if spec.get('disappearing'):
+            return DisappearingPlatform(x, y, width, height, platform_type=platform_type)
+        if platform_type == 'bounce':
+            return BouncePlatform(x, y, width, height)
+        return Platform(x, y, width, height, platform_type)
+
+    if kind == 'coin':
+        if spec['type'] == 'special':
+            return PowerUpCoin(x, y)
+        if spec['type'] == 'bonus':
+            coin = BonusCoin(x, y)
+            if state:
+                # O tempo de vida continua correndo enquanto o chunk está liberado
+                coin.spawn_timer = state['spawn_timer'] + state.get('elapsed', 0)
+            return coin
+        return Coin(x, y)
+
+    enemy = Enemy(x, y, platform_group, placement, random)
+    for name in ('health', 'speed', 'detection_range'):
+        if name in spec:
+            setattr(enemy, name, spec[name])
+    if state:
+        enemy.health = state['health']
+    return enemy
+
+class WorldStreamer:
+    """Nível dividido em chunks de largura fixa, carregados conforme a câmera.
+
+    As entidades do nível existem como descrições (dicts de platform_spec,
+    coin_spec, enemy_spec); só as dos chunks perto da câmera viram sprites.
+    Um chunk é carregado quando entra em load_distance da área visível e
+    liberado quando sai de unload_distance (a diferença evita carregar e
+    liberar o mesmo chunk repetidamente). Moedas coletadas e inimigos
+    derrotados ficam registrados e não voltam; entidades liberadas guardam o
+    estado de entity_state (vida do inimigo, tempo da moeda bônus, ponto do
+    percurso da plataforma móvel). stream() é chamado uma vez por frame e
+    conta os frames (frame), para o estado saber quanto tempo passou.
+    spawn(spec, state) cria e registra o sprite no jogo; liberar é
+    sprite.kill(). Níveis compilados trazem o índice de chunks pronto
+    (chunks e right_edge, ver chunk_table).
+    """
+
+    def __init__(self, entities, spawn, chunk_width=WORLD_CHUNK_WIDTH,
+                 load_distance=STREAM_LOAD_DISTANCE, unload_distance=STREAM_UNLOAD_DISTANCE,
+                 chunks=None, right_edge=None):
+        self.entities = list(entities)
+        self.spawn = spawn
+        self.chunk_width = chunk_width
+        self.load_distance = load_distance
+        self.unload_distance = max(unload_distance, load_distance)
+
+        # Chunk -> ids das entidades que o ocupam (uma plataforma larga fica em vários)
+        if chunks is None:
+            chunks, right_edge = chunk_table(self.entities, chunk_width)
+        self.chunks = chunks
+
+        # Entidade -> faixa de chunks que ela ocupa
+        spans = {}
+        for index, ids in chunks.items():
+            for entity_id in ids:
+                low, high = spans.get(entity_id, (index, index))
+                spans[entity_id] = (min(low, index), max(high, index))
+        self.entity_chunks = [range(spans[entity_id][0], spans[entity_id][1] + 1) if entity_id in spans else range(0)
+                              for entity_id in range(len(self.entities))]
+
+        # Extensão do mundo: nunca menor que o mundo padrão
+        self.extent = max(WORLD_WIDTH, right_edge)
+
+        # Estado persistente entre cargas
+        self.loaded = set()
+        self.live = {}
+        self.consumed = set()
+        self.saved = {}
+        self.remaining = Counter(spec['kind'] for spec in self.entities)
+        self.frame = 0
+
+        # Estatísticas
+        self.loads = 0
+        self.unloads = 0
+
+    def update(self, viewport):
+        """Carrega/libera chunks para a área visível; retorna as faixas [(esq, dir)] alteradas"""
+        changed = []
+        for _ in self.stream(viewport, changed):
+            pass
+        return changed
+
+    def stream(self, viewport, changed):
+        """Como update, em passos (gerador, um yield por entidade criada); faixas vão para changed"""
+        self.frame += 1
+        self.collect_consumed()
+
+        wanted = self.chunk_range(viewport, self.load_distance)
+        kept = self.chunk_range(viewport, self.unload_distance)
+        to_unload = [index for index in self.loaded if index not in kept]
+        to_load = [index for index in wanted if index not in self.loaded and index in self.chunks]
+
+        if to_unload:
+            self.unload(to_unload)
+            changed.extend(self.chunk_span(index) for index in to_unload)
+        if to_load:
+            yield from self.load_steps(to_load)
+            changed.extend(self.chunk_span(index) for index in to_load)
+
+    def chunk_range(self, viewport, distance):
+        first = max(0, (viewport.left - distance) // self.chunk_width)
+        last = min(self.extent - 1, viewport.right + distance - 1) // self.chunk_width
+        return range(first, last + 1)
+
+    def chunk_span(self, index):
+        return index * self.chunk_width, (index + 1) * self.chunk_width
+
+    def load(self, indices):
+        """Cria os sprites das entidades dos chunks que ainda não existem"""
+        for _ in self.load_steps(indices):
+            pass
+
+    def load_steps(self, indices):
+        """Como load, com um yield depois de cada entidade criada"""
+        self.loaded.update(indices)
+        self.loads += len(indices)
+        ids = {entity_id for index in indices for entity_id in self.chunks[index]
+               if entity_id not in self.live and entity_id not in self.consumed}
+        for entity_id in sorted(ids, key=lambda entity_id: (SPAWN_ORDER[self.entities[entity_id]['kind']], entity_id)):
+            state = self.saved.get(entity_id)
+            if state is not None:
+                state = dict(state, elapsed=self.frame - state['frame'])
+            self.live[entity_id] = self.spawn(self.entities[entity_id], state)
+            SPAWNED.add()
+            yield
+
+    def unload(self, indices):
+        """Libera as entidades que não ocupam mais nenhum chunk carregado"""
+        self.loaded.difference_update(indices)
+        for index in indices:
+            for entity_id in self.chunks.get(index, ()):
+                sprite = self.live.get(entity_id)
+                if sprite is None or any(other in self.loaded for other in self.entity_chunks[entity_id]):
+                    continue
+                del self.live[entity_id]
+                state = entity_state(sprite)
+                if state is not None:
+                    self.saved[entity_id] = dict(state, frame=self.frame)
+                sprite.kill()
+                UNLOADED.add()
+        self.unloads += len(indices)
+
+    def collect_consumed(self):
+        """Registra entidades carregadas que saíram do jogo.
+
+        Só as marcadas com consumed (moeda coletada ou expirada, inimigo
+        derrotado) deixam de existir no nível; as removidas por outro caminho
+        só deixam de estar vivas e voltam quando o chunk for carregado de novo.
+        """
+        gone = [(entity_id, sprite) for entity_id, sprite in self.live.items() if not sprite.alive()]
+        for entity_id, sprite in gone:
+            del self.live[entity_id]
+            if getattr(sprite, 'consumed', False):
+                self.consumed.add(entity_id)
+                self.remaining[self.entities[entity_id]['kind']] -= 1
+
+    def stats(self):
+        """Chunks carregados, sprites vivos e entidades consumidas"""
+        return {
+            'chunks': len(self.chunks),
+            'loaded_chunks': len(self.loaded),
+            'live': len(self.live),
+            'consumed': len(self.consumed),
+            'loads': self.loads,
+            'unloads': self.unloads,
+        }
@@ -8,6 +8,9 @@ Controles:
 - Espaço: Pular
 - X: Atacar
 - ESC: Pausar
+- F3: Overlay de desempenho
+- F4: Captura de perfil (cProfile + tracemalloc)
+- F5: Liga a instrumentação / exporta o trace
 - Enter: Selecionar no menu
 
 Recursos:
@@ -25,21 +28,54 @@ Recursos:
 import pygame
 import sys
 import os
+import random
+import argparse
 
 # Adiciona o diretório do jogo ao path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from game.game_manager import GameManager
+from game.controls import KeyboardControls
+from game.replay import InputRecorder, write_recording
+from game.profiling import profiler
 
 def main():
     """Função principal do jogo"""
+    # python main.py --record partida.rec [--seed N]: grava a partida para reproduzir
+    # depois com python -m game.headless --replay partida.rec
+    parser = argparse.ArgumentParser(description='Super Hero - Jogo de Plataforma')
+    parser.add_argument('--record', metavar='ARQUIVO', help='grava a entrada da partida')
+    parser.add_argument('--seed', type=int, help='semente dos fluxos aleatórios')
+    parser.add_argument('--perf-log', metavar='ARQUIVO', help='grava o tempo de cada etapa do frame (CSV)')
+    parser.add_argument('--profile', action='store_true',
+                        help='liga a instrumentação (trace exportado com F5 e ao sair)')
+    parser.add_argument('--profile-capture-after', type=int, metavar='N',
+                        help='abre a janela de cProfile/tracemalloc no frame N')
+    args = parser.parse_args()
+    
     try:
         # Inicializa o gerenciador do jogo
-        game = GameManager()
+        if args.record:
+            seed = args.seed if args.seed is not None else random.randrange(2 ** 31)
+            recorder = InputRecorder(KeyboardControls())
+            game = GameManager(controls=recorder, seed=seed)
+        else:
+            game = GameManager(seed=args.seed)
+        
+        if args.perf_log:
+            game.frame_timer.start_stream(args.perf_log)
+        if args.profile:
+            game.enable_profiling()
+        if args.profile_capture_after:
+            profiler.capture_at = args.profile_capture_after
         
         # Executa o loop principal
         game.run()
         
+        if args.record:
+            write_recording(args.record, recorder.recording(seed))
+            print(f"📼 Partida gravada em {args.record} ({len(recorder.ticks)} atualizações, semente {seed})")
+        
     except KeyboardInterrupt:
         print("\nJogo interrompido pelo usuário.")
     except Exception as e:
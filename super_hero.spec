@@ -26,6 +26,9 @@ a = Analysis(
         'pygame.draw',
         'game.settings',
         'game.utils',
+        'game.asset_pack',
+        'game.level_format',
+        'game.level_compiler',
         'game.player',
         'game.enemy',
         'game.coin',
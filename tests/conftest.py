@@ -0,0 +1,23 @@
+# Configuração dos testes: drivers SDL "dummy" (sem janela nem som) e diretório do jogo
+#
+# Uso:  python -m pytest
+import os
+import sys
+import pytest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Os assets são lidos por caminhos relativos à raiz do projeto
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pygame
+
+@pytest.fixture
+def display():
+    """Tela mínima para sprites que convertem superfícies (convert/convert_alpha)"""
+    pygame.display.init()
+    return pygame.display.set_mode((1, 1))
@@ -0,0 +1,71 @@
+# Lote NumPy de inimigos: linhas e plataformas acompanham o grupo ao entrar e sair
+import random
+import pygame
+import pytest
+from game.enemy_batch import EnemyBatch, NUMPY_AVAILABLE, INT_FIELDS, FLOAT_FIELDS, BOOL_FIELDS
+from game.enemy import Enemy
+from game.platform import Platform
+from game.spatial import SpatialGroup
+
+pytestmark = pytest.mark.skipif(not NUMPY_AVAILABLE, reason='NumPy não instalado')
+
+class FarPlayer:
+    rect = pygame.Rect(100000, 0, 40, 60)
+
+def spawn(batch, platforms, x):
+    """Plataforma e inimigo em cima dela, como no streaming"""
+    platform = Platform(x, 400, 200, 20)
+    platforms.add(platform)
+    enemy = Enemy(x + 50, 400 - 60, platforms, random=random.Random(x))
+    batch.add(enemy)
+    return platform, enemy
+
+def assert_consistent(batch):
+    batch.flush()
+    for name in INT_FIELDS + FLOAT_FIELDS + BOOL_FIELDS:
+        assert len(getattr(batch, name)) == len(batch)
+    assert batch.alive.all()
+    assert [enemy.batch_index for enemy in batch.enemies] == list(range(len(batch)))
+    assert set(batch.enemies) == set(batch.sprites())
+    assert batch.platform_bounds.shape[1] == len(batch.platforms)
+    used = {batch.platforms[slot] for slot in batch.platform if slot >= 0}
+    assert used == set(batch.platforms)
+
+def test_rows_follow_group_across_stream_cycles(display):
+    platforms = SpatialGroup()
+    batch = EnemyBatch(platforms)
+    spawned = [spawn(batch, platforms, x) for x in range(0, 2000, 250)]
+    batch.step(FarPlayer())
+    assert_consistent(batch)
+
+    # Sai e volta metade dos inimigos, como chunks liberados e recarregados
+    for cycle in range(5):
+        for platform, enemy in spawned[::2]:
+            enemy.kill()
+            platform.kill()
+        batch.step(FarPlayer())
+        assert_consistent(batch)
+        assert len(batch) == len(spawned) // 2
+
+        spawned[::2] = [spawn(batch, platforms, x) for x in range(0, 2000, 500)]
+        batch.step(FarPlayer())
+        assert_consistent(batch)
+        assert len(batch) == len(spawned)
+        assert len(batch.platforms) == len(spawned)
+
+def test_removed_enemy_keeps_final_state(display):
+    platforms = SpatialGroup()
+    batch = EnemyBatch(platforms)
+    _, enemy = spawn(batch, platforms, 0)
+    _, other = spawn(batch, platforms, 500)
+    for _ in range(30):
+        batch.step(FarPlayer())
+    x = int(batch.x[enemy.batch_index])
+
+    enemy.kill()
+    assert enemy.rect.x == x  # Sincronizado ao sair do lote
+    batch.flush()
+    assert batch.enemies == [other] and other.batch_index == 0
+
+    other.kill()
+    assert len(batch.x) == 0 and not batch.platforms
@@ -0,0 +1,64 @@
+# Formato de nível: ida e volta .lvl/.json, com e sem índice de chunks
+import pytest
+from game.level_format import (LevelData, write_level, read_level, write_level_json, read_level_json,
+                               level_count, LEVEL_MAGIC)
+from game.world_streaming import platform_spec, coin_spec, enemy_spec
+from game.benchmark import synthetic_level
+
+def editing_level():
+    """Nível de edição (sem compilar) com todos os tipos de entidade e atributos opcionais"""
+    entities = [
+        platform_spec(0, 650, 400, 70, 'grass'),
+        platform_spec(500, 500, 120, 20, 'ice', end=(700, 500), speed=3),
+        platform_spec(900, 450, 100, 20, 'cloud', disappearing=True),
+        platform_spec(1100, 400, 100, 20, 'bounce'),
+        coin_spec(50, 600),
+        coin_spec(550, 450, 'bonus'),
+        coin_spec(950, 400, 'special'),
+        enemy_spec(100, 590),
+        enemy_spec(1120, 340, health=3, speed=1.5, detection_range=300),
+    ]
+    return LevelData('Teste', (100, 520), 1200, entities)
+
+def assert_same_level(loaded, level):
+    assert loaded.name == level.name
+    assert loaded.spawn == level.spawn
+    assert loaded.end_x == level.end_x
+    assert loaded.entities == level.entities
+    assert loaded.chunk_width == level.chunk_width
+    assert loaded.chunks == level.chunks
+    assert loaded.right_edge == level.right_edge
+
+@pytest.mark.parametrize('write, read, suffix', [(write_level, read_level, '.lvl'),
+                                                 (write_level_json, read_level_json, '.json')])
+@pytest.mark.parametrize('make_level', [editing_level, lambda: synthetic_level(50, seed=3)],
+                         ids=['edicao', 'compilado'])
+def test_round_trip(tmp_path, write, read, suffix, make_level):
+    level = make_level()
+    path = str(tmp_path / f'level_1{suffix}')
+    write(path, level)
+    assert_same_level(read(path), level)
+
+def test_binary_and_json_agree(tmp_path):
+    level = synthetic_level(20, seed=1)
+    write_level(str(tmp_path / 'level_1.lvl'), level)
+    write_level_json(str(tmp_path / 'level_1.json'), level)
+    assert_same_level(read_level(str(tmp_path / 'level_1.lvl')), read_level_json(str(tmp_path / 'level_1.json')))
+
+def test_rejects_other_file(tmp_path):
+    path = tmp_path / 'level_1.lvl'
+    write_level(str(path), editing_level())
+    data = path.read_bytes()
+    assert data.startswith(LEVEL_MAGIC)
+    path.write_bytes(b'XXXX' + data[4:])
+    with pytest.raises(ValueError):
+        read_level(str(path))
+
+def test_level_count_requires_contiguous_numbers(tmp_path):
+    for number in (1, 2):
+        write_level_json(str(tmp_path / f'level_{number}.json'), editing_level())
+    assert level_count(str(tmp_path)) == 2
+
+    write_level_json(str(tmp_path / 'level_4.json'), editing_level())
+    with pytest.raises(ValueError):
+        level_count(str(tmp_path))
@@ -0,0 +1,35 @@
+# FrameTimer: percentis e resumo da janela de amostras
+from game.perf_overlay import FrameTimer, STAGES
+
+def test_percentiles_of_window():
+    timer = FrameTimer(window=100)
+    assert timer.percentiles() == {'p50': 0.0, 'p95': 0.0, 'p99': 0.0}
+
+    # Janela guarda só as últimas 100 amostras: 1..100 ms
+    for total in range(-20, 101):
+        timer.samples.append({'frame': total, 'total_ms': float(total)})
+    assert timer.percentiles() == {'p50': 51.0, 'p95': 96.0, 'p99': 100.0}
+
+def test_disabled_timer_records_nothing():
+    timer = FrameTimer()
+    timer.begin_frame()
+    timer.lap('events')
+    timer.end_frame()
+    assert not timer.samples and timer.summary() == {}
+
+def test_frame_is_split_between_stages():
+    timer = FrameTimer()
+    timer.enable()
+    laps = []
+    timer.hooks.append(lambda stage, start, end: laps.append(stage))
+    for _ in range(3):
+        timer.begin_frame()
+        for stage in STAGES:
+            timer.lap(stage)
+        timer.end_frame(lambda: {'sprites_live': 7})
+
+    assert laps == list(STAGES) * 3
+    summary = timer.summary()
+    assert summary['sprites_live'] == 7
+    assert summary['cache_misses'] == 0
+    assert abs(sum(summary[stage] for stage in STAGES) - summary['total_ms']) < 1e-6
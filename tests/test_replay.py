@@ -0,0 +1,65 @@
+# Gravação e reprodução: formato run-length e determinismo nos dois backends de inimigos
+import pygame
+import pytest
+import game.game_manager
+from game.enemy_batch import NUMPY_AVAILABLE
+from game.headless import PatternControls, run_input, soak
+from game.replay import (InputRecorder, InputReplay, Recording, MAX_RUN, encode_keys, decode_keys,
+                         write_recording, read_recording, state_digest, INPUT_KEYS)
+
+BACKENDS = ['objects', pytest.param('numpy', marks=pytest.mark.skipif(not NUMPY_AVAILABLE,
+                                                                      reason='NumPy não instalado'))]
+FRAMES = 600
+
+def test_keys_round_trip():
+    for mask in range(1 << len(INPUT_KEYS)):
+        assert encode_keys(decode_keys(mask)) == mask
+
+def test_recording_round_trip(tmp_path):
+    # Execuções mais longas que MAX_RUN são divididas; alternâncias viram execuções de 1
+    ticks = [0] * (MAX_RUN + 10) + [1, 2, 1, 2] + [0b10010000] * 300 + [0]
+    path = str(tmp_path / 'partida.rec')
+    write_recording(path, Recording(42, 2, ticks))
+
+    recording = read_recording(path)
+    assert (recording.seed, recording.level, recording.ticks) == (42, 2, ticks)
+
+def test_rejects_corrupt_recording(tmp_path):
+    path = tmp_path / 'partida.rec'
+    write_recording(str(path), Recording(1, 1, [0, 1, 1, 2]))
+    data = path.read_bytes()
+
+    path.write_bytes(data[:-4])  # Falta a última execução
+    with pytest.raises(ValueError):
+        read_recording(str(path))
+    path.write_bytes(b'NOPE' + data[4:])
+    with pytest.raises(ValueError):
+        read_recording(str(path))
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_replay_reproduces_recorded_run(monkeypatch, backend):
+    monkeypatch.setattr(game.game_manager, 'ENEMY_BACKEND', backend)
+    recorder = InputRecorder(PatternControls(run_input))
+    recorded = soak(FRAMES, controls=recorder, seed=11)
+
+    replayed = soak(FRAMES, controls=InputReplay(recorder.recording(11).ticks), seed=11)
+    assert replayed['frames'] == recorded['frames']
+    assert replayed['digest'] == recorded['digest']
+
+def simulate(backend, monkeypatch, frames=FRAMES, seed=5):
+    """Resumo do estado após frames atualizações sem LOD (todos os inimigos simulados)"""
+    monkeypatch.setattr(game.game_manager, 'ENEMY_BACKEND', backend)
+    manager = game.game_manager.GameManager(headless=True, controls=PatternControls(run_input), seed=seed)
+    manager.lod.enabled = False
+    manager.start_game(1)
+    for _ in range(frames):
+        if manager.game_state != game.game_manager.GAME_PLAYING:
+            manager.start_game(1)
+        manager.update()
+    digest = state_digest(manager)
+    pygame.quit()
+    return digest
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason='NumPy não instalado')
+def test_backends_agree(monkeypatch):
+    assert simulate('numpy', monkeypatch) == simulate('objects', monkeypatch)
@@ -0,0 +1,90 @@
+# Índice espacial: consultas do SpatialGrid comparadas com a busca exaustiva
+import random
+import pygame
+import pytest
+from game.spatial import SpatialGrid, SpatialGroup
+
+class Box:
+    """Objeto mínimo indexável (só rect)"""
+
+    def __init__(self, x, y, width, height):
+        self.rect = pygame.Rect(x, y, width, height)
+
+    def __repr__(self):
+        return f'Box{tuple(self.rect)}'
+
+@pytest.fixture
+def boxes():
+    generator = random.Random(7)
+    return [Box(generator.randint(-500, 3000), generator.randint(-200, 900),
+                generator.randint(1, 400), generator.randint(1, 120)) for _ in range(300)]
+
+@pytest.fixture
+def grid(boxes):
+    grid = SpatialGrid(cell_size=64)
+    for box in boxes:
+        grid.insert(box)
+    return grid
+
+def test_query_rect_matches_brute_force(grid, boxes):
+    generator = random.Random(1)
+    for _ in range(100):
+        area = pygame.Rect(generator.randint(-600, 3000), generator.randint(-300, 900),
+                           generator.randint(1, 800), generator.randint(1, 600))
+        # Mesma ordem de um pygame.sprite.Group: a de inserção
+        assert grid.query_rect(area) == [box for box in boxes if area.colliderect(box.rect)]
+
+def test_query_point_radius_column_and_span(grid, boxes):
+    generator = random.Random(2)
+    for _ in range(100):
+        x, y = generator.randint(-500, 3000), generator.randint(-200, 900)
+        assert grid.query_point(x, y) == [box for box in boxes if box.rect.collidepoint(x, y)]
+
+        radius = generator.randint(1, 300)
+        expected = []
+        for box in boxes:
+            distance_sq = (box.rect.centerx - x) ** 2 + (box.rect.centery - y) ** 2
+            if distance_sq <= radius * radius:
+                expected.append((box, distance_sq))
+        assert grid.query_radius((x, y), radius) == expected
+
+        assert grid.query_column(x) == [box for box in boxes if box.rect.left <= x <= box.rect.right]
+
+        right = x + generator.randint(1, 500)
+        assert grid.query_span(x, right) == [box for box in boxes
+                                             if box.rect.right > x and box.rect.left < right]
+
+def test_update_and_remove(grid, boxes):
+    moved, removed = boxes[0], boxes[1]
+    moved.rect.topleft = (5000, 5000)
+    assert grid.update(moved)
+    assert not grid.update(moved)  # Mesmas células: nada a fazer
+    assert grid.query_point(5001, 5001) == [moved]
+
+    grid.remove(removed)
+    assert removed not in grid
+    assert len(grid) == len(boxes) - 1
+    assert removed not in grid.query_rect(removed.rect)
+
+    # A ordem de inserção se mantém depois de mover
+    area = pygame.Rect(-1000, -1000, 7000, 7000)
+    assert grid.query_rect(area) == [box for box in boxes if box is not removed]
+
+def test_group_reindexes_moving_sprites():
+    class Mover(pygame.sprite.Sprite):
+        moves = True
+
+        def __init__(self, x):
+            super().__init__()
+            self.rect = pygame.Rect(x, 0, 10, 10)
+
+        def update(self):
+            self.rect.x += 200
+
+    still = pygame.sprite.Sprite()
+    still.rect = pygame.Rect(0, 0, 10, 10)
+    mover = Mover(0)
+    group = SpatialGroup(still, mover)
+    group.update()
+    assert group.collide_point(205, 5) == [mover]
+    assert group.collide_point(5, 5) == [still]